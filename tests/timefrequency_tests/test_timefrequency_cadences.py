@@ -0,0 +1,135 @@
+import pytest
+
+import tooltime
+
+np = pytest.importorskip('numpy')
+
+
+# order: [timestamps, tolerance, expected {label: count}, n_zero, n_unmatched]
+cadence_tests = [
+    [[0, 60, 120, 180], 0.1, {'1m': 3}, 0, 0],
+    [[0, 60, 120, 3720, 7320], 0.1, {'1h': 2, '1m': 2}, 0, 0],
+    [[0, 57, 120, 160], 0.1, {'1m': 2}, 0, 1],
+    [[0, 57, 120, 160], 0.01, {}, 0, 3],
+    [[0, 0, 86400, 172800], 0.1, {'1d': 2}, 1, 0],
+    [[300, 0, 600], 0.1, {'5m': 1, '10m': 1}, 0, 0],
+    [[0, 0.1, 0.2, 0.3, 0.8], 0.1, {0.1: 3, 0.5: 1}, 0, 0],
+    [[0, 0.001, 0.002, 0.012, 0.05], 0.1, {0.001: 2, 0.01: 1}, 0, 1],
+]
+
+
+@pytest.mark.parametrize('test', cadence_tests)
+def test_detect_cadences(test):
+    timestamps, tolerance, expected, n_zero, n_unmatched = test
+    result = tooltime.detect_cadences(timestamps, tolerance=tolerance)
+    counts = {
+        cadence['label'] or cadence['seconds']: cadence['count']
+        for cadence in result['cadences']
+    }
+    assert counts == expected
+    assert result['n_zero'] == n_zero
+    assert result['n_unmatched'] == n_unmatched
+    assert result['n_dts'] == len(timestamps) - 1
+
+
+def test_detect_cadences_mixed():
+    rng = np.random.default_rng(0)
+    seconds = np.arange(0, 3600, 1)
+    minutes = 3600 + np.arange(0, 86400, 60)
+    noise = minutes[-1] + np.cumsum(rng.integers(1000, 1500, size=20))
+    timestamps = np.concatenate([seconds, minutes, noise])
+    result = tooltime.detect_cadences(timestamps, min_share=0.01)
+    assert [cadence['label'] for cadence in result['cadences']] == ['1s', '1m']
+    shares = [cadence['share'] for cadence in result['cadences']]
+    assert shares == sorted(shares, reverse=True)
+    assert result['cadences'][0]['count'] == 3600
+    assert result['cadences'][0]['seconds'] == 1
+
+    # the noise has shares below min_share
+    result = tooltime.detect_cadences(timestamps, min_share=0)
+    assert len(result['cadences']) > 2
+
+
+def test_detect_cadences_sampled():
+    timestamps = np.concatenate(
+        [np.arange(0, 60000, 60), 60000 + np.arange(0, 3600 * 3000, 3600)]
+    )
+    exact = tooltime.detect_cadences(timestamps)
+    sampled = tooltime.detect_cadences(
+        timestamps, sample_size=400, sample_method='random', random_seed=0
+    )
+    assert sampled['n_dts'] == 400
+    assert [c['label'] for c in sampled['cadences']] == ['1h', '1m']
+    for exact_cadence, sampled_cadence in zip(
+        exact['cadences'], sampled['cadences']
+    ):
+        assert abs(exact_cadence['share'] - sampled_cadence['share']) < 0.1
+
+
+def test_get_nice_cadences():
+    cadences = tooltime.get_nice_cadences()
+    assert cadences['1m'] == 60
+    assert cadences['6h'] == 21600
+    assert list(cadences.values()) == sorted(cadences.values())
+
+
+def test_detect_cadence_changes():
+    seconds = np.arange(0, 1000, 1)
+    minutes = 1000 + np.arange(0, 3000, 60)
+    hours = minutes[-1] + 60 + np.arange(0, 3600 * 500, 3600)
+    timestamps = np.concatenate([seconds, minutes, hours])
+
+    # short gaps should not start new segments
+    timestamps = np.delete(timestamps, [300, 301, 302])
+
+    segments = tooltime.detect_cadence_changes(timestamps)
+    assert [segment['label'] for segment in segments] == ['1s', '1m', '1h']
+    assert [segment['start'] for segment in segments] == [0, 1000, 4000]
+    assert segments[-1]['end'] == timestamps[-1]
+    for before, after in zip(segments[:-1], segments[1:]):
+        assert before['end'] == after['start']
+    assert sum(segment['n_dts'] for segment in segments) == len(timestamps) - 1
+
+
+def test_detect_cadence_changes_jitter():
+    rng = np.random.default_rng(0)
+    timestamps = np.cumsum(60 + rng.normal(0, 3, size=10000))
+    segments = tooltime.detect_cadence_changes(timestamps)
+    assert len(segments) == 1
+    assert abs(segments[0]['median_dt'] - 60) < 1
+
+
+def test_detect_cadence_changes_mixed():
+    rng = np.random.default_rng(0)
+    dts = rng.choice([1.0, 0.1], size=5000)
+    timestamps = np.concatenate([[0], np.cumsum(dts)])
+    segments = tooltime.detect_cadence_changes(timestamps)
+    assert len(segments) == 1
+
+
+def test_detect_cadence_changes_min_segment():
+    seconds = np.arange(0, 1000, 1.0)
+    burst = 1000 + np.arange(0, 4, 0.1)
+    timestamps = np.concatenate([seconds, burst, 1004 + seconds])
+    segments = tooltime.detect_cadence_changes(timestamps)
+    assert [segment['n_dts'] for segment in segments] == [1000, 40, 999]
+    segments = tooltime.detect_cadence_changes(timestamps, min_segment=50)
+    assert len(segments) == 1
+
+
+def test_detect_cadence_changes_subsecond():
+    seconds = np.arange(0, 1000, 1.0)
+    subseconds = 1000 + np.arange(0, 1000, 0.1)
+    timestamps = np.concatenate([seconds, subseconds])
+    segments = tooltime.detect_cadence_changes(timestamps)
+    assert [segment['label'] for segment in segments] == ['1s', None]
+    assert abs(segments[1]['median_dt'] - 0.1) < 1e-6
+
+
+@pytest.mark.parametrize('timestamps', [[], [5], [0, 60], [0, 60, 120]])
+def test_detect_cadence_changes_short(timestamps):
+    segments = tooltime.detect_cadence_changes(timestamps)
+    assert len(segments) == min(1, max(len(timestamps) - 1, 0))
+    if len(timestamps) > 1:
+        assert segments[0]['start'] == timestamps[0]
+        assert segments[0]['end'] == timestamps[-1]
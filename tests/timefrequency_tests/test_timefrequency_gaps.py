@@ -0,0 +1,36 @@
+import pytest
+
+import tooltime
+
+np = pytest.importorskip('numpy')
+
+
+# order: [timestamps, cadence, starts, ends, n_missing]
+gap_tests = [
+    [[0, 60, 120, 300, 360, 600], None, [120, 360], [300, 600], [2, 3]],
+    [[0, 60, 120, 300, 360, 600], '1m', [120, 360], [300, 600], [2, 3]],
+    [[0, 60, 120, 300, 360, 600], '2m', [360], [600], [1]],
+    [[0, 60, 120, 180], None, [], [], []],
+    [[600, 0, 60, 120, 300, 360], None, [120, 360], [300, 600], [2, 3]],
+    [[0, 1, 2, 4, 5, 6], 1, [2], [4], [1]],
+]
+
+
+@pytest.mark.parametrize('test', gap_tests)
+def test_detect_gaps(test):
+    timestamps, cadence, starts, ends, n_missing = test
+    gaps = tooltime.detect_gaps(timestamps, cadence=cadence)
+    assert gaps['start'].tolist() == starts
+    assert gaps['end'].tolist() == ends
+    assert gaps['n_missing'].tolist() == n_missing
+
+
+def test_detect_gaps_matches_n_missing():
+    rng = np.random.default_rng(0)
+    timestamps = np.arange(1600000000, 1600000000 + 86400 * 30, 60)
+    timestamps = timestamps[rng.random(len(timestamps)) > 0.1]
+    gaps = tooltime.detect_gaps(timestamps)
+    assert gaps['cadence'] == 60
+    summary = tooltime.summarize_timestamps(timestamps, stats_only=True)
+    assert gaps['n_missing'].sum() == summary['n_missing']
+    assert ((gaps['end'] - gaps['start']) > 60).all()
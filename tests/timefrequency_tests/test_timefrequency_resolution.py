@@ -0,0 +1,135 @@
+import pytest
+
+import tooltime
+
+np = pytest.importorskip('numpy')
+
+
+def get_timestamps():
+    rng = np.random.default_rng(0)
+    dts = rng.choice([60, 60, 60, 60, 120, 30], size=100000)
+    return 1600000000 + np.cumsum(dts)
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {},
+        {'sample_size': 10000},
+        {'sample_size': 10000, 'sample_method': 'random', 'random_seed': 0},
+    ],
+)
+def test_detect_resolution_approximate(kwargs):
+    timestamps = get_timestamps()
+    exact = tooltime.detect_resolution(timestamps)
+    approximate = tooltime.detect_resolution(
+        timestamps, approximate=True, **kwargs
+    )
+    assert exact is not None and approximate is not None
+    assert approximate['label'] == exact['label'] == '1m'
+    assert approximate['median_dt'] == exact['median_dt']
+    assert approximate['dts'] is None
+    assert approximate['quantiles'] == {0.01: 30, 0.5: 60, 0.99: 120}
+    for key in ['n_small', 'n_large']:
+        target = exact['outliers'][key]
+        assert abs(approximate['outliers'][key] - target) < 0.05 * target
+
+
+def test_detect_resolution_approximate_irregular():
+    rng = np.random.default_rng(0)
+    timestamps = np.cumsum(rng.exponential(3600, size=100000))
+    dts = np.diff(timestamps)
+    approximate = tooltime.detect_resolution(
+        timestamps, approximate=True, quantiles=[0.1, 0.9]
+    )
+    assert approximate is not None
+    for q, estimate in approximate['quantiles'].items():
+        target = np.quantile(dts, q, method='lower')
+        assert abs(estimate / target - 1) <= 0.01
+
+
+def test_detect_resolution_dispersion():
+    timestamps = get_timestamps()
+    dts = np.diff(timestamps)
+    resolution = tooltime.detect_resolution(timestamps)
+    assert resolution is not None
+    dispersion = resolution['dispersion']
+    q1, q3 = np.quantile(dts, [0.25, 0.75])
+    assert dispersion['q1'] == q1
+    assert dispersion['q3'] == q3
+    assert dispersion['iqr'] == q3 - q1
+    assert dispersion['mad'] == np.median(np.abs(dts - np.median(dts)))
+
+
+@pytest.mark.parametrize(
+    'test',
+    [
+        ['rtol', None, 40, 90],
+        ['rtol', 1.0, 30, 120],
+        ['iqr', None, 60 - 1.5 * 30, 90 + 1.5 * 30],
+        ['iqr', 0, 60, 90],
+        ['mad', None, 60 - 3 * (1.4826 * 30), 60 + 3 * (1.4826 * 30)],
+    ],
+)
+def test_detect_resolution_outlier_methods(test):
+    method, threshold, lower, upper = test
+    rng = np.random.default_rng(0)
+    dts = rng.choice([60, 60, 60, 90, 30, 3600], size=10000)
+    timestamps = np.concatenate([[0], np.cumsum(dts)])
+    resolution = tooltime.detect_resolution(
+        timestamps, outlier_method=method, outlier_threshold=threshold
+    )
+    assert resolution is not None
+    outliers = resolution['outliers']
+    assert outliers['method'] == method
+    assert outliers['lower'] == lower
+    assert outliers['upper'] == upper
+    assert (
+        outliers['small_indices'].tolist()
+        == np.flatnonzero(dts < lower).tolist()
+    )
+    assert (
+        outliers['large_indices'].tolist()
+        == np.flatnonzero(dts > upper).tolist()
+    )
+    assert (
+        outliers['large_timestamps'] == timestamps[outliers['large_indices']]
+    ).all()
+    assert (outliers['large'] == dts[outliers['large_indices']]).all()
+
+    lean = tooltime.detect_resolution(
+        timestamps,
+        outlier_method=method,
+        outlier_threshold=threshold,
+        stats_only=True,
+    )
+    assert lean is not None
+    assert lean['outliers']['large_indices'] is None
+    assert lean['outliers']['n_large'] == len(outliers['large_indices'])
+
+    approximate = tooltime.detect_resolution(
+        timestamps,
+        outlier_method=method,
+        outlier_threshold=threshold,
+        approximate=True,
+    )
+    assert approximate is not None
+    assert approximate['outliers']['lower'] == lower
+    assert approximate['outliers']['upper'] == upper
+    assert approximate['outliers']['n_large'] == outliers['n_large']
+
+
+@pytest.mark.parametrize('method', ['mad', 'iqr'])
+def test_detect_resolution_outlier_methods_regular(method):
+    # mostly identical dts have mad and iqr of 0, jitter is not an outlier
+    rng = np.random.default_rng(0)
+    dts = rng.choice([60, 60, 60, 60, 60, 60, 60, 60, 59.5, 60.5], size=10000)
+    dts = dts + rng.uniform(-1e-6, 1e-6, size=len(dts))
+    dts[[100, 200]] = [30, 3600]
+    timestamps = np.concatenate([[1600000000], 1600000000 + np.cumsum(dts)])
+    resolution = tooltime.detect_resolution(timestamps, outlier_method=method)
+    assert resolution is not None
+    assert resolution['dispersion']['mad'] < 1e-5
+    outliers = resolution['outliers']
+    assert outliers['small_indices'].tolist() == [100]
+    assert outliers['large_indices'].tolist() == [200]
@@ -0,0 +1,52 @@
+import pytest
+
+import tooltime
+
+np = pytest.importorskip('numpy')
+
+
+def get_values():
+    rng = np.random.default_rng(0)
+    return [
+        rng.exponential(60, size=10000),
+        rng.normal(0, 100, size=10000),
+        rng.lognormal(0, 5, size=10000),
+        np.concatenate([np.zeros(100), rng.exponential(1, size=900)]),
+    ]
+
+
+@pytest.mark.parametrize('values', get_values())
+@pytest.mark.parametrize('relative_accuracy', [0.01, 0.001])
+def test_quantile_sketch_accuracy(values, relative_accuracy):
+    sketch = tooltime.QuantileSketch(relative_accuracy)
+    sketch.update(values)
+    assert len(sketch) == len(values)
+    for q in [0, 0.01, 0.25, 0.5, 0.9, 0.99, 1]:
+        target = np.quantile(values, q, method='lower')
+        estimate = sketch.quantile(q)
+        assert abs(estimate - target) <= relative_accuracy * abs(target)
+
+
+@pytest.mark.parametrize('values', get_values())
+def test_quantile_sketch_merge(values):
+    whole = tooltime.QuantileSketch().update(values)
+    merged = tooltime.QuantileSketch()
+    for chunk in np.array_split(values, 5):
+        merged.merge(tooltime.QuantileSketch().update(chunk))
+    for q in [0.01, 0.5, 0.99]:
+        assert merged.quantile(q) == whole.quantile(q)
+    negated = tooltime.QuantileSketch().update(-values)
+    assert negated.negated().median() == whole.median()
+
+
+def test_quantile_sketch_exact_buckets():
+    values = np.array([30, 60, 60, 60, 60, 120, 3600])
+    sketch = tooltime.QuantileSketch().update(values)
+    assert sketch.median() == 60
+    assert sketch.quantile(0) == 30
+    assert sketch.quantile(1) == 3600
+    assert sketch.count_below(40) == 1
+    assert sketch.count_above(90) == 2
+    counted = tooltime.QuantileSketch().update([30, 60, 120], [1, 4, 2])
+    assert counted.median() == 60
+    assert len(counted) == 7
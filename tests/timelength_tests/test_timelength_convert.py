@@ -16,3 +16,41 @@ def test_convert_timelengths(timelength_conversions):
                 to_representation=to_representation,
             )
             assert converted_timelength == to_timelength
+
+
+@pytest.mark.parametrize(
+    'timelength_conversions',
+    tooltime.spec.equivalent_sets['Timelength'],
+)
+def test_compile_timelength_converter(timelength_conversions):
+    for from_representation, from_timelength in timelength_conversions.items():
+        for to_representation, to_timelength in timelength_conversions.items():
+            for representation in [from_representation, None]:
+                converter = tooltime.compile_timelength_converter(
+                    to_representation, representation
+                )
+                assert converter(from_timelength) == to_timelength
+
+
+def test_convert_timelength_respects_from_representation():
+    # '1:00:00' is converted as a clock phrase without detection
+    seconds = tooltime.convert_timelength(
+        '1:00:00', 'TimelengthSeconds', 'TimelengthClockPhrase'
+    )
+    assert seconds == 3600
+    with pytest.raises(ValueError, match='could not convert'):
+        tooltime.convert_timelength(
+            '5m', 'TimelengthSeconds', 'TimelengthClock'
+        )
+    with pytest.raises(Exception, match='unknown timelength_representation'):
+        tooltime.compile_timelength_converter('TimelengthUnknown')
+
+
+@pytest.mark.parametrize(
+    'test', [[60, 60], [60.0, 60], [1.5, 1.5], ['1m', 60], ['0:00:01.5', 1.5]]
+)
+def test_timelength_to_numerical(test):
+    timelength, target = test
+    numerical = tooltime.timelength_to_numerical(timelength)
+    assert numerical == target
+    assert type(numerical) is type(target)
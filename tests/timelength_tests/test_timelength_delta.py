@@ -0,0 +1,55 @@
+import datetime
+
+import pytest
+
+import tooltime
+
+
+# order: [timestamp, months, shifted]
+shift_tests = [
+    ['2024-01-31T12:00:00Z', 1, '2024-02-29T12:00:00Z'],
+    ['2023-01-31T12:00:00Z', 1, '2023-02-28T12:00:00Z'],
+    ['2024-03-31T23:59:59Z', -1, '2024-02-29T23:59:59Z'],
+    ['2024-05-15T06:30:00Z', 12, '2025-05-15T06:30:00Z'],
+    ['2024-05-31T00:00:00Z', -3, '2024-02-29T00:00:00Z'],
+    ['1969-12-31T23:00:00Z', 2, '1970-02-28T23:00:00Z'],
+    ['2199-12-31T00:00:00Z', 2, '2200-02-28T00:00:00Z'],
+    ['2200-12-31T00:00:00Z', 2, '2201-02-28T00:00:00Z'],
+]
+
+
+@pytest.mark.parametrize('test', shift_tests)
+def test_shift_months(test):
+    timestamp, months, shifted = test
+    seconds = tooltime.timestamp_to_seconds(timestamp)
+    target = tooltime.timestamp_to_seconds(shifted)
+    assert tooltime.shift_months(seconds, months) == target
+    assert seconds + tooltime.DateDelta(months=months) == target
+
+    dt = tooltime.timestamp_to_datetime(timestamp)
+    shifted_dt = dt + tooltime.DateDelta(months=months)
+    assert shifted_dt == tooltime.timestamp_to_datetime(shifted)
+    assert shifted_dt.tzinfo == datetime.timezone.utc
+
+
+def test_shift_months_vectorized():
+    np = pytest.importorskip('numpy')
+    seconds = np.array(
+        [tooltime.timestamp_to_seconds(t) for t, _, _ in shift_tests]
+    )
+    months = np.array([months for _, months, _ in shift_tests])
+    target = [tooltime.timestamp_to_seconds(t) for _, _, t in shift_tests]
+    assert tooltime.shift_months(seconds, months).tolist() == target
+    assert (seconds + tooltime.DateDelta(quarters=1)).tolist() == [
+        tooltime.shift_months(int(t), 3) for t in seconds
+    ]
+
+
+def test_date_delta_value_type():
+    delta = tooltime.DateDelta(quarters=1)
+    assert delta == tooltime.DateDelta(months=3)
+    assert hash(delta) == hash(tooltime.DateDelta(months=3))
+    assert -delta == tooltime.DateDelta(months=-3)
+    assert len({delta, tooltime.DateDelta(months=3)}) == 1
+    with pytest.raises(AttributeError):
+        delta.months = 1
@@ -0,0 +1,92 @@
+import pytest
+
+import tooltime
+
+np = pytest.importorskip('numpy')
+
+
+def _get_seconds():
+    rng = np.random.default_rng(0)
+    ints = np.concatenate(
+        [
+            rng.integers(-(10**9), 10**9, 2000),
+            rng.integers(0, 200000, 2000),
+            [0, 1, 59, 60, 86399, 86400, 31536000, -1],
+        ]
+    )
+    floats = np.concatenate(
+        [
+            rng.uniform(-1e7, 1e7, 2000),
+            rng.uniform(0, 100, 2000),
+            rng.integers(0, 10**6, 500) + 0.5,
+            [0.0, 0.5, 1e-5, 86399.9999999, 59.9, 5.5, 6.5, 3600.0000001],
+            [-1e-20, -1e-12, -1e-5],
+        ]
+    )
+    return {'int': ints, 'float': floats}
+
+
+def _get_label_seconds():
+    rng = np.random.default_rng(1)
+    base = rng.choice([60, 300, 3600, 86400, 604800, 2592000], 2000)
+    ints = base * rng.integers(1, 20, 2000)
+    jittered = ints * rng.uniform(0.95, 1.05, 2000)
+    return {'int': ints, 'float': ints * 1.0, 'jittered': jittered}
+
+
+@pytest.mark.parametrize('dtype', ['int', 'float'])
+def test_timelength_seconds_to_clocks(dtype):
+    seconds = _get_seconds()[dtype]
+    clocks = tooltime.timelength_seconds_to_clocks(seconds)
+    assert clocks.tolist() == [
+        tooltime.timelength_seconds_to_clock(value)
+        for value in seconds.tolist()
+    ]
+
+
+@pytest.mark.parametrize('dtype', ['int', 'float'])
+def test_timelength_seconds_to_phrases(dtype):
+    seconds = _get_seconds()[dtype]
+    phrases = tooltime.timelength_seconds_to_phrases(seconds)
+    assert phrases.tolist() == [
+        tooltime.timelength_seconds_to_phrase(value)
+        for value in seconds.tolist()
+    ]
+
+
+@pytest.mark.parametrize('dtype', ['int', 'float', 'jittered'])
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {},
+        {'fuzzy_tolerance': 0.1},
+        {'base_unit': '1m', 'fuzzy_tolerance': 0.1},
+        {'base_unit': '1s'},
+    ],
+)
+def test_timelength_seconds_to_labels(dtype, kwargs):
+    seconds = _get_label_seconds()[dtype]
+    if dtype == 'jittered' and 'fuzzy_tolerance' not in kwargs:
+        seconds = seconds[seconds >= 6]
+    labels = tooltime.timelength_seconds_to_labels(seconds, **kwargs)
+    assert labels.tolist() == [
+        tooltime.timelength_seconds_to_label(value, **kwargs)
+        for value in seconds.tolist()
+    ]
+
+
+def test_timelength_seconds_to_labels_base_only():
+    seconds = np.array([1, 60, 3600, 86400.0, 604800])
+    labels = tooltime.timelength_seconds_to_labels(seconds, base_only=True)
+    assert labels.tolist() == ['1s', '1m', '1h', '1d', '1w']
+    with pytest.raises(tooltime.ConversionException, match='120'):
+        tooltime.timelength_seconds_to_labels([120], base_only=True)
+    with pytest.raises(tooltime.ConversionException, match='0.5'):
+        tooltime.timelength_seconds_to_labels([0.5])
+
+
+def test_timelength_format_shapes():
+    labels = tooltime.timelength_seconds_to_labels([[60, 120], [3600, 7200]])
+    assert labels.tolist() == [['1m', '2m'], ['1h', '2h']]
+    assert tooltime.timelength_seconds_to_clocks([]).tolist() == []
+    assert tooltime.timelength_seconds_to_phrases([0]).tolist() == ['0 seconds']
@@ -0,0 +1,86 @@
+import pytest
+
+import tooltime
+import tooltime.spec
+
+
+# order: [timelength, representation, seconds, unit]
+parse_tests = [
+    ['5m', 'TimelengthLabel', 300, 'm'],
+    ['10M', 'TimelengthLabel', 25920000, 'M'],
+    ['-5m', 'TimelengthLabel', -300, 'm'],
+    ['1h30m', None, 5400, None],
+    ['1h 30m', None, 5400, None],
+    ['1.5h', None, 5400.0, 'h'],
+    ['-1h30m', None, -5400, None],
+    ['1:30:00', 'TimelengthClock', 5400, None],
+    ['2:01:30:00', 'TimelengthClock', 178200, None],
+    ['0:00:00.5', 'TimelengthClock', 0.5, None],
+    ['2 months', 'TimelengthPhrase', 5184000, 'M'],
+    ['1 hour, 30 minutes', 'TimelengthPhrase', 5400, None],
+    ['1.5 hours', 'TimelengthPhrase', 5400.0, 'h'],
+    ['2 days, 1:30:00', 'TimelengthClockPhrase', 178200, None],
+    ['1 year, 2 days, 1:30:00', 'TimelengthClockPhrase', 31714200, None],
+]
+
+
+@pytest.mark.parametrize('test', parse_tests)
+def test_parse_timelength(test):
+    timelength, representation, seconds, unit = test
+    parsed = tooltime.parse_timelength(timelength)
+    assert parsed['representation'] == representation
+    assert parsed['seconds'] == seconds
+    assert type(parsed['seconds']) is type(seconds)
+    assert parsed['unit'] == unit
+    if representation is not None:
+        assert tooltime.detect_timelength_representation(timelength) == (
+            representation
+        )
+    else:
+        assert not tooltime.is_timelength_label(timelength)
+        with pytest.raises(
+            tooltime.exceptions.RepresentationDetectionException,
+            match='compound or fractional',
+        ):
+            tooltime.detect_timelength_representation(timelength)
+
+
+@pytest.mark.parametrize('timelength', [[1], {'a': 1}, None, 5])
+def test_parse_timelength_not_str(timelength):
+    with pytest.raises(
+        tooltime.exceptions.RepresentationDetectionException,
+        match='timelength is not str',
+    ):
+        tooltime.parse_timelength(timelength)
+
+
+@pytest.mark.parametrize(
+    'timelength',
+    ['', '5', '1:2', '1h,30m', '1 hour, 1h', 'abc', '1x', '--5m', '1h-30m'],
+)
+def test_parse_timelength_invalid(timelength):
+    with pytest.raises(tooltime.exceptions.RepresentationDetectionException):
+        tooltime.parse_timelength(timelength)
+    assert not tooltime.is_timelength(timelength)
+
+
+examples = []
+for equivalent_set in tooltime.spec.equivalent_sets['Timelength']:
+    for representation, value in equivalent_set.items():
+        if isinstance(value, str):
+            examples.append([value, equivalent_set['TimelengthSeconds']])
+
+
+@pytest.mark.parametrize('example', examples)
+def test_parse_timelength_equivalent_sets(example):
+    timelength, seconds = example
+    assert tooltime.parse_timelength(timelength)['seconds'] == seconds
+
+
+def test_compound_label_conversion():
+    assert tooltime.timelength_to_seconds('1h30m') == 5400
+    assert tooltime.timelength_to_label('1h30m') == '90m'
+    assert tooltime.timelength_to_label('1.5h') == '90m'
+    assert tooltime.convert_timelength('1d12h', 'TimelengthLabel') == '36h'
+    assert tooltime.timelength_label_to_seconds('1d12h') == 129600
+    assert tooltime.timelength_to_clock('1h30m') == '1:30:00'
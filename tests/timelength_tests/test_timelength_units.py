@@ -0,0 +1,76 @@
+import pytest
+
+import tooltime
+
+
+@pytest.fixture(params=[False, True])
+def quarter_unit(request):
+    tooltime.register_time_unit(
+        'q',
+        90 * 86400,
+        'quarter',
+        'quarters',
+        polars='q',
+        format_labels=request.param,
+    )
+    try:
+        yield request.param
+    finally:
+        tooltime.unregister_time_unit('q')
+
+
+def test_unit_registry_is_immutable():
+    base_units = tooltime.get_base_units()
+    assert base_units is tooltime.get_base_units()
+    assert base_units['1h'] == 3600
+    with pytest.raises(TypeError):
+        base_units['1h'] = 1  # type: ignore
+    registry = tooltime.get_unit_registry()
+    assert registry.descending[0] == ('1y', 365 * 86400)
+    assert registry.descending[-1] == ('1s', 1)
+    assert registry.label_to_polars['1M'] == 'mo'
+    assert tooltime.get_pandas_unit_to_english()['YS'] == 'years'
+
+
+def test_register_time_unit(quarter_unit):
+    assert tooltime.timelength_to_seconds('2q') == 180 * 86400
+    assert tooltime.timelength_to_seconds('1 quarter, 1 day') == 91 * 86400
+    assert tooltime.timelength_to_seconds('1q2d') == 92 * 86400
+    label = tooltime.timelength_seconds_to_label(180 * 86400)
+    assert label == ('2q' if quarter_unit else '6M')
+    assert tooltime.timelength_seconds_to_label(60 * 86400) == '2M'
+    assert (
+        tooltime.timelength_seconds_to_label(180 * 86400, base_unit='1q')
+        == '2q'
+    )
+    labels = tooltime.timelength_seconds_to_labels([180 * 86400])
+    assert labels.tolist() == [label]
+    assert tooltime.get_base_units()['1q'] == 90 * 86400
+    assert tooltime.get_unit_registry().label_to_polars['1q'] == 'q'
+
+
+def test_unregister_time_unit():
+    tooltime.register_time_unit('td', 23400, 'tradingday', 'tradingdays')
+    assert tooltime.timelength_to_seconds('2td') == 46800
+    assert tooltime.timelength_seconds_to_label(46800) == '13h'
+    assert tooltime.timelength_seconds_to_label(46800, base_unit='1td') == '2td'
+    tooltime.unregister_time_unit('td')
+    assert not tooltime.is_timelength('2td')
+    assert '1td' not in tooltime.get_base_units()
+    assert tooltime.timelength_seconds_to_label(46800) == '13h'
+
+
+@pytest.mark.parametrize(
+    'unit,match',
+    [
+        [['m', 60, 'minuteish', 'minuteishes'], 'unit already registered'],
+        [['x', 60, 'minute', 'minutes'], 'unit already registered'],
+        [['1x', 60, 'onex', 'onexes'], 'unit letter must be ascii letters'],
+        [['x', 0, 'nothing', 'nothings'], 'unit seconds must be positive'],
+    ],
+)
+def test_register_time_unit_invalid(unit, match):
+    with pytest.raises(Exception, match=match):
+        tooltime.register_time_unit(*unit)
+    with pytest.raises(Exception, match='cannot unregister builtin unit'):
+        tooltime.unregister_time_unit('h')
@@ -0,0 +1,97 @@
+import pytest
+
+import tooltime
+
+pl = pytest.importorskip('polars')
+np = pytest.importorskip('numpy')
+
+
+# order: [start, end, interval, timezone, n_hours of each interval]
+local_interval_tests = [
+    [
+        '2020-03-07T05:00:00Z',
+        '2020-03-10T04:00:00Z',
+        '1d',
+        'America/New_York',
+        [24, 23, 24],
+    ],
+    [
+        '2020-10-24T23:00:00Z',
+        '2020-10-26T00:00:00Z',
+        '1d',
+        'Europe/London',
+        [25],
+    ],
+    [
+        '2020-11-01T04:00:00Z',
+        '2020-11-01T08:00:00Z',
+        '1h',
+        'America/New_York',
+        [1, 1, 1, 1],
+    ],
+    # 2020-03-08T02:00:00 is skipped in new york
+    [
+        '2020-03-08T05:00:00Z',
+        '2020-03-08T10:00:00Z',
+        '2h',
+        'America/New_York',
+        [2, 1, 2],
+    ],
+    [
+        '2020-02-29T13:00:00Z',
+        '2020-05-31T14:00:00Z',
+        '1M',
+        'Australia/Sydney',
+        [744, 721, 744],
+    ],
+]
+
+
+@pytest.mark.parametrize('test', local_interval_tests)
+def test_get_intervals_local(test):
+    start, end, interval, timezone, n_hours = test
+    df = tooltime.get_intervals(start, end, interval, timezone=timezone)
+    assert df['start'].dtype == pl.Datetime('ms', timezone)
+    starts = df['start'].cast(pl.Int64).to_numpy() // 1000
+    ends = df['end'].cast(pl.Int64).to_numpy() // 1000
+    assert ((ends - starts) // 3600).tolist() == n_hours
+    assert (starts[1:] == ends[:-1]).all()
+    assert (df['completeness'] == 'complete').all()
+
+    # boundaries agree with local truncation
+    floored = tooltime.floor_timestamps(starts, interval, timezone=timezone)
+    assert floored.tolist() == starts.tolist()
+    floored = tooltime.floor_timestamps(ends - 1, interval, timezone=timezone)
+    assert floored.tolist() == starts.tolist()
+
+
+def test_get_intervals_local_labels():
+    df = tooltime.get_intervals(
+        '2020-03-07T05:00:00Z',
+        '2020-03-10T04:00:00Z',
+        '1d',
+        timezone='America/New_York',
+        label='start',
+    )
+    assert df['label'].to_list() == ['2020-03-07', '2020-03-08', '2020-03-09']
+
+
+def test_get_intervals_utc_unchanged():
+    utc = tooltime.get_intervals(
+        '2020-03-07T05:00:00Z', '2020-05-10T04:00:00Z', '1w'
+    )
+    local = tooltime.get_intervals(
+        '2020-03-07T05:00:00Z', '2020-05-10T04:00:00Z', '1w', timezone='UTC'
+    )
+    assert utc['label'].to_list() == local['label'].to_list()
+    assert (
+        utc['start'].cast(pl.Int64).to_list()
+        == local['start'].cast(pl.Int64).to_list()
+    )
+
+
+def test_get_intervals_compound_label():
+    intervals = tooltime.get_intervals(start=0, end=86400, interval='1h30m')
+    target = tooltime.get_intervals(start=0, end=86400, interval='90m')
+    assert intervals['start'].to_list() == target['start'].to_list()
+    assert len(intervals) == 16
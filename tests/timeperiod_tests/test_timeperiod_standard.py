@@ -61,3 +61,44 @@ def test_get_standard_timeperiod(test_tuple):
     to_dt = tooltime.timestamp_to_datetime(timeperiod['end'])
     assert getattr(from_dt, block_unit) == block_start
     assert getattr(to_dt, block_unit) == block_end
+
+
+bucketer_tests = [
+    ['15m', 1600000000, 1599999300, 1600000199],
+    ['7m', 1600000000, 1599999660, 1600000079],
+    ['4h', 1600000000, 1599998400, 1600012799],
+    ['3d', 1600000000, 1599955200, 1600214399],
+    ['1w', 1600000000, 1599955200, 1600559999],
+    ['1M', 1600000000, 1598918400, 1601510399],
+    ['3M', 1600000000, 1593561600, 1601510399],
+    ['1y', 1600000000, 1577836800, 1609459199],
+]
+
+
+@pytest.mark.parametrize('test', bucketer_tests)
+def test_bucketer(test):
+    label, timestamp, start, end = test
+    bucketer = tooltime.Bucketer(label)
+    assert bucketer.start(timestamp) == start
+    assert bucketer.end(timestamp) == end
+    assert bucketer.index(start) == bucketer.index(end)
+    assert bucketer.index(end + 1) > bucketer.index(end)
+    timeperiod = tooltime.get_standard_timeperiod(label, timestamp=timestamp)
+    assert bucketer.timeperiod(timestamp) == timeperiod
+
+
+@pytest.mark.parametrize('test', bucketer_tests)
+def test_bucketer_vectorized(test):
+    np = pytest.importorskip('numpy')
+    label, timestamp, start, end = test
+    bucketer = tooltime.Bucketer(label)
+    timestamps = np.array([start - 1, start, timestamp, timestamp + 0.5, end])
+    assert bucketer.starts(timestamps).tolist() == [
+        bucketer.start(t) for t in timestamps
+    ]
+    assert bucketer.ends(timestamps).tolist() == [
+        bucketer.end(t) for t in timestamps
+    ]
+    assert bucketer.indices(timestamps).tolist() == [
+        bucketer.index(t) for t in timestamps
+    ]
@@ -0,0 +1,137 @@
+import datetime
+
+import pytest
+
+import tooltime
+
+
+month_starts = [
+    (1850, 1),
+    (1899, 12),
+    (1900, 1),
+    (1900, 3),
+    (1969, 12),
+    (1970, 1),
+    (2000, 2),
+    (2000, 3),
+    (2024, 2),
+    (2200, 12),
+    (2201, 1),
+    (2500, 7),
+]
+
+
+@pytest.mark.parametrize('month_start', month_starts)
+def test_month_index_to_seconds(month_start):
+    year, month = month_start
+    dt = datetime.datetime(year, month, 1, tzinfo=datetime.timezone.utc)
+    month_index = (year - 1970) * 12 + month - 1
+    assert tooltime.month_index_to_seconds(month_index) == dt.timestamp()
+
+
+@pytest.mark.parametrize('month_start', month_starts)
+def test_seconds_to_month_index(month_start):
+    year, month = month_start
+    dt = datetime.datetime(year, month, 1, tzinfo=datetime.timezone.utc)
+    seconds = int(dt.timestamp())
+    month_index = (year - 1970) * 12 + month - 1
+    assert tooltime.seconds_to_month_index(seconds) == month_index
+    assert tooltime.seconds_to_month_index(seconds - 1) == month_index - 1
+    assert tooltime.seconds_to_month_index(seconds + 86400) == month_index
+
+
+def test_month_table_vectorized():
+    np = pytest.importorskip('numpy')
+    seconds = np.arange(-3 * 10**9, 8 * 10**9, 86400 * 3 + 7)
+    month_indices = tooltime.seconds_to_month_index(seconds)
+    target = tooltime.month_index_from_days(seconds // 86400)
+    assert (month_indices == target).all()
+
+    in_range = seconds[(seconds > -2 * 10**9) & (seconds < 7 * 10**9)]
+    month_indices = tooltime.seconds_to_month_index(in_range)
+    target = tooltime.month_index_from_days(in_range // 86400)
+    assert (month_indices == target).all()
+    month_starts = tooltime.month_index_to_seconds(month_indices)
+    target = tooltime.days_from_month_index(month_indices) * 86400
+    assert (month_starts == target).all()
+
+
+component_timestamps = [
+    0,
+    -1,
+    1600000000,
+    951782400,
+    1609459199,
+    1609459200,
+    -2208988800,
+    4102444800,
+    1704067200.5,
+]
+
+
+def _datetime_components(timestamp):
+    dt = datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc)
+    iso_year, iso_week, _ = dt.isocalendar()
+    return {
+        'year': dt.year,
+        'month': dt.month,
+        'day': dt.day,
+        'hour': dt.hour,
+        'minute': dt.minute,
+        'second': dt.second,
+        'weekday': dt.weekday(),
+        'iso_week': iso_week,
+        'iso_year': iso_year,
+        'day_of_year': dt.timetuple().tm_yday,
+    }
+
+
+@pytest.mark.parametrize('timestamp', component_timestamps)
+def test_get_calendar_components(timestamp):
+    components = tooltime.get_calendar_components(timestamp)
+    assert components == _datetime_components(timestamp)
+    seconds = tooltime.calendar_components_to_timestamps(
+        components['year'],
+        components['month'],
+        components['day'],
+        components['hour'],
+        components['minute'],
+        components['second'],
+    )
+    assert seconds == int(timestamp // 1)
+
+
+def test_get_calendar_components_vectorized():
+    np = pytest.importorskip('numpy')
+    timestamps = np.array(component_timestamps)
+    components = tooltime.get_calendar_components(timestamps)
+    for t, timestamp in enumerate(component_timestamps):
+        target = _datetime_components(timestamp)
+        assert {k: int(v[t]) for k, v in components.items()} == target
+    seconds = tooltime.calendar_components_to_timestamps(
+        components['year'],
+        components['month'],
+        components['day'],
+        components['hour'],
+        components['minute'],
+        components['second'],
+    )
+    assert seconds.tolist() == np.floor(timestamps).astype(int).tolist()
+
+
+def test_get_calendar_components_datetimes():
+    np = pytest.importorskip('numpy')
+    pl = pytest.importorskip('polars')
+    dt = datetime.datetime(2024, 3, 5, 12, 30, 15)
+    target = {'year': 2024, 'month': 3, 'day': 5, 'hour': 12, 'second': 15}
+    for timestamps in [
+        pl.Series([dt]),
+        pl.Series([dt]).dt.cast_time_unit('ms'),
+        np.array([dt], dtype='datetime64[us]'),
+    ]:
+        components = tooltime.get_calendar_components(
+            timestamps, list(target.keys())
+        )
+        assert {k: int(v[0]) for k, v in components.items()} == target
+    with pytest.raises(Exception, match='not durations'):
+        tooltime.get_calendar_components(np.array([1], dtype='timedelta64[s]'))
@@ -21,3 +21,19 @@ def test_convert_timestamps(timestamp_conversions):
                 )
             else:
                 assert converted_timestamp == to_timestamp
+
+
+def test_timestamps_to_seconds_array():
+    np = pytest.importorskip('numpy')
+    expected = [1577836800.0, 1577836860.0]
+    inputs = [
+        [1577836800, 1577836860],
+        np.array(
+            ['2020-01-01T00:00', '2020-01-01T00:01'], dtype='datetime64[s]'
+        ),
+        ['20200101_000000Z', '20200101_000100Z'],
+    ]
+    for timestamps in inputs:
+        seconds = tooltime.timestamps_to_seconds_array(timestamps)
+        assert seconds.dtype == np.float64
+        assert seconds.tolist() == expected
@@ -0,0 +1,88 @@
+import pytest
+
+import tooltime
+
+pl = pytest.importorskip('polars')
+np = pytest.importorskip('numpy')
+
+
+def get_groups():
+    rng = np.random.default_rng(0)
+    groups = []
+    for n in [1, 2, 5, 100, 1000]:
+        dts = rng.choice([0, 60, 60, 60, 120, 7], size=n)
+        groups.append(1600000000 + np.cumsum(dts))
+    return groups
+
+
+def get_frame():
+    groups = get_groups()
+    df = pl.DataFrame(
+        {
+            'sensor': np.concatenate(
+                [np.full(len(group), i) for i, group in enumerate(groups)]
+            ),
+            'timestamp': np.concatenate(groups),
+        }
+    )
+    return df.sample(fraction=1.0, shuffle=True, seed=0)
+
+
+def test_summarize_timestamps_by_group():
+    df = get_frame()
+    summary = tooltime.summarize_timestamps_by_group(df, 'timestamp', 'sensor')
+    assert isinstance(summary, pl.DataFrame)
+    summary = summary.sort('sensor')
+    assert len(summary) == 5
+
+    for row, group in zip(summary.iter_rows(named=True), get_groups()):
+        target = tooltime.summarize_timestamps(group.tolist())
+        assert row['n_t'] == target['n_t']
+        if target['n_t'] == 1:
+            assert row['start'] == target['start']
+            continue
+        for key in [
+            'n_unique',
+            'n_missing',
+            'duration',
+            'n_small_outliers',
+            'n_large_outliers',
+            'n_outliers',
+        ]:
+            assert row[key] == target[key]
+        assert row['start_label'] == target['start']
+        assert row['end_label'] == target['end']
+        assert row['median_dt'] == target['resolution']['median_dt']
+        assert row['resolution'] == target['resolution']['label']
+
+
+def test_summarize_timestamps_by_group_lazy():
+    df = get_frame()
+    lf = df.lazy().with_columns(pl.from_epoch('timestamp', time_unit='s'))
+    summary = tooltime.summarize_timestamps_by_group(
+        lf, 'timestamp', ['sensor']
+    )
+    assert isinstance(summary, pl.LazyFrame)
+    target = tooltime.summarize_timestamps_by_group(df, 'timestamp', 'sensor')
+    result = summary.collect(engine='streaming')
+    assert result.sort('sensor').equals(target.sort('sensor'))
+
+
+def test_summarize_timestamps_by_group_resolution_labels():
+    median_dts = [2.5, 7.5, 3.0, 3600.0, 0.001]
+    df = pl.DataFrame(
+        {
+            'sensor': np.repeat(np.arange(len(median_dts)), 10),
+            'timestamp': np.concatenate(
+                [1600000000 + np.arange(10) * dt for dt in median_dts]
+            ),
+        }
+    )
+    summary = tooltime.summarize_timestamps_by_group(df, 'timestamp', 'sensor')
+    assert summary.sort('sensor')['resolution'].to_list() == [
+        None,
+        '7s',
+        '3s',
+        '1h',
+        None,
+    ]
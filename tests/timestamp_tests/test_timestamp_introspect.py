@@ -0,0 +1,87 @@
+import pickle
+
+import pytest
+
+import tooltime
+
+np = pytest.importorskip('numpy')
+
+
+def get_timestamps(n):
+    rng = np.random.default_rng(0)
+    multiples = rng.choice([0, 1, 1, 1, 1, 2, 7], size=n)
+    return (1600000000 + np.cumsum(multiples) * 60).tolist()
+
+
+def test_summarize_timestamps_stats_only():
+    timestamps = get_timestamps(1000)
+    full = tooltime.summarize_timestamps(timestamps)
+    lean = tooltime.summarize_timestamps(timestamps, stats_only=True)
+    assert lean.keys() == full.keys()
+    for key in full.keys():
+        if key != 'resolution':
+            assert lean[key] == full[key]
+    assert lean['resolution']['dts'] is None
+    assert lean['resolution']['outliers']['small'] is None
+    assert lean['resolution']['outliers']['large'] is None
+    assert lean['resolution']['outliers']['n_small'] == len(
+        full['resolution']['outliers']['small']
+    )
+    assert lean['resolution']['outliers']['n_large'] == len(
+        full['resolution']['outliers']['large']
+    )
+    assert lean['resolution']['median_dt'] == full['resolution']['median_dt']
+
+
+def test_summarize_timestamps_stats_only_size():
+    sizes = []
+    for n in [100, 100000]:
+        summary = tooltime.summarize_timestamps(
+            get_timestamps(n), stats_only=True
+        )
+        sizes.append(len(pickle.dumps(summary)))
+    assert sizes[0] < 1000
+    assert sizes[1] < 1000
+
+
+n_missing_tests = [
+    [[0, 60, 120, 180], 0],
+    [[0, 60, 180, 240], 1],
+    [[0, 60, 120, 600], 7],
+    [[0, 60, 60, 120], -1],
+    [[0, 3, 6, 10], 1],
+]
+
+
+@pytest.mark.parametrize('test', n_missing_tests)
+def test_summarize_timestamps_n_missing(test):
+    timestamps, n_missing = test
+    summary = tooltime.summarize_timestamps(timestamps)
+    assert summary['n_missing'] == n_missing
+
+
+def test_summarize_timestamps_outlier_method():
+    timestamps = get_timestamps(1000)
+    rtol = tooltime.summarize_timestamps(timestamps)
+    iqr = tooltime.summarize_timestamps(timestamps, outlier_method='iqr')
+    assert rtol['resolution']['dispersion'] == iqr['resolution']['dispersion']
+    assert iqr['resolution']['outliers']['method'] == 'iqr'
+    dts = np.diff(timestamps)
+    upper = iqr['resolution']['outliers']['upper']
+    assert iqr['n_large_outliers'] == np.count_nonzero(dts > upper)
+
+
+@pytest.mark.parametrize('stats_only', [False, True])
+def test_print_timestamp_summary(capsys, stats_only):
+    timestamps = get_timestamps(1000)
+    summary = tooltime.summarize_timestamps(timestamps, stats_only=stats_only)
+    tooltime.print_timestamp_summary(summary=summary)
+    output = capsys.readouterr().out
+    assert '(' + str(timestamps[0]) + ')' in output
+    assert 'mad_dt' in output
+    if stats_only:
+        assert 'row' not in output
+    else:
+        outliers = summary['resolution']['outliers']
+        largest = outliers['large_indices'][np.argmax(outliers['large'])]
+        assert 'row ' + str(largest) + ':' in output
@@ -0,0 +1,157 @@
+import random
+
+import pytest
+
+import tooltime
+
+
+range_args = [
+    (0, 10, 1),
+    (1600000000, 1600086400, 3600),
+    (5, -20, -3),
+    (0, 10, 20),
+    (10, 0, 1),
+    (-7, 100, 6),
+]
+
+
+@pytest.mark.parametrize('args', range_args)
+def test_timestamp_range_sequence(args):
+    timestamps = tooltime.TimestampRange(*args)
+    target = range(*args)
+    assert len(timestamps) == len(target)
+    assert list(timestamps) == list(target)
+    assert list(reversed(timestamps)) == list(reversed(target))
+    assert timestamps.to_list() == list(target)
+    for index in range(-len(target), len(target)):
+        assert timestamps[index] == target[index]
+    for index in [slice(1, None), slice(None, -2), slice(None, None, -2)]:
+        assert list(timestamps[index]) == list(target[index])
+
+
+@pytest.mark.parametrize('args', range_args)
+def test_timestamp_range_contains(args):
+    timestamps = tooltime.TimestampRange(*args)
+    target = range(*args)
+    values = list(target) + [value + 1 for value in target] + [-100, 10**12]
+    for value in values:
+        assert (value in timestamps) == (value in target)
+        if value in target:
+            assert timestamps.index(value) == target.index(value)
+        else:
+            with pytest.raises(ValueError):
+                timestamps.index(value)
+
+
+def test_timestamp_range_large():
+    timestamps = tooltime.TimestampRange(0, 100 * 365 * 86400, 1)
+    assert len(timestamps) == 100 * 365 * 86400
+    assert timestamps[-1] == 100 * 365 * 86400 - 1
+    assert 86400 * 365 * 50 in timestamps
+    assert timestamps[::86400].index(86400 * 7) == 7
+
+
+intersection_tests = [
+    [(0, 100, 6), (2, 100, 4), [6, 18, 30, 42, 54, 66, 78, 90]],
+    [(0, 100, 6), (3, 100, 4), []],
+    [(0, 30, 5), (30, 0, -3), [15]],
+    [(0, 10, 1), (20, 30, 1), []],
+    [(0, 50, 10), (0, 50, 10), [0, 10, 20, 30, 40]],
+]
+
+
+@pytest.mark.parametrize('test', intersection_tests)
+def test_timestamp_range_intersection(test):
+    a, b, target = test
+    a_range = tooltime.TimestampRange(*a)
+    b_range = tooltime.TimestampRange(*b)
+    assert list(a_range.intersection(b_range)) == target
+    assert list(a_range & b_range) == target
+    assert target == sorted(set(range(*a)) & set(range(*b)))
+
+
+def test_timestamp_range_float():
+    timestamps = tooltime.TimestampRange(0.0, 1.0, 0.1)
+    assert len(timestamps) == 10
+    assert timestamps[3] in timestamps
+    assert timestamps.index(timestamps[7]) == 7
+    assert 0.35 not in timestamps
+
+
+def test_timestamp_range_equality():
+    a = tooltime.TimestampRange(0, 10, 3)
+    b = tooltime.TimestampRange(0, 11, 3)
+    assert a == b
+    assert hash(a) == hash(b)
+    assert tooltime.TimestampRange(0, 0, 1) == tooltime.TimestampRange(5, 0, 2)
+
+
+def test_timestamp_range_conversion():
+    np = pytest.importorskip('numpy')
+    timestamps = tooltime.TimestampRange(1600000000, 1600000100, 7)
+    target = list(range(1600000000, 1600000100, 7))
+    assert timestamps.to_numpy().dtype == np.int64
+    assert timestamps.to_numpy().tolist() == target
+    pytest.importorskip('polars')
+    assert timestamps.to_polars().to_list() == target
+
+
+def test_sample_timestamps_range():
+    timestamps = tooltime.sample_timestamps(
+        start_time=1600000000,
+        end_time=1600000100,
+        sample_interval=10,
+        output='range',
+    )
+    assert timestamps == tooltime.TimestampRange(1600000000, 1600000101, 10)
+    samples = tooltime.parse_timeslice('1600000000:1600000100:10')
+    assert list(timestamps) == samples
+
+    with pytest.raises(Exception, match='misaligned samples cannot be'):
+        tooltime.sample_timestamps(
+            start_time=1,
+            end_time=10,
+            sample_interval=4,
+            include_misaligned_bound=True,
+            output='range',
+        )
+
+
+@pytest.mark.parametrize('align_to', ['start', 'end'])
+def test_sample_timestamps_range_float(align_to):
+    rng = random.Random(0)
+    for _ in range(200):
+        interval = rng.choice([0.1, 0.25, 1 / 3, 0.7, rng.uniform(0.01, 10)])
+        n_samples = rng.randint(2, 200)
+        start_time = rng.uniform(0, 100)
+        inputs = {
+            'start_time': start_time,
+            'end_time': start_time + (n_samples - 1) * interval,
+            'n_samples': n_samples,
+            'align_to': align_to,
+        }
+        samples = tooltime.sample_timestamps(**inputs)
+        timestamps = tooltime.sample_timestamps(**inputs, output='range')
+        assert list(timestamps) == samples
+        assert list(tooltime.sample_timestamps(**inputs, output='lazy')) == (
+            samples
+        )
+        assert all(sample in timestamps for sample in samples)
+        assert [timestamps.index(sample) for sample in samples] == list(
+            range(len(samples))
+        )
+
+
+def test_get_standard_intervals_range():
+    timestamps = tooltime.get_standard_intervals(
+        '1h', start_time=1600000000, n_intervals=3, output='range'
+    )
+    assert list(timestamps) == [1599998400, 1600002000, 1600005600]
+    timestamps = tooltime.get_standard_intervals(
+        '1w', start_time=1600000000, end_time=1601000000, output='range'
+    )
+    assert [tooltime.timestamp_to_iso(t) for t in timestamps] == [
+        '2020-09-13T00:00:00Z',
+        '2020-09-20T00:00:00Z',
+        '2020-09-27T00:00:00Z',
+    ]
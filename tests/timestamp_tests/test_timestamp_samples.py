@@ -63,3 +63,305 @@ def test_sample_timestamps(test):
     inputs, outputs = test
     actual_outputs = tooltime.sample_timestamps(**inputs)
     assert outputs == actual_outputs
+
+
+@pytest.mark.parametrize('test', tests)
+def test_sample_timestamps_numpy(test):
+    pytest.importorskip('numpy')
+    inputs, outputs = test
+    actual_outputs = tooltime.sample_timestamps(**inputs, output='numpy')
+    assert actual_outputs.tolist() == outputs
+
+
+@pytest.mark.parametrize('test', tests)
+def test_sample_timestamps_lazy(test):
+    inputs, outputs = test
+    samples = tooltime.sample_timestamps(**inputs, output='lazy')
+    assert len(samples) == len(outputs)
+    assert list(samples) == outputs
+    assert [samples[i] for i in range(-len(outputs), len(outputs))] == (
+        outputs + outputs
+    )
+    for index in [slice(1, None), slice(None, -1), slice(None, None, -2)]:
+        assert list(samples[index]) == outputs[index]
+        assert samples[index].to_list() == outputs[index]
+
+
+def test_sample_timestamps_lazy_large():
+    samples = tooltime.sample_timestamps(
+        start_time=0,
+        end_time=10**8,
+        sample_interval=1,
+        include_misaligned_overflow=True,
+        output='lazy',
+    )
+    assert len(samples) == 10**8 + 1
+    assert samples[-1] == 10**8
+    assert samples[10**6 :: 10**6][:3].to_list() == [
+        10**6,
+        2 * 10**6,
+        3 * 10**6,
+    ]
+
+
+def test_sample_timestamps_float_interval():
+    inputs = {'start_time': 0, 'end_time': 1, 'sample_interval': 0.1}
+    samples = tooltime.sample_timestamps(**inputs)
+    assert len(samples) == 11
+    assert samples == tooltime.sample_timestamps(**inputs, output='lazy')
+
+
+def test_sample_timestamps_fixed_count():
+    samples = tooltime.sample_timestamps(
+        start_time=100, sample_interval=10, n_samples=3
+    )
+    assert samples == [100, 110, 120]
+    samples = tooltime.sample_timestamps(
+        end_time=100, sample_interval=10, n_samples=3
+    )
+    assert samples == [80, 90, 100]
+
+
+# order: [inputs, iso outputs]
+calendar_tests = [
+    # month steps clamp to end of month relative to anchor
+    [
+        {
+            'start_time': '2020-01-31T00:00:00Z',
+            'end_time': '2020-05-30T00:00:00Z',
+            'sample_interval': '1M',
+        },
+        [
+            '2020-01-31T00:00:00Z',
+            '2020-02-29T00:00:00Z',
+            '2020-03-31T00:00:00Z',
+            '2020-04-30T00:00:00Z',
+        ],
+    ],
+    [
+        {
+            'end_time': '2020-05-31T00:00:00Z',
+            'sample_interval': '1M',
+            'n_samples': 4,
+            'align_to': 'end',
+        },
+        [
+            '2020-02-29T00:00:00Z',
+            '2020-03-31T00:00:00Z',
+            '2020-04-30T00:00:00Z',
+            '2020-05-31T00:00:00Z',
+        ],
+    ],
+    [
+        {
+            'start_time': '2020-01-15T00:00:00Z',
+            'end_time': '2020-04-01T00:00:00Z',
+            'sample_interval': '1M',
+            'include_misaligned_bound': True,
+            'include_misaligned_overflow': True,
+        },
+        [
+            '2020-01-15T00:00:00Z',
+            '2020-02-15T00:00:00Z',
+            '2020-03-15T00:00:00Z',
+            '2020-04-01T00:00:00Z',
+            '2020-05-01T00:00:00Z',
+        ],
+    ],
+    # phrases of months step by calendar months
+    [
+        {
+            'start_time': '2020-01-31T00:00:00Z',
+            'end_time': '2020-05-30T00:00:00Z',
+            'sample_interval': '1 month',
+        },
+        [
+            '2020-01-31T00:00:00Z',
+            '2020-02-29T00:00:00Z',
+            '2020-03-31T00:00:00Z',
+            '2020-04-30T00:00:00Z',
+        ],
+    ],
+    [
+        {
+            'start_time': '2019-06-01T00:00:00Z',
+            'end_time': '2021-01-01T00:00:00Z',
+            'sample_interval': '1y',
+        },
+        ['2019-06-01T00:00:00Z', '2020-06-01T00:00:00Z'],
+    ],
+    # calendar alignment samples interval boundaries
+    [
+        {
+            'start_time': '2020-01-05T12:00:00Z',
+            'end_time': '2020-02-01T00:00:00Z',
+            'sample_interval': '1w',
+            'align_to': 'calendar',
+        },
+        [
+            '2020-01-12T00:00:00Z',
+            '2020-01-19T00:00:00Z',
+            '2020-01-26T00:00:00Z',
+        ],
+    ],
+    [
+        {
+            'start_time': '2020-01-05T12:00:00Z',
+            'end_time': '2020-05-01T12:00:00Z',
+            'sample_interval': '1M',
+            'align_to': 'calendar',
+            'include_misaligned_bound': True,
+        },
+        [
+            '2020-01-05T12:00:00Z',
+            '2020-02-01T00:00:00Z',
+            '2020-03-01T00:00:00Z',
+            '2020-04-01T00:00:00Z',
+            '2020-05-01T00:00:00Z',
+            '2020-05-01T12:00:00Z',
+        ],
+    ],
+    [
+        {
+            'start_time': '2020-01-01T00:00:00Z',
+            'sample_interval': '1d',
+            'n_samples': 3,
+            'align_to': 'calendar',
+        },
+        [
+            '2020-01-01T00:00:00Z',
+            '2020-01-02T00:00:00Z',
+            '2020-01-03T00:00:00Z',
+        ],
+    ],
+    [
+        {
+            'start_time': '2020-01-01T00:30:00Z',
+            'end_time': '2020-01-01T03:00:00Z',
+            'sample_interval': '1 hour',
+            'align_to': 'calendar',
+        },
+        [
+            '2020-01-01T01:00:00Z',
+            '2020-01-01T02:00:00Z',
+            '2020-01-01T03:00:00Z',
+        ],
+    ],
+]
+
+
+@pytest.mark.parametrize('test', calendar_tests)
+def test_sample_timestamps_calendar(test):
+    pytest.importorskip('numpy')
+    inputs, outputs = test
+    inputs = dict(inputs)
+    for key in ['start_time', 'end_time']:
+        if key in inputs:
+            inputs[key] = tooltime.timestamp_to_seconds(inputs[key])
+    samples = tooltime.sample_timestamps(**inputs)
+    assert [tooltime.timestamp_to_iso(sample) for sample in samples] == outputs
+    array = tooltime.sample_timestamps(**inputs, output='numpy')
+    assert array.tolist() == samples
+    lazy = tooltime.sample_timestamps(**inputs, output='lazy')
+    assert len(lazy) == len(samples)
+    assert list(lazy) == samples
+    assert lazy.to_list() == samples
+    for index in [slice(1, None), slice(None, -1), slice(None, None, -2)]:
+        assert list(lazy[index]) == samples[index]
+        assert lazy[index].to_numpy().tolist() == samples[index]
+
+
+def test_sample_timestamps_calendar_range():
+    with pytest.raises(Exception, match='cannot be represented'):
+        tooltime.sample_timestamps(
+            start_time=0, end_time=10**8, sample_interval='1M', output='range'
+        )
+
+
+def test_sample_timestamps_fixed_phrase():
+    samples = tooltime.sample_timestamps(
+        start_time=0, end_time=3 * 86400, sample_interval='1 day'
+    )
+    assert samples == [0, 86400, 2 * 86400, 3 * 86400]
+
+
+def test_parse_timeslice_calendar():
+    pytest.importorskip('numpy')
+    samples = tooltime.parse_timeslice('2020-01-01:2021-01-01:1M')
+    assert len(samples) == 13
+    assert all(
+        tooltime.timestamp_to_iso(sample).endswith('-01T00:00:00Z')
+        for sample in samples
+    )
+    lazy = tooltime.parse_timeslice('2020-01-01:2021-01-01:1M', output='lazy')
+    assert list(lazy) == samples
+
+
+def test_parse_timeslice_calendar_weeks():
+    pytest.importorskip('numpy')
+    fixed = tooltime.parse_timeslice('2022-01-01:2022-01-20:1w')
+    assert [tooltime.timestamp_to_iso(sample)[:10] for sample in fixed] == [
+        '2022-01-01',
+        '2022-01-08',
+        '2022-01-15',
+        '2022-01-20',
+    ]
+
+    # '@' places samples on sundays, bounds are misaligned samples
+    aligned = tooltime.parse_timeslice('2022-01-01:2022-01-20:@1w')
+    assert [tooltime.timestamp_to_iso(sample)[:10] for sample in aligned] == [
+        '2022-01-01',
+        '2022-01-02',
+        '2022-01-09',
+        '2022-01-16',
+        '2022-01-20',
+    ]
+
+
+compiled_timeslice_tests = [
+    ['15m::5m', [1599999100, 1599999400, 1599999700, 1600000000]],
+    ['10m:5m:5m', [1599999400, 1599999700]],
+    ['1599999000:', [1599999000, 1600000000]],
+    ['1599999000:10m:5m', [1599999000, 1599999300, 1599999600]],
+    ['10m:1599999000:5m', [1599998400, 1599998700, 1599999000]],
+]
+
+
+@pytest.mark.parametrize('test', compiled_timeslice_tests)
+def test_compile_timeslice(test):
+    raw_timeslice, target = test
+    compiled = tooltime.compile_timeslice(raw_timeslice, interval=1000)
+    samples = compiled.evaluate(now=1600000000)
+    assert samples.to_list() == target
+    assert compiled.evaluate(now=1600000000, output='list') == target
+    assert compiled is tooltime.compile_timeslice(raw_timeslice, interval=1000)
+
+
+def test_compile_timeslice_now():
+    compiled = tooltime.compile_timeslice('15m::1m')
+    assert compiled.get_bounds(now=1600000000) == (1599999100, 1600000000)
+    assert compiled.get_bounds(now=1700000000) == (1699999100, 1700000000)
+    assert len(compiled.evaluate(now=1600000000)) == 16
+    with pytest.raises(AttributeError):
+        compiled.start_ago = 0  # type: ignore
+
+    with pytest.raises(Exception, match='start time must be less than'):
+        tooltime.compile_timeslice('1600000000::1m').get_bounds(now=1500000000)
+
+
+def test_compile_timeslice_calendar():
+    pytest.importorskip('numpy')
+    compiled = tooltime.compile_timeslice('1y::1M')
+    assert compiled.calendar_interval == (1, 'M')
+    samples = compiled.evaluate()
+    assert len(samples) in (13, 14)
+    assert list(samples) == compiled.evaluate(output='list')
+
+    compiled = tooltime.compile_timeslice('1599999000:1y:1M')
+    now = 1600000000
+    assert compiled.evaluate(now=now).to_list() == tooltime.sample_timestamps(
+        start_time=1599999000,
+        end_time=1599999000 + 365 * 86400,
+        sample_interval='1M',
+        include_misaligned_bound=True,
+    )
@@ -0,0 +1,132 @@
+import pytest
+
+import tooltime
+
+np = pytest.importorskip('numpy')
+
+
+summary_keys = [
+    'n_t',
+    'n_unique',
+    'n_missing',
+    'start',
+    'end',
+    'duration',
+    'duration_label',
+    'n_large_outliers',
+    'n_small_outliers',
+    'n_outliers',
+]
+
+
+def get_stream_tests():
+    rng = np.random.default_rng(0)
+    tests = []
+    for step in [1, 60, 3600, 86400]:
+        multiples = rng.choice([0, 1, 1, 1, 1, 2, 7], size=1000)
+        timestamps = 1600000000 + np.cumsum(multiples) * step
+        tests.append(timestamps)
+        tests.append(timestamps[::-1])
+    return tests
+
+
+@pytest.mark.parametrize('timestamps', get_stream_tests())
+def test_summarizer_matches_summarize_timestamps(timestamps):
+    target = tooltime.summarize_timestamps(timestamps.tolist())
+    for n_chunks in [1, 3, 10]:
+        summarizer = tooltime.TimestampSummarizer()
+        for chunk in np.array_split(timestamps, n_chunks):
+            summarizer.update(chunk)
+        summary = summarizer.result()
+        for key in summary_keys:
+            assert summary[key] == target[key]
+        assert (
+            summary['resolution']['median_dt']
+            == target['resolution']['median_dt']
+        )
+        assert summary['resolution']['label'] == target['resolution']['label']
+        assert (
+            summary['resolution']['dispersion']
+            == target['resolution']['dispersion']
+        )
+
+
+@pytest.mark.parametrize('timestamps', get_stream_tests())
+def test_summarizer_merge(timestamps):
+    shards = np.array_split(timestamps, 4)
+    summarizers = [tooltime.TimestampSummarizer().update(s) for s in shards]
+    merged = summarizers[0]
+    for summarizer in summarizers[1:]:
+        merged.merge(summarizer)
+    target = tooltime.TimestampSummarizer().update(timestamps).result()
+    summary = merged.result()
+    for key in summary_keys:
+        assert summary[key] == target[key]
+
+
+def test_summarizer_small():
+    summarizer = tooltime.TimestampSummarizer()
+    assert summarizer.result() == {'n_t': 0}
+    summarizer.update([])
+    summarizer.update([1600000000])
+    assert summarizer.result() == {
+        'n_t': 1,
+        'start': 1600000000,
+        'end': 1600000000,
+    }
+    summarizer.update(['2020-09-13T12:27:40Z'])
+    summary = summarizer.result()
+    assert summary['n_t'] == 2
+    assert summary['resolution']['label'] == '1m'
+    assert summary['n_missing'] == 0
+
+
+def test_summarizer_bucketed_dts():
+    rng = np.random.default_rng(0)
+    timestamps = np.cumsum(rng.exponential(60, size=20000))
+    summarizer = tooltime.TimestampSummarizer(max_distinct_dts=100)
+    for chunk in np.array_split(timestamps, 7):
+        summarizer.update(chunk)
+    assert not summarizer.dts_are_exact
+    summary = summarizer.result()
+    median_dt = np.median(np.diff(timestamps))
+    assert abs(summary['resolution']['median_dt'] / median_dt - 1) < 0.02
+    assert summary['n_unique'] == 20000
+
+
+def test_summarizer_unique_estimate():
+    rng = np.random.default_rng(0)
+    values = np.repeat(rng.permutation(100000).astype(float), 3)
+    rng.shuffle(values)
+    summarizer = tooltime.TimestampSummarizer().update(values)
+    assert abs(summarizer.result()['n_unique'] / 100000 - 1) < 0.05
+
+
+@pytest.mark.parametrize('n_workers', [None, 3])
+@pytest.mark.parametrize('chunk_size', [7, 100, 10000])
+def test_summarize_timestamp_file_npy(tmp_path, n_workers, chunk_size):
+    timestamps = get_stream_tests()[1]
+    path = tmp_path / 'timestamps.npy'
+    np.save(path, timestamps)
+    summary = tooltime.summarize_timestamp_file(
+        path, chunk_size=chunk_size, n_workers=n_workers
+    )
+    target = tooltime.summarize_timestamps(timestamps.tolist())
+    for key in summary_keys:
+        assert summary[key] == target[key]
+
+
+def test_summarize_timestamp_file_parquet(tmp_path):
+    pl = pytest.importorskip('polars')
+    timestamps = get_stream_tests()[2]
+    path = tmp_path / 'timestamps.parquet'
+    df = pl.DataFrame({'id': np.arange(len(timestamps)), 't': timestamps})
+    df = df.with_columns(datetime=pl.from_epoch('t', time_unit='s'))
+    df.write_parquet(path, row_group_size=100)
+    target = tooltime.summarize_timestamps(timestamps.tolist())
+    for column in ['t', 'datetime']:
+        summary = tooltime.summarize_timestamp_file(
+            path, column, chunk_size=64, n_workers=2
+        )
+        for key in summary_keys:
+            assert summary[key] == target[key]
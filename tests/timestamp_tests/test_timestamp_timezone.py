@@ -0,0 +1,217 @@
+import datetime
+
+import pytest
+
+import tooltime
+
+zoneinfo = pytest.importorskip('zoneinfo')
+
+
+timezones = ['America/New_York', 'Europe/London', 'Australia/Sydney', 'UTC']
+
+# order: [timestamp, timezone, utc offset]
+offset_tests = [
+    [1600000000, 'America/New_York', -4 * 3600],
+    [1610000000, 'America/New_York', -5 * 3600],
+    [1600000000, 'Europe/London', 3600],
+    [1610000000, 'Europe/London', 0],
+    [1600000000, 'Australia/Sydney', 10 * 3600],
+    [1610000000, 'Australia/Sydney', 11 * 3600],
+    [1600000000, 'Asia/Kolkata', 19800],
+    # 2020-03-08T07:00:00Z, start of daylight saving time in new york
+    [1583650799, 'America/New_York', -5 * 3600],
+    [1583650800, 'America/New_York', -4 * 3600],
+]
+
+
+@pytest.mark.parametrize('test', offset_tests)
+def test_get_utc_offsets(test):
+    timestamp, timezone, offset = test
+    assert tooltime.get_utc_offsets(timestamp, timezone) == offset
+
+
+def test_get_utc_offsets_matches_zoneinfo():
+    np = pytest.importorskip('numpy')
+    timestamps = np.arange(-1_000_000_000, 3_000_000_000, 999_983)
+    for timezone in timezones:
+        tzinfo = zoneinfo.ZoneInfo(timezone)
+        target = [
+            datetime.datetime.fromtimestamp(t, tzinfo).utcoffset()
+            for t in timestamps.tolist()
+        ]
+        actual = tooltime.get_utc_offsets(timestamps, timezone)
+        assert actual.tolist() == [int(t.total_seconds()) for t in target]
+
+
+def test_timezone_table_without_tzif(monkeypatch):
+    from tooltime.timestamp_utils import timestamp_timezone
+
+    compile_table = timestamp_timezone._compile_timezone_table.__wrapped__
+    timezones_with_tzif = timezones + ['Asia/Gaza', 'Africa/Casablanca']
+    tzif_tables = [compile_table(tz, 1990, 2060) for tz in timezones_with_tzif]
+    monkeypatch.setattr(timestamp_timezone, '_read_tzif', lambda tz: None)
+    for timezone, tzif_table in zip(timezones_with_tzif, tzif_tables):
+        assert compile_table(timezone, 1990, 2060) == tzif_table
+
+
+def test_local_to_timestamps():
+    timezone = 'America/New_York'
+
+    # 2020-11-01T01:30:00 occurs twice in new york
+    local = 1604194200
+    assert tooltime.local_to_timestamps(local, timezone) == 1604208600
+    assert (
+        tooltime.local_to_timestamps(local, timezone, ambiguous='latest')
+        == 1604212200
+    )
+
+    # 2020-03-08T02:30:00 does not occur in new york
+    local = 1583634600
+    assert tooltime.local_to_timestamps(local, timezone) == 1583650800
+    with pytest.raises(Exception, match='nonexistent local time'):
+        tooltime.local_to_timestamps(local, timezone, nonexistent='raise')
+
+
+def test_local_round_trip():
+    np = pytest.importorskip('numpy')
+    timestamps = np.arange(1583600000, 1604300000, 1799)
+    for timezone in timezones:
+        local = tooltime.timestamps_to_local(timestamps, timezone)
+        earliest = tooltime.local_to_timestamps(local, timezone)
+        latest = tooltime.local_to_timestamps(
+            local, timezone, ambiguous='latest'
+        )
+        assert ((earliest == timestamps) | (latest == timestamps)).all()
+        assert tooltime.local_to_timestamps(int(local[100]), timezone) == int(
+            earliest[100]
+        )
+
+
+# order: [timestamp, interval, timezone, floor, ceiling]
+local_truncate_tests = [
+    [
+        '2020-09-13T02:26:40Z',
+        '1d',
+        'America/New_York',
+        '2020-09-12T04:00:00Z',
+        '2020-09-13T04:00:00Z',
+    ],
+    # day containing start of daylight saving time is 23 hours long
+    [
+        '2020-03-08T12:00:00Z',
+        '1d',
+        'America/New_York',
+        '2020-03-08T05:00:00Z',
+        '2020-03-09T04:00:00Z',
+    ],
+    # second occurrence of 01:30 stays within the repeated hour
+    [
+        '2020-11-01T06:30:00Z',
+        '1h',
+        'America/New_York',
+        '2020-11-01T06:00:00Z',
+        '2020-11-01T07:00:00Z',
+    ],
+    [
+        '2020-09-16T12:26:40Z',
+        'week',
+        'Europe/London',
+        '2020-09-12T23:00:00Z',
+        '2020-09-19T23:00:00Z',
+    ],
+    [
+        '2020-09-13T12:26:40Z',
+        '1M',
+        'Australia/Sydney',
+        '2020-08-31T14:00:00Z',
+        '2020-09-30T14:00:00Z',
+    ],
+    [
+        '2020-09-13T12:26:40Z',
+        '15m',
+        'Asia/Kolkata',
+        '2020-09-13T12:15:00Z',
+        '2020-09-13T12:30:00Z',
+    ],
+]
+
+
+@pytest.mark.parametrize('test', local_truncate_tests)
+def test_truncate_timestamp_local(test):
+    timestamp, interval, timezone, floor, ceiling = test
+    kwargs = {'timezone': timezone}
+    assert tooltime.floor_timestamp(timestamp, interval, **kwargs) == floor
+    assert tooltime.ceiling_timestamp(timestamp, interval, **kwargs) == ceiling
+
+
+@pytest.mark.parametrize('test', local_truncate_tests)
+def test_truncate_timestamps_local_vectorized(test):
+    np = pytest.importorskip('numpy')
+    timestamp, interval, timezone, *_ = test
+    seconds = tooltime.timestamp_to_seconds(timestamp)
+    timestamps = np.array([seconds - 1, seconds, seconds + 0.5, seconds + 1])
+    for direction in ['floor', 'ceiling', 'round']:
+        actual = tooltime.truncate_timestamps(
+            timestamps, interval, direction, timezone=timezone
+        )
+        target = [
+            tooltime.truncate_timestamp_seconds(
+                t, interval, direction, timezone=timezone
+            )
+            for t in timestamps
+        ]
+        assert actual.tolist() == target
+
+
+def test_floor_timestamps_local_day_matches_zoneinfo():
+    np = pytest.importorskip('numpy')
+    timestamps = np.arange(1577836800, 1609459200, 3607)
+    for timezone in timezones:
+        tzinfo = zoneinfo.ZoneInfo(timezone)
+        target = []
+        for t in timestamps.tolist():
+            dt = datetime.datetime.fromtimestamp(t, tzinfo)
+            midnight = datetime.datetime(
+                dt.year, dt.month, dt.day, tzinfo=tzinfo
+            )
+            target.append(int(midnight.timestamp()))
+        actual = tooltime.floor_timestamps(timestamps, '1d', timezone=timezone)
+        assert actual.tolist() == target
+
+
+def test_calendar_components_local():
+    np = pytest.importorskip('numpy')
+    timestamps = np.arange(1577836800, 1609459200, 7919)
+    timezone = 'Europe/London'
+    tzinfo = zoneinfo.ZoneInfo(timezone)
+    components = tooltime.get_calendar_components(
+        timestamps, ['day', 'hour'], timezone=timezone
+    )
+    for i, t in enumerate(timestamps.tolist()):
+        dt = datetime.datetime.fromtimestamp(t, tzinfo)
+        assert components['day'][i] == dt.day
+        assert components['hour'][i] == dt.hour
+
+
+def test_bucketer_local():
+    np = pytest.importorskip('numpy')
+    timestamps = np.arange(1577836800, 1609459200, 3607)
+    timezone = 'America/New_York'
+    bucketer = tooltime.Bucketer('1d', timezone=timezone)
+    starts = bucketer.starts(timestamps)
+    ends = bucketer.ends(timestamps)
+    assert starts.tolist() == (
+        tooltime.floor_timestamps(timestamps, '1d', timezone=timezone).tolist()
+    )
+    next_starts = tooltime.floor_timestamps(
+        starts + 36 * 3600, '1d', timezone=timezone
+    )
+    assert (ends + 1).tolist() == next_starts.tolist()
+    assert set((next_starts - starts).tolist()) == {
+        23 * 3600,
+        24 * 3600,
+        25 * 3600,
+    }
+    assert bucketer.start(int(timestamps[5])) == starts[5]
+    assert bucketer.end(int(timestamps[5])) == ends[5]
+    assert bucketer.index(int(timestamps[5])) == bucketer.indices(timestamps)[5]
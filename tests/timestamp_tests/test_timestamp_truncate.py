@@ -0,0 +1,124 @@
+import pytest
+
+import tooltime
+
+
+# order: [timestamp, interval, floor, ceiling, round]
+truncate_tests = [
+    [
+        '2020-09-13T12:26:40Z',
+        '15m',
+        '2020-09-13T12:15:00Z',
+        '2020-09-13T12:30:00Z',
+        '2020-09-13T12:30:00Z',
+    ],
+    [
+        '2020-09-13T12:26:40Z',
+        '4h',
+        '2020-09-13T12:00:00Z',
+        '2020-09-13T16:00:00Z',
+        '2020-09-13T12:00:00Z',
+    ],
+    [
+        '2020-09-13T12:26:40Z',
+        'day',
+        '2020-09-13T00:00:00Z',
+        '2020-09-14T00:00:00Z',
+        '2020-09-14T00:00:00Z',
+    ],
+    [
+        '2020-09-16T12:26:40Z',
+        'week',
+        '2020-09-13T00:00:00Z',
+        '2020-09-20T00:00:00Z',
+        '2020-09-20T00:00:00Z',
+    ],
+    [
+        '2020-09-13T12:26:40Z',
+        '1M',
+        '2020-09-01T00:00:00Z',
+        '2020-10-01T00:00:00Z',
+        '2020-09-01T00:00:00Z',
+    ],
+    [
+        '2020-09-13T12:26:40Z',
+        '1q',
+        '2020-07-01T00:00:00Z',
+        '2020-10-01T00:00:00Z',
+        '2020-10-01T00:00:00Z',
+    ],
+    [
+        '2020-09-13T12:26:40Z',
+        '3M',
+        '2020-07-01T00:00:00Z',
+        '2020-10-01T00:00:00Z',
+        '2020-10-01T00:00:00Z',
+    ],
+    [
+        '2020-09-13T12:26:40Z',
+        'year',
+        '2020-01-01T00:00:00Z',
+        '2021-01-01T00:00:00Z',
+        '2021-01-01T00:00:00Z',
+    ],
+    [
+        '2020-01-01T00:00:00Z',
+        '1y',
+        '2020-01-01T00:00:00Z',
+        '2020-01-01T00:00:00Z',
+        '2020-01-01T00:00:00Z',
+    ],
+    [
+        '1969-12-31T23:59:59Z',
+        '1M',
+        '1969-12-01T00:00:00Z',
+        '1970-01-01T00:00:00Z',
+        '1970-01-01T00:00:00Z',
+    ],
+]
+
+
+@pytest.mark.parametrize('test', truncate_tests)
+def test_truncate_timestamp(test):
+    timestamp, interval, floor, ceiling, rounded = test
+    assert tooltime.floor_timestamp(timestamp, interval) == floor
+    assert tooltime.ceiling_timestamp(timestamp, interval) == ceiling
+    assert tooltime.round_timestamp(timestamp, interval) == rounded
+
+
+@pytest.mark.parametrize('test', truncate_tests)
+def test_truncate_timestamps_vectorized(test):
+    np = pytest.importorskip('numpy')
+    timestamp, interval, *_ = test
+    seconds = tooltime.timestamp_to_seconds(timestamp)
+    timestamps = np.array([seconds - 1, seconds, seconds + 0.5, seconds + 1])
+    for direction in ['floor', 'ceiling', 'round']:
+        actual = tooltime.truncate_timestamps(timestamps, interval, direction)
+        target = [
+            tooltime.truncate_timestamp_seconds(t, interval, direction)
+            for t in timestamps
+        ]
+        assert actual.tolist() == target
+
+
+@pytest.mark.parametrize(
+    'test',
+    [
+        ['15m', (15, 'm')],
+        ['quarter', (3, 'M')],
+        ['1h30m', (90, 'm')],
+        ['1.5h', (90, 'm')],
+        ['2 months', (2, 'M')],
+        ['30 days', (30, 'd')],
+    ],
+)
+def test_parse_interval_label(test):
+    interval, target = test
+    assert tooltime.parse_interval_label(interval) == target
+
+
+def test_parse_interval_label_invalid():
+    with pytest.raises(Exception, match='invalid interval'):
+        tooltime.parse_interval_label('1x')
+    with pytest.raises(Exception, match='must be whole seconds'):
+        tooltime.parse_interval_label('1.5s')
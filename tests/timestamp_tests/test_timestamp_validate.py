@@ -0,0 +1,72 @@
+import pytest
+
+import tooltime
+
+np = pytest.importorskip('numpy')
+
+
+# order: [timestamps, out_of_order_indices, max_backward_jump, duplicates]
+order_tests = [
+    [[1, 2, 3, 4], [], 0, []],
+    [[1, 2, 2, 3], [], 0, [2]],
+    [[1, 2, 2, 5, 3, 4, 6, 6, 0], [4, 5, 8], 6, [2, 7]],
+    [[5, 4, 4, 1], [1, 2, 3], 4, [2]],
+    [[10, 1, 2, 3, 11], [1, 2, 3], 9, []],
+    [[], [], 0, []],
+    [[7], [], 0, []],
+]
+
+
+@pytest.mark.parametrize('test', order_tests)
+def test_validate_timestamp_order(test):
+    timestamps, out_of_order, max_backward_jump, duplicates = test
+    report = tooltime.validate_timestamp_order(timestamps)
+    assert report['n_t'] == len(timestamps)
+    assert report['out_of_order_indices'].tolist() == out_of_order
+    assert report['n_out_of_order'] == len(out_of_order)
+    assert report['max_backward_jump'] == max_backward_jump
+    assert report['duplicate_indices'].tolist() == duplicates
+    assert report['n_duplicates'] == len(duplicates)
+    assert report['is_sorted'] == (timestamps == sorted(timestamps))
+    assert report['is_reverse_sorted'] == (
+        timestamps == sorted(timestamps, reverse=True)
+    )
+    assert report['is_strictly_increasing'] == (
+        report['is_sorted'] and len(set(timestamps)) == len(timestamps)
+    )
+
+
+@pytest.mark.parametrize('test', order_tests)
+def test_timestamp_order_validator(test):
+    timestamps = np.array(test[0], dtype=float)
+    target = tooltime.validate_timestamp_order(timestamps)
+    for n_chunks in [1, 2, 3, 5]:
+        validator = tooltime.TimestampOrderValidator()
+        for chunk in np.array_split(timestamps, n_chunks):
+            validator.update(chunk)
+        report = validator.result()
+        for key, value in target.items():
+            if isinstance(value, np.ndarray):
+                assert report[key].tolist() == value.tolist()  # type: ignore
+            else:
+                assert report[key] == value  # type: ignore
+
+
+def test_validate_timestamp_order_without_indices():
+    report = tooltime.validate_timestamp_order(
+        [3, 1, 2, 2], return_indices=False
+    )
+    assert report['out_of_order_indices'] is None
+    assert report['duplicate_indices'] is None
+    assert report['n_out_of_order'] == 3
+    assert report['n_duplicates'] == 1
+
+
+def test_summarize_unsorted_timestamps():
+    rng = np.random.default_rng(0)
+    timestamps = (1600000000 + np.arange(1000) * 60).tolist()
+    shuffled = rng.permutation(timestamps).tolist()
+    target = tooltime.summarize_timestamps(timestamps, stats_only=True)
+    assert tooltime.summarize_timestamps(shuffled, stats_only=True) == target
+    reverse = tooltime.summarize_timestamps(timestamps[::-1], stats_only=True)
+    assert reverse == target
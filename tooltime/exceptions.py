@@ -4,4 +4,6 @@ from __future__ import annotations
 class RepresentationDetectionException(Exception):
     """raised when time datatype representation could not be detected"""
 
-    pass
+
+class ConversionException(Exception):
+    """raised when time datatype could not be converted to a representation"""
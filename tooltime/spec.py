@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing_extensions import Literal, TypedDict
 
 import datetime
+import sys
 import typing
 
 
@@ -66,6 +67,21 @@ TimestampExtendedRepresentation = TimestampRepresentation
 
 TimestampSummary = typing.Dict[str, typing.Any]
 
+TruncationDirection = Literal['floor', 'ceiling', 'round']
+
+CalendarComponent = Literal[
+    'year',
+    'month',
+    'day',
+    'hour',
+    'minute',
+    'second',
+    'weekday',
+    'iso_week',
+    'iso_year',
+    'day_of_year',
+]
+
 
 #
 # # timelength
@@ -197,15 +213,35 @@ PluralTimeUnit = Literal[
 
 
 def to_numeric(value: typing.SupportsFloat) -> typing.Union[int, float]:
-    if hasattr(value, '__int__') and type(value).__name__.startswith('int'):
+    if is_int_scalar(value):
         return int(value)  # type: ignore
     else:
         return float(value)
 
 
+def is_int_scalar(value: typing.Any) -> bool:
+    """return whether value is python int or numpy integer scalar
+
+    - numpy is only checked if already imported, since otherwise no value
+      can be a numpy scalar
+    """
+    if isinstance(value, int):
+        return True
+    np = sys.modules.get('numpy')
+    return np is not None and isinstance(value, np.integer)
+
+
+def is_float_scalar(value: typing.Any) -> bool:
+    """return whether value is python float or numpy floating scalar"""
+    if isinstance(value, float):
+        return True
+    np = sys.modules.get('numpy')
+    return np is not None and isinstance(value, np.floating)
+
+
 def str_to_numeric(value: str) -> typing.Union[int, float]:
     try:
-        return int(value)
+        return int(value)  # type: ignore
     except Exception:
         return float(value)
 
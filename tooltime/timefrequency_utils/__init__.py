@@ -1,4 +1,7 @@
+from .timefrequency_cadences import *
 from .timefrequency_convert import *
 from .timefrequency_crud import *
+from .timefrequency_gaps import *
 from .timefrequency_identify import *
 from .timefrequency_resolution import *
+from .timefrequency_sketch import *
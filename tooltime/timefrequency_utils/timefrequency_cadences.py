@@ -0,0 +1,380 @@
+from __future__ import annotations
+
+import typing
+from typing_extensions import Literal, TypedDict
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+
+from .. import exceptions
+from .. import timelength_utils
+from . import timefrequency_resolution
+
+
+class TimeFrequencyCadence(TypedDict):
+    label: str | None
+    seconds: int | float
+    count: int
+    share: float
+
+
+class TimeFrequencyCadences(TypedDict):
+    cadences: typing.List[TimeFrequencyCadence]
+    n_dts: int
+    n_zero: int
+    n_unmatched: int
+    tolerance: float
+
+
+# multiples of each base unit that count as nice cadences
+_nice_multiples = {
+    '1s': [1, 2, 3, 5, 10, 15, 20, 30],
+    '1m': [1, 2, 3, 5, 10, 15, 20, 30],
+    '1h': [1, 2, 3, 4, 6, 8, 12],
+    '1d': [1, 2, 3],
+    '1w': [1, 2],
+    '1M': [1, 3, 6],
+    '1y': [1],
+}
+
+# sub-second cadences of bursts, which have no TimelengthLabel
+_nice_subsecond_seconds = [0.001, 0.01, 0.1, 0.25, 0.5]
+
+
+def get_nice_cadences() -> typing.Mapping[str, int]:
+    """return mapping {label: seconds} of nice cadences, in ascending order
+
+    - sub-second cadences have no label, so they are not included here
+    """
+    base_units = timelength_utils.get_base_units()
+    cadences = {}
+    for base_label, multiples in _nice_multiples.items():
+        for multiple in multiples:
+            label = str(multiple) + base_label[-1]
+            cadences[label] = multiple * base_units[base_label]
+    return dict(sorted(cadences.items(), key=lambda item: item[1]))
+
+
+def detect_cadences(
+    timestamps: typing.Sequence[typing.SupportsInt | typing.SupportsFloat]
+    | np.ndarray,
+    tolerance: float = 0.1,
+    min_share: float = 0.01,
+    sample_size: int | None = None,
+    sample_method: Literal['stride', 'random'] = 'stride',
+    random_seed: int | None = None,
+) -> TimeFrequencyCadences:
+    """detect every significant cadence of timestamps
+
+    - each dt is snapped to the nearest nice cadence (see get_nice_cadences)
+      if it is within tolerance of it, e.g. with tolerance 0.1, a 57s dt
+      counts as 1m and a 40s dt is unmatched
+    - bursts can also snap to sub-second cadences of 1, 10, 100, 250, or
+      500 milliseconds, which are reported by float seconds and label None
+    - returns cadences with at least min_share of dts, by descending share
+    - zero dts (duplicate timestamps) and unmatched dts are counted separately
+    - for large inputs, only sample_size dts can be examined, see
+      detect_resolution() for sampling methods and their error
+
+    ## Inputs
+    - timestamps: iterable or numpy array of timestamps in seconds
+    - tolerance: float of relative tolerance for snapping dts to cadences
+    - min_share: float minimum share of dts for cadence to be returned
+    - sample_size: int number of dts to sample
+    - sample_method: str of how to sample dts, 'stride' or 'random'
+    - random_seed: int seed for random sampling
+
+    ## Returns
+    - dict with cadences list, where each cadence has its label, seconds,
+      count of examined dts, and share of examined dts
+    """
+
+    try:
+        import numpy as np
+    except ImportError:
+        raise Exception('numpy required for cadence detection')
+
+    if isinstance(timestamps, np.ndarray):
+        timestamps_array = timestamps
+    else:
+        timestamps_array = np.array(timestamps)
+
+    nice_cadences = get_nice_cadences()
+    labels: list[str | None] = [None] * len(_nice_subsecond_seconds)
+    labels.extend(nice_cadences.keys())
+    cadence_seconds: list[int | float] = list(_nice_subsecond_seconds)
+    cadence_seconds.extend(nice_cadences.values())
+    seconds = np.array(cadence_seconds, dtype=np.float64)
+    log_seconds = np.log(seconds)
+
+    # count snapped sampled dts, or all dts in blocks to bound memory
+    counts = np.zeros(len(seconds), dtype=np.int64)
+    n_positive = 0
+    n_matched = 0
+    sampled_dts = timefrequency_resolution.sample_dts(
+        timestamps_array, sample_size, sample_method, random_seed
+    )
+    if sampled_dts is not None:
+        n_dts = len(sampled_dts)
+    else:
+        n_dts = max(len(timestamps_array) - 1, 0)
+    for dts in timefrequency_resolution.iter_dt_blocks(
+        timestamps_array, sampled_dts
+    ):
+        positive = np.abs(dts[dts != 0]).astype(np.float64)
+        nearest, matched = _snap_dts(positive, seconds, log_seconds, tolerance)
+        counts += np.bincount(nearest[matched], minlength=len(seconds))
+        n_positive += len(positive)
+        n_matched += int(np.count_nonzero(matched))
+
+    # collect significant cadences
+    cadences: typing.List[TimeFrequencyCadence] = []
+    for index in np.argsort(-counts, kind='stable').tolist():
+        count = int(counts[index])
+        if count == 0 or count < min_share * n_dts:
+            break
+        cadences.append(
+            {
+                'label': labels[index],
+                'seconds': cadence_seconds[index],
+                'count': count,
+                'share': count / n_dts,
+            }
+        )
+
+    return {
+        'cadences': cadences,
+        'n_dts': n_dts,
+        'n_zero': n_dts - n_positive,
+        'n_unmatched': n_positive - n_matched,
+        'tolerance': tolerance,
+    }
+
+
+def _snap_dts(
+    dts: np.ndarray,
+    seconds: np.ndarray,
+    log_seconds: np.ndarray,
+    tolerance: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """snap positive dts to index of nearest cadence in log space
+
+    ## Returns
+    - tuple of nearest cadence index and whether dt is within tolerance
+    """
+    import numpy as np
+
+    log_dts = np.log(dts)
+    upper = np.searchsorted(log_seconds, log_dts)
+    np.clip(upper, 1, len(seconds) - 1, out=upper)
+    lower = upper - 1
+    nearest = np.where(
+        log_dts - log_seconds[lower] < log_seconds[upper] - log_dts,
+        lower,
+        upper,
+    )
+    matched = np.abs(dts / seconds[nearest] - 1) <= tolerance
+    return nearest, matched
+
+
+class TimeFrequencySegment(TypedDict):
+    start: float
+    end: float
+    n_dts: int
+    median_dt: float
+    label: str | None
+
+
+def detect_cadence_changes(
+    timestamps: typing.Sequence[typing.SupportsInt | typing.SupportsFloat]
+    | np.ndarray,
+    window: int = 31,
+    change_rtol: float = 0.5,
+    min_segment: int | None = None,
+) -> typing.List[TimeFrequencySegment]:
+    """segment timestamps into contiguous regimes of stable cadence
+
+    ## Segmentation Algorithm
+    - compute the median of each centered rolling window of dts, which
+      ignores bursts and gaps shorter than half of the window
+    - split rolling medians into runs wherever consecutive rolling medians
+      differ by more than change_rtol of the smaller one
+    - start a new segment at each run of at least min_segment dts whose
+      rolling median is more than change_rtol outside of the interquartile
+      range of recent dts, which are the up to 4 * window dts of the current
+      segment before the run, e.g. with change_rtol 0.5
+      a switch from 1s to 100ms dts starts a new segment but jitter does not
+    - shorter runs are absorbed into the current segment, and a feed that
+      randomly mixes cadences is one segment because its interquartile range
+      spans each of the cadences
+    - gradual drift in cadence does not start new segments
+    - unsorted timestamps are sorted before segmenting
+
+    ## Complexity
+    - rolling medians use polars rolling_median() in O(n log window) if
+      polars is installed, otherwise numpy in O(n * window)
+    - quartiles of recent dts take O(window) per run of at least min_segment
+      dts, which is O(n) with the default min_segment, and are vectorized
+      except for runs within 4 * window dts after a segment boundary
+
+    ## Inputs
+    - timestamps: iterable or numpy array of timestamps in seconds
+    - window: int number of dts in each rolling window
+    - change_rtol: float relative change in rolling median that starts a
+      new segment
+    - min_segment: int minimum number of dts of a run that starts a new
+      segment, default is window
+
+    ## Returns
+    - list of segments in ascending order, each a TimeperiodMap whose start
+      and end are timestamps, with its number of dts, median dt, and
+      TimelengthLabel of median dt
+        - label is None if median dt has no TimelengthLabel, such as
+          sub-second dts like 100ms, use median_dt for these
+        - the end of each segment is the start of the next segment
+    """
+
+    try:
+        import numpy as np
+    except ImportError:
+        raise Exception('numpy required for cadence change detection')
+
+    if window < 1:
+        raise Exception('window must be positive')
+    if min_segment is None:
+        min_segment = window
+    if isinstance(timestamps, np.ndarray):
+        timestamps_array = timestamps
+    else:
+        timestamps_array = np.array(timestamps)
+    dts = np.diff(timestamps_array)
+    if (dts < 0).any():
+        timestamps_array = np.sort(timestamps_array)
+        dts = np.diff(timestamps_array)
+    if len(dts) == 0:
+        return []
+
+    # split rolling medians into runs of stable cadence
+    rolling = _rolling_median(dts, window)
+    previous = rolling[:-1]
+    current = rolling[1:]
+    changed = np.abs(current - previous) > change_rtol * np.minimum(
+        previous, current
+    )
+    run_starts = np.concatenate([[0], np.flatnonzero(changed) + 1])
+    run_ends = np.append(run_starts[1:], len(dts))
+
+    # start segments at long runs with cadence outside of recent dts
+    # - recent dts are the up to 4 * window dts of current segment before run
+    # - quartiles of recent dts are computed vectorized, and recomputed only
+    #   for runs whose recent dts are cut short by a previous boundary
+    recent_size = 4 * window
+    is_long = run_ends - run_starts >= min_segment
+    candidates = run_starts[is_long]
+    candidates = candidates[candidates >= min_segment]
+    levels = rolling[candidates]
+    lower, upper = _get_recent_quartiles(dts, candidates, recent_size)
+    is_outside = (levels * (1 + change_rtol) < lower) | (
+        levels > upper * (1 + change_rtol)
+    )
+    boundaries = [0]
+    for candidate, level, outside in zip(
+        candidates.tolist(), levels.tolist(), is_outside.tolist()
+    ):
+        if candidate - recent_size < boundaries[-1]:
+            if candidate - boundaries[-1] < min_segment:
+                continue
+            recent_lower, recent_upper = np.quantile(
+                dts[boundaries[-1] : candidate], [0.25, 0.75]
+            )
+            outside = level * (1 + change_rtol) < recent_lower or level > (
+                recent_upper * (1 + change_rtol)
+            )
+        if outside:
+            boundaries.append(candidate)
+    boundaries.append(len(dts))
+
+    segments: typing.List[TimeFrequencySegment] = []
+    for segment_start, segment_end in zip(boundaries[:-1], boundaries[1:]):
+        median_dt = float(
+            timefrequency_resolution.get_median_dt(
+                dts[segment_start:segment_end]
+            )
+        )
+        try:
+            label: str | None = timelength_utils.timelength_seconds_to_label(
+                median_dt
+            )
+        except exceptions.ConversionException:
+            label = None
+        segments.append(
+            {
+                'start': timestamps_array[segment_start].item(),
+                'end': timestamps_array[segment_end].item(),
+                'n_dts': segment_end - segment_start,
+                'median_dt': median_dt,
+                'label': label,
+            }
+        )
+    return segments
+
+
+def _rolling_median(values: np.ndarray, window: int) -> np.ndarray:
+    """compute centered rolling median, repeating edge medians
+
+    - uses polars if installed, otherwise numpy windows are computed in
+      blocks to bound temporary memory
+    """
+    import numpy as np
+
+    n = len(values)
+    if n <= window:
+        return np.full(n, np.median(values), dtype=np.float64)
+    try:
+        import polars as pl
+    except ImportError:
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+        medians = np.empty(len(windows), dtype=np.float64)
+        block_size = max(1, 2**22 // window)
+        for start in range(0, len(windows), block_size):
+            block = windows[start : start + block_size]
+            medians[start : start + block_size] = np.median(block, axis=1)
+    else:
+        trailing = pl.Series(values, dtype=pl.Float64).rolling_median(
+            window_size=window
+        )
+        medians = trailing.to_numpy()[window - 1 :]
+    half = (window - 1) // 2
+    return np.concatenate(
+        [
+            np.full(half, medians[0]),
+            medians,
+            np.full(n - len(medians) - half, medians[-1]),
+        ]
+    )
+
+
+def _get_recent_quartiles(
+    values: np.ndarray, ends: np.ndarray, size: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """compute quartiles of values[end - size:end] for each end >= size
+
+    - windows are gathered in blocks to bound temporary memory
+    """
+    import numpy as np
+
+    lower = np.full(len(ends), np.nan)
+    upper = np.full(len(ends), np.nan)
+    full = np.flatnonzero(ends >= size)
+    if len(full) == 0:
+        return lower, upper
+    windows = np.lib.stride_tricks.sliding_window_view(values, size)
+    block_size = max(1, 2**22 // size)
+    for start in range(0, len(full), block_size):
+        block = full[start : start + block_size]
+        quartiles = np.quantile(
+            windows[ends[block] - size], [0.25, 0.75], axis=1
+        )
+        lower[block] = quartiles[0]
+        upper[block] = quartiles[1]
+    return lower, upper
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import typing
+from typing_extensions import TypedDict
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+
+from .. import spec
+from .. import timelength_utils
+from . import timefrequency_resolution
+
+
+class TimeFrequencyGaps(TypedDict):
+    start: np.ndarray
+    end: np.ndarray
+    n_missing: np.ndarray
+    cadence: float
+    gap_rtol: float
+
+
+def detect_gaps(
+    timestamps: typing.Sequence[typing.SupportsInt | typing.SupportsFloat]
+    | np.ndarray,
+    cadence: spec.Timelength | None = None,
+    gap_rtol: float = 0.5,
+) -> TimeFrequencyGaps:
+    """detect gaps in timestamps that exceed expected cadence
+
+    ## Gap Definition
+    - a gap is a dt larger than cadence * (1 + gap_rtol)
+    - gap start is the last timestamp before the gap, gap end is the first
+      timestamp after the gap, no timestamps lie strictly between them
+    - n_missing is the number of cadence steps that fit in the gap, at least 1
+    - unsorted timestamps are sorted before detecting gaps
+
+    ## Inputs
+    - timestamps: iterable or numpy array of timestamps in seconds
+    - cadence: expected spacing between timestamps as Timelength, default is
+      median dt as in detect_resolution()
+    - gap_rtol: float of tolerance above cadence before dt counts as gap
+
+    ## Returns
+    - dict with start, end, and n_missing arrays, each with one entry per gap
+    """
+
+    try:
+        import numpy as np
+    except ImportError:
+        raise Exception('numpy required for gap detection')
+
+    if isinstance(timestamps, np.ndarray):
+        timestamps_array = timestamps
+    else:
+        timestamps_array = np.array(timestamps)
+
+    dts = np.diff(timestamps_array)
+    if (dts < 0).any():
+        timestamps_array = np.sort(timestamps_array)
+        dts = np.diff(timestamps_array)
+
+    # determine cadence
+    if cadence is not None:
+        cadence_seconds = timelength_utils.timelength_to_seconds(cadence)
+    elif len(timestamps_array) > 1:
+        cadence_seconds = timefrequency_resolution.get_median_dt(dts)
+    else:
+        raise Exception('need at least 2 timestamps to detect cadence')
+    if cadence_seconds <= 0:
+        raise Exception('cadence must be positive')
+
+    # locate gaps
+    gap_indices = np.flatnonzero(dts > (1 + gap_rtol) * cadence_seconds)
+    gap_dts = dts[gap_indices]
+    n_missing = np.rint(gap_dts / cadence_seconds).astype(np.int64) - 1
+    np.maximum(n_missing, 1, out=n_missing)
+
+    return {
+        'start': timestamps_array[gap_indices],
+        'end': timestamps_array[gap_indices + 1],
+        'n_missing': n_missing,
+        'cadence': float(cadence_seconds),
+        'gap_rtol': gap_rtol,
+    }
@@ -1,32 +1,74 @@
 from __future__ import annotations
 
+import math
 import typing
-from typing_extensions import TypedDict
+from typing_extensions import Literal, NotRequired, TypedDict
 
 if typing.TYPE_CHECKING:
     import numpy as np
 
 from .. import timelength_utils
+from . import timefrequency_sketch
 
 
 class TimeFrequencyResolution(TypedDict):
     label: str
-    dts: typing.Sequence[typing.SupportsInt | typing.SupportsFloat]
+    dts: typing.Sequence[typing.SupportsInt | typing.SupportsFloat] | None
     use_n: int | None
     median_dt: float
+    dispersion: TimeFrequencyDispersion
     outliers: TimeFrequencyResolutionOutliers
+    quantiles: NotRequired[typing.Dict[float, float]]
+
+
+class TimeFrequencyDispersion(TypedDict):
+    q1: float | None
+    q3: float | None
+    iqr: float | None
+    mad: float | None
 
 
 class TimeFrequencyResolutionOutliers(TypedDict):
-    small: np.ndarray
-    large: np.ndarray
+    small: np.ndarray | None
+    large: np.ndarray | None
+    small_indices: np.ndarray | None
+    large_indices: np.ndarray | None
+    small_timestamps: np.ndarray | None
+    large_timestamps: np.ndarray | None
+    n_small: int
+    n_large: int
+    method: OutlierMethod
+    threshold: float
+    lower: float
+    upper: float
     outlier_rtol: float
 
 
+OutlierMethod = Literal['rtol', 'mad', 'iqr']
+
+# default outlier threshold of each outlier method
+_default_outlier_thresholds = {'rtol': 0.5, 'mad': 3.0, 'iqr': 1.5}
+
+# scale factor making MAD a consistent estimator of normal standard deviation
+_mad_scale = 1.4826
+
+# minimum spread of 'mad' and 'iqr' bounds, relative to median dt
+_min_relative_spread = 0.05
+
+
 def detect_resolution(
     timestamps: typing.Sequence[typing.SupportsInt | typing.SupportsFloat],
     use_n: int | None = None,
     outlier_rtol: float = 0.5,
+    stats_only: bool = False,
+    outlier_method: OutlierMethod = 'rtol',
+    outlier_threshold: float | None = None,
+    approximate: bool = False,
+    quantiles: typing.Sequence[float] = (0.01, 0.5, 0.99),
+    sample_size: int | None = None,
+    sample_method: Literal['stride', 'random'] = 'stride',
+    relative_accuracy: float = 0.01,
+    random_seed: int | None = None,
 ) -> TimeFrequencyResolution | None:
     """detect resolution of iterable of Timestamps
 
@@ -34,11 +76,57 @@ def detect_resolution(
     - current algorithm: whether median dt value is close to a known value
     - dts that are +- 50% of this median are returned in 'outliers' key
 
+    ## Outlier Scoring
+    - 'dispersion' key has robust dispersion of dts: quartiles q1 and q3,
+      interquartile range iqr, and median absolute deviation mad
+    - outlier_method determines bounds outside of which dts are outliers
+        - 'rtol': [median / (1 + rtol), median * (1 + rtol)], rtol defaults
+          to outlier_rtol
+        - 'mad': median +- threshold * 1.4826 * mad, threshold defaults to 3
+        - 'iqr': [q1 - threshold * iqr, q3 + threshold * iqr], threshold
+          defaults to 1.5
+        - 1.4826 * mad and iqr are at least 5% of median dt, since both are 0
+          for feeds whose dts are mostly identical, which would otherwise
+          flag any jitter or float noise as outliers
+    - outlier dt i spans from timestamp i to timestamp i + 1, 'outliers'
+      has the indices i and timestamps i of small and large outlier dts, so
+      that offending rows can be located directly
+
+    ## Approximate Mode
+    - with approximate=True, dts are counted in a QuantileSketch instead of
+      being partially sorted by np.median(), using memory bounded by the log
+      of the range of dts and processing dts in fixed-size blocks
+    - output has stats_only format plus 'quantiles' key of estimated quantiles
+    - with sample_size, only that many dts are read, either every k-th dt
+      ('stride') or uniformly random dts ('random')
+        - stride is deterministic but can alias with periodic patterns
+        - random uses random_seed for reproducibility
+    - error bounds:
+        - each quantile is within relative_accuracy of the exact quantile of
+          the dts that were read, and is exact if its bucket holds one value
+        - sampling m dts adds rank error of about sqrt(q * (1 - q) / m), e.g.
+          +-0.16% of rank for the median of 100,000 random samples
+        - outlier counts are scaled up from sampled dts, and dts within
+          relative_accuracy of an outlier threshold may be misclassified
+    - mad requires a second pass over dts and is only computed when
+      outlier_method is 'mad', and outlier indices are not computed
+
     ## Inputs
     - timestamps: iterable of Timestamp
     - use_n: int or None, indicating number of timestamp values to use
         - smaller n will be faster but could be less representative
     - outlier_rtol: float of tolerance for detecting outliers
+    - stats_only: bool of whether to omit dts and outlier arrays, keeping
+      only scalar statistics and outlier counts so that output size does not
+      depend on the number of timestamps
+    - outlier_method: str of how to score outliers, 'rtol', 'mad', or 'iqr'
+    - outlier_threshold: float threshold of outlier_method
+    - approximate: bool of whether to estimate quantiles with a sketch
+    - quantiles: quantiles of dts to estimate in approximate mode
+    - sample_size: int number of dts to sample in approximate mode
+    - sample_method: str of how to sample dts, 'stride' or 'random'
+    - relative_accuracy: float relative accuracy of approximate quantiles
+    - random_seed: int seed for random sampling
     """
 
     try:
@@ -57,21 +145,332 @@ def detect_resolution(
     if use_n is not None:
         timestamps_array = timestamps_array[:use_n]
 
-    # compute time deltas
+    if approximate:
+        return _detect_resolution_approximate(
+            timestamps_array,
+            use_n=use_n,
+            outlier_rtol=outlier_rtol,
+            outlier_method=outlier_method,
+            outlier_threshold=outlier_threshold,
+            quantiles=quantiles,
+            sample_size=sample_size,
+            sample_method=sample_method,
+            relative_accuracy=relative_accuracy,
+            random_seed=random_seed,
+        )
+
+    # compute time deltas and their robust dispersion
     dts = timestamps_array[1:] - timestamps_array[:-1]
-    median_dt = np.median(dts)
-    outliers: TimeFrequencyResolutionOutliers = {
-        'small': dts[dts < 1 / (1 + outlier_rtol) * median_dt],
-        'large': dts[dts > (1 + outlier_rtol) * median_dt],
-        'outlier_rtol': outlier_rtol,
+    q1, median_dt, q3 = _get_quantiles(dts, [0.25, 0.5, 0.75])
+    mad = _get_mad(dts, median_dt)
+    dispersion: TimeFrequencyDispersion = {
+        'q1': float(q1),
+        'q3': float(q3),
+        'iqr': float(q3 - q1),
+        'mad': float(mad),
     }
 
+    # score outliers
+    threshold, lower, upper = get_dt_outlier_bounds(
+        outlier_method, outlier_threshold, outlier_rtol, median_dt, dispersion
+    )
+    small_mask = dts < lower
+    large_mask = dts > upper
+    outliers: TimeFrequencyResolutionOutliers
+    if stats_only:
+        outliers = {
+            'small': None,
+            'large': None,
+            'small_indices': None,
+            'large_indices': None,
+            'small_timestamps': None,
+            'large_timestamps': None,
+            'n_small': int(np.count_nonzero(small_mask)),
+            'n_large': int(np.count_nonzero(large_mask)),
+            'method': outlier_method,
+            'threshold': threshold,
+            'lower': lower,
+            'upper': upper,
+            'outlier_rtol': outlier_rtol,
+        }
+    else:
+        small_indices = np.flatnonzero(small_mask)
+        large_indices = np.flatnonzero(large_mask)
+        outliers = {
+            'small': dts[small_indices],
+            'large': dts[large_indices],
+            'small_indices': small_indices,
+            'large_indices': large_indices,
+            'small_timestamps': timestamps_array[small_indices],
+            'large_timestamps': timestamps_array[large_indices],
+            'n_small': len(small_indices),
+            'n_large': len(large_indices),
+            'method': outlier_method,
+            'threshold': threshold,
+            'lower': lower,
+            'upper': upper,
+            'outlier_rtol': outlier_rtol,
+        }
+
     label = timelength_utils.timelength_seconds_to_label(median_dt)
 
     return {
         'label': label,
-        'dts': dts,
+        'dts': None if stats_only else dts,
         'use_n': use_n,
         'median_dt': median_dt,
+        'dispersion': dispersion,
         'outliers': outliers,
     }
+
+
+def get_dt_outlier_bounds(
+    outlier_method: OutlierMethod,
+    outlier_threshold: float | None,
+    outlier_rtol: float,
+    median_dt: float,
+    dispersion: TimeFrequencyDispersion,
+) -> tuple[float, float, float]:
+    """get threshold and lower and upper bounds of non-outlier dts
+
+    ## Inputs
+    - outlier_method: str of 'rtol', 'mad', or 'iqr'
+    - outlier_threshold: float threshold of outlier_method, or None for the
+      default threshold of outlier_method
+    - outlier_rtol: float threshold of 'rtol' if outlier_threshold is None
+    - median_dt: float median of dts
+    - dispersion: TimeFrequencyDispersion of dts
+
+    ## Returns
+    - tuple of float threshold, lower bound, and upper bound
+    """
+    if outlier_method not in _default_outlier_thresholds:
+        raise Exception('unknown outlier_method: ' + str(outlier_method))
+    if outlier_threshold is not None:
+        threshold = outlier_threshold
+    elif outlier_method == 'rtol':
+        threshold = outlier_rtol
+    else:
+        threshold = _default_outlier_thresholds[outlier_method]
+
+    if outlier_method == 'rtol':
+        lower = 1 / (1 + threshold) * median_dt
+        upper = (1 + threshold) * median_dt
+    elif outlier_method == 'mad':
+        mad = dispersion['mad']
+        if mad is None:
+            raise Exception('mad not computed')
+        spread = max(_mad_scale * mad, _min_relative_spread * median_dt)
+        lower = median_dt - threshold * spread
+        upper = median_dt + threshold * spread
+    elif outlier_method == 'iqr':
+        q1 = dispersion['q1']
+        q3 = dispersion['q3']
+        if q1 is None or q3 is None:
+            raise Exception('quartiles not computed')
+        spread = max(q3 - q1, _min_relative_spread * median_dt)
+        lower = q1 - threshold * spread
+        upper = q3 + threshold * spread
+    return float(threshold), float(lower), float(upper)
+
+
+def _detect_resolution_approximate(
+    timestamps_array: np.ndarray,
+    use_n: int | None,
+    outlier_rtol: float,
+    outlier_method: OutlierMethod,
+    outlier_threshold: float | None,
+    quantiles: typing.Sequence[float],
+    sample_size: int | None,
+    sample_method: Literal['stride', 'random'],
+    relative_accuracy: float,
+    random_seed: int | None,
+) -> TimeFrequencyResolution:
+    import numpy as np
+
+    # sketch sampled dts, or all dts in blocks to bound temporary memory
+    sketch = timefrequency_sketch.QuantileSketch(relative_accuracy)
+    n_dts = len(timestamps_array) - 1
+    sampled_dts = sample_dts(
+        timestamps_array, sample_size, sample_method, random_seed
+    )
+    for block in iter_dt_blocks(timestamps_array, sampled_dts):
+        sketch.update(block)
+
+    # estimate dispersion, with second pass over dts for mad if needed
+    median_dt = sketch.median()
+    q1 = sketch.quantile(0.25)
+    q3 = sketch.quantile(0.75)
+    if outlier_method == 'mad':
+        deviation_sketch = timefrequency_sketch.QuantileSketch(
+            relative_accuracy
+        )
+        for block in iter_dt_blocks(timestamps_array, sampled_dts):
+            deviation_sketch.update(np.abs(block - median_dt))
+        mad: float | None = deviation_sketch.median()
+    else:
+        mad = None
+    dispersion: TimeFrequencyDispersion = {
+        'q1': q1,
+        'q3': q3,
+        'iqr': q3 - q1,
+        'mad': mad,
+    }
+
+    # scale outlier counts from sampled dts to all dts
+    threshold, lower, upper = get_dt_outlier_bounds(
+        outlier_method, outlier_threshold, outlier_rtol, median_dt, dispersion
+    )
+    scale = n_dts / sketch.n
+    n_small = sketch.count_below(lower)
+    n_large = sketch.count_above(upper)
+    label = timelength_utils.timelength_seconds_to_label(
+        median_dt, fuzzy_tolerance=relative_accuracy
+    )
+
+    return {
+        'label': label,
+        'dts': None,
+        'use_n': use_n,
+        'median_dt': median_dt,
+        'dispersion': dispersion,
+        'outliers': {
+            'small': None,
+            'large': None,
+            'small_indices': None,
+            'large_indices': None,
+            'small_timestamps': None,
+            'large_timestamps': None,
+            'n_small': round(n_small * scale),
+            'n_large': round(n_large * scale),
+            'method': outlier_method,
+            'threshold': threshold,
+            'lower': lower,
+            'upper': upper,
+            'outlier_rtol': outlier_rtol,
+        },
+        'quantiles': {q: sketch.quantile(q) for q in quantiles},
+    }
+
+
+def sample_dts(
+    timestamps_array: np.ndarray,
+    sample_size: int | None,
+    sample_method: Literal['stride', 'random'],
+    random_seed: int | None,
+) -> np.ndarray | None:
+    """sample dts of timestamps, or return None if all dts should be used
+
+    ## Inputs
+    - timestamps_array: numpy array of sorted timestamps in seconds
+    - sample_size: int number of dts to sample, or None to use all dts
+    - sample_method: str of 'stride' or 'random'
+    - random_seed: int seed of 'random' sample_method
+
+    ## Returns
+    - numpy array of sampled dts, or None if sample_size covers all dts
+    """
+    import numpy as np
+
+    n_dts = len(timestamps_array) - 1
+    if sample_size is None or sample_size >= n_dts:
+        return None
+    if sample_size <= 0:
+        raise Exception('sample_size must be positive')
+    if sample_method == 'stride':
+        indices = np.arange(sample_size) * (n_dts // sample_size)
+    elif sample_method == 'random':
+        rng = np.random.default_rng(random_seed)
+        indices = np.sort(rng.integers(0, n_dts, size=sample_size))
+    else:
+        raise Exception('unknown sample_method: ' + str(sample_method))
+    return timestamps_array[indices + 1] - timestamps_array[indices]
+
+
+def iter_dt_blocks(
+    timestamps_array: np.ndarray,
+    sampled_dts: np.ndarray | None,
+    block_size: int = 2**20,
+) -> typing.Iterator[np.ndarray]:
+    """iterate sampled dts, or all dts in blocks to bound temporary memory
+
+    ## Inputs
+    - timestamps_array: numpy array of sorted timestamps in seconds
+    - sampled_dts: numpy array of sampled dts from sample_dts(), or None
+    - block_size: int number of dts in each block
+
+    ## Returns
+    - iterator of numpy arrays of dts
+    """
+    import numpy as np
+
+    if sampled_dts is not None:
+        yield sampled_dts
+    else:
+        n_dts = len(timestamps_array) - 1
+        for start in range(0, n_dts, block_size):
+            yield np.diff(timestamps_array[start : start + block_size + 1])
+
+
+def get_median_dt(dts: np.ndarray) -> typing.Any:
+    """compute median of dts, equal to np.median(dts)
+
+    faster than np.median() when many dts equal the median, such as for
+    regular timestamps
+
+    ## Inputs
+    - dts: numpy array of dts
+
+    ## Returns
+    - median of dts
+    """
+    return _get_quantiles(dts, [0.5])[0]
+
+
+def _get_quantiles(
+    values: np.ndarray, qs: typing.Sequence[float]
+) -> typing.List[typing.Any]:
+    """compute np.quantile(values, qs), with fast path for repeated values
+
+    - regular timestamps usually have a dominant dt that is the median and
+      quartiles of dts
+    - checking a sampled candidate takes two vectorized passes, much faster
+      than the partial sort of np.quantile(), and equal candidates of
+      different quantiles share their passes
+    """
+    import numpy as np
+
+    n = len(values)
+    if n < 1000:
+        return list(np.quantile(values, qs))
+    candidates = np.quantile(values[:: max(1, n // 1001)], qs).tolist()
+    ranks: typing.Dict[float, typing.Tuple[int, int]] = {}
+    result: typing.List[typing.Any] = []
+    for q, candidate in zip(qs, candidates):
+        if candidate not in ranks:
+            ranks[candidate] = (
+                int(np.count_nonzero(values < candidate)),
+                int(np.count_nonzero(values == candidate)),
+            )
+        n_less, n_equal = ranks[candidate]
+        position = q * (n - 1)
+        if n_less <= math.floor(position) and n_less + n_equal > math.ceil(
+            position
+        ):
+            result.append(np.float64(candidate))
+        else:
+            result.append(np.quantile(values, q))
+    return result
+
+
+def _get_mad(values: np.ndarray, median: float) -> typing.Any:
+    """compute median absolute deviation of values from their median
+
+    - mad is 0 if more than half of values equal the median, which is
+      common for regular dts and avoids computing deviations
+    """
+    import numpy as np
+
+    if np.count_nonzero(values == median) > len(values) // 2:
+        return np.float64(0)
+    return get_median_dt(np.abs(values - median))
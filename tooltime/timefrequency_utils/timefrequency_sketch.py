@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import math
+import typing
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+
+
+class QuantileSketch:
+    """mergeable quantile sketch with relative accuracy guarantee
+
+    - values are counted in logarithmically spaced buckets, as in DDSketch
+    - every quantile estimate is within relative_accuracy of the exact
+      quantile of the values added, e.g. 0.01 -> 60s is estimated as 60s +- 0.6s
+    - buckets that hold a single distinct value (such as a regular cadence)
+      remember that value, so quantiles falling in them are exact
+    - memory grows with the log of the range of values, not with their count
+    - sketches with equal relative_accuracy can be merged losslessly
+
+    ## Example Usage
+    sketch = tooltime.QuantileSketch()
+    sketch.update(np.diff(timestamps))
+    sketch.quantile(0.5)
+    """
+
+    __slots__ = (
+        '_log_gamma',
+        '_negative',
+        '_positive',
+        'gamma',
+        'n',
+        'n_zero',
+        'relative_accuracy',
+    )
+
+    relative_accuracy: float
+    gamma: float
+    n: int
+    n_zero: int
+    _log_gamma: float
+    _positive: dict[int, list[typing.Any]]
+    _negative: dict[int, list[typing.Any]]
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        """create QuantileSketch
+
+        ## Inputs
+        - relative_accuracy: maximum relative error of quantile estimates
+        """
+        if not 0 < relative_accuracy < 1:
+            raise Exception('relative_accuracy must be between 0 and 1')
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.n = 0
+        self.n_zero = 0
+        self._positive = {}
+        self._negative = {}
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __repr__(self) -> str:
+        return (
+            'QuantileSketch(n='
+            + str(self.n)
+            + ', relative_accuracy='
+            + str(self.relative_accuracy)
+            + ')'
+        )
+
+    #
+    # # building sketch
+    #
+
+    def update(
+        self,
+        values: typing.Sequence[int | float] | np.ndarray,
+        counts: typing.Sequence[int] | np.ndarray | None = None,
+    ) -> QuantileSketch:
+        """add values to sketch
+
+        ## Inputs
+        - values: iterable or numpy array of values, nan values are ignored
+        - counts: optional int number of occurrences of each value
+
+        ## Returns
+        - this sketch, for chaining
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise Exception('numpy required for QuantileSketch')
+
+        values_array = np.asarray(values, dtype=np.float64)
+        if counts is None:
+            counts_array = None
+        else:
+            counts_array = np.asarray(counts, dtype=np.int64)
+        if np.isnan(values_array).any():
+            keep = ~np.isnan(values_array)
+            values_array = values_array[keep]
+            if counts_array is not None:
+                counts_array = counts_array[keep]
+
+        if counts_array is None:
+            self.n += len(values_array)
+        else:
+            self.n += int(counts_array.sum())
+        if len(values_array) == 0:
+            return self
+        if values_array.min() > 0:
+            # common case of positive dts, avoid masking
+            self._add_magnitudes(self._positive, values_array, counts_array)
+            return self
+
+        for buckets, mask in [
+            (self._positive, values_array > 0),
+            (self._negative, values_array < 0),
+        ]:
+            magnitudes = np.abs(values_array[mask])
+            if len(magnitudes) > 0:
+                weights = None if counts_array is None else counts_array[mask]
+                self._add_magnitudes(buckets, magnitudes, weights)
+        zero_mask = values_array == 0
+        if counts_array is None:
+            self.n_zero += int(np.count_nonzero(zero_mask))
+        else:
+            self.n_zero += int(counts_array[zero_mask].sum())
+        return self
+
+    def _add_magnitudes(
+        self,
+        buckets: dict[int, list[typing.Any]],
+        magnitudes: np.ndarray,
+        weights: np.ndarray | None,
+    ) -> None:
+        import numpy as np
+
+        keys = np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64)
+        low = int(keys.min())
+        offsets = keys - low
+        size = int(offsets.max()) + 1
+        bucket_counts = np.bincount(offsets, weights=weights, minlength=size)
+
+        # detect buckets holding one distinct value, which are kept exact
+        bucket_values = np.zeros(size)
+        bucket_values[offsets] = magnitudes
+        n_differing = np.bincount(
+            offsets,
+            weights=magnitudes != bucket_values[offsets],
+            minlength=size,
+        )
+
+        for offset in np.flatnonzero(bucket_counts).tolist():
+            key = low + offset
+            count = int(bucket_counts[offset])
+            if n_differing[offset] == 0:
+                bucket_min = bucket_max = float(bucket_values[offset])
+            else:
+                bucket_min = self.gamma ** (key - 1)
+                bucket_max = self.gamma**key
+            self._add_bucket(buckets, key, count, bucket_min, bucket_max)
+
+    def _add_bucket(
+        self,
+        buckets: dict[int, list[typing.Any]],
+        key: int,
+        count: int,
+        bucket_min: float,
+        bucket_max: float,
+    ) -> None:
+        bucket = buckets.get(key)
+        if bucket is None:
+            buckets[key] = [count, bucket_min, bucket_max]
+        else:
+            bucket[0] += count
+            if not (bucket[1] == bucket[2] == bucket_min == bucket_max):
+                # bucket no longer holds a single value, so use its bounds
+                bucket[1] = self.gamma ** (key - 1)
+                bucket[2] = self.gamma**key
+
+    def merge(self, other: QuantileSketch) -> QuantileSketch:
+        """add values of other sketch to this sketch
+
+        ## Inputs
+        - other: QuantileSketch with same relative_accuracy
+
+        ## Returns
+        - this sketch, for chaining
+        """
+        if other.gamma != self.gamma:
+            raise Exception('can only merge sketches with same accuracy')
+        for buckets, other_buckets in [
+            (self._positive, other._positive),
+            (self._negative, other._negative),
+        ]:
+            for key, (count, bucket_min, bucket_max) in other_buckets.items():
+                self._add_bucket(buckets, key, count, bucket_min, bucket_max)
+        self.n += other.n
+        self.n_zero += other.n_zero
+        return self
+
+    def negated(self) -> QuantileSketch:
+        """create sketch of the negation of the values of this sketch"""
+        sketch = QuantileSketch(self.relative_accuracy)
+        sketch.n = self.n
+        sketch.n_zero = self.n_zero
+        sketch._positive = {k: list(v) for k, v in self._negative.items()}
+        sketch._negative = {k: list(v) for k, v in self._positive.items()}
+        return sketch
+
+    #
+    # # querying sketch
+    #
+
+    def _get_representative(self, key: int, bucket: list[typing.Any]) -> float:
+        """get value within relative_accuracy of all values of bucket
+
+        - bucket min and max are its exact value, or else its bounds
+        """
+        _, bucket_min, bucket_max = bucket
+        if bucket_min == bucket_max:
+            return bucket_min  # type: ignore
+        value = 2 * self.gamma**key / (self.gamma + 1)
+        return min(max(value, bucket_min), bucket_max)  # type: ignore
+
+    def iter_buckets(
+        self,
+    ) -> typing.Iterator[tuple[float, float, float, int]]:
+        """iterate (value, min, max, count) of buckets in ascending order"""
+        for key in sorted(self._negative.keys(), reverse=True):
+            bucket = self._negative[key]
+            value = -self._get_representative(key, bucket)
+            yield value, -bucket[2], -bucket[1], bucket[0]
+        if self.n_zero > 0:
+            yield 0.0, 0.0, 0.0, self.n_zero
+        for key in sorted(self._positive.keys()):
+            bucket = self._positive[key]
+            value = self._get_representative(key, bucket)
+            yield value, bucket[1], bucket[2], bucket[0]
+
+    def value_at_rank(self, rank: int) -> float:
+        """estimate value at 0-based rank of sorted values"""
+        if rank < 0 or rank >= self.n:
+            raise Exception('rank out of range')
+        cumulative = 0
+        for value, _, _, count in self.iter_buckets():
+            cumulative += count
+            if cumulative > rank:
+                return value
+        raise Exception('rank out of range')
+
+    def quantile(self, q: float) -> float:
+        """estimate quantile q of values, using lower value between ranks
+
+        ## Inputs
+        - q: float between 0 and 1
+
+        ## Returns
+        - float value within relative_accuracy of exact quantile
+        """
+        if not 0 <= q <= 1:
+            raise Exception('q must be between 0 and 1')
+        if self.n == 0:
+            raise Exception('cannot compute quantile of empty sketch')
+        return self.value_at_rank(math.floor(q * (self.n - 1)))
+
+    def median(self) -> float:
+        """estimate median, averaging middle values as in np.median()"""
+        if self.n == 0:
+            raise Exception('cannot compute median of empty sketch')
+        lower = self.value_at_rank((self.n - 1) // 2)
+        upper = self.value_at_rank(self.n // 2)
+        return (lower + upper) / 2
+
+    def count_below(self, threshold: float) -> int:
+        """estimate number of values less than threshold
+
+        - exact unless a bucket has values on both sides of threshold
+        """
+        total = 0
+        for value, bucket_min, bucket_max, count in self.iter_buckets():
+            if bucket_max < threshold or (
+                bucket_min < threshold and value < threshold
+            ):
+                total += count
+        return total
+
+    def count_above(self, threshold: float) -> int:
+        """estimate number of values greater than threshold
+
+        - exact unless a bucket has values on both sides of threshold
+        """
+        total = 0
+        for value, bucket_min, bucket_max, count in self.iter_buckets():
+            if bucket_min > threshold or (
+                bucket_max > threshold and value > threshold
+            ):
+                total += count
+        return total
@@ -1,5 +1,7 @@
 from .timelength_convert import *
 from .timelength_crud import *
 from .timelength_delta import *
+from .timelength_format import *
 from .timelength_identify import *
+from .timelength_parse import *
 from .timelength_units import *
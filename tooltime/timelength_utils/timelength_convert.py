@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import math
 import typing
 
+from .. import exceptions
 from .. import spec
 from . import timelength_units
 from . import timelength_identify
+from . import timelength_parse
 
 
 #
@@ -77,64 +80,134 @@ def convert_timelength(
 ) -> spec.Timelength:
     """convert Timelength to a new representation
 
+    - see compile_timelength_converter() for converting many timelengths
+
     ## Inputs
     - timelength: Timelength
-    - to_representation: str of Timelength representation of input timelength
-    - from_representation: str of target Timelength representation
+    - to_representation: str of target Timelength representation
+    - from_representation: str of Timelength representation of input
+      timelength, detected if not given
 
     ## Returns
     - Timelength in specified representation
     """
+    converter = compile_timelength_converter(
+        to_representation, from_representation
+    )
+    return converter(timelength)
 
-    # detect timelength type
-    if from_representation is None:
-        from_representation = (
-            timelength_identify.detect_timelength_representation(timelength)
+
+@typing.overload
+def compile_timelength_converter(
+    to_representation: typing.Literal['TimelengthSeconds'],
+    from_representation: spec.TimelengthRepresentation | None = None,
+) -> typing.Callable[[spec.Timelength], spec.TimelengthSeconds]: ...
+
+
+@typing.overload
+def compile_timelength_converter(
+    to_representation: typing.Literal['TimelengthSecondsPrecise'],
+    from_representation: spec.TimelengthRepresentation | None = None,
+) -> typing.Callable[[spec.Timelength], spec.TimelengthSecondsPrecise]: ...
+
+
+@typing.overload
+def compile_timelength_converter(
+    to_representation: spec.TimelengthRepresentation,
+    from_representation: spec.TimelengthRepresentation | None = None,
+) -> typing.Callable[[spec.Timelength], spec.Timelength]: ...
+
+
+@functools.lru_cache(maxsize=None)
+def compile_timelength_converter(
+    to_representation: spec.TimelengthRepresentation,
+    from_representation: spec.TimelengthRepresentation | None = None,
+) -> typing.Callable[[spec.Timelength], spec.Timelength]:
+    """create function that converts Timelength between two representations
+
+    - representation functions are looked up once instead of per call, so
+      hot paths can compile a converter once at module level
+    - if from_representation is None, int and float inputs skip detection,
+      and str inputs are detected and converted by parse_timelength()
+    - inputs already in to_representation are returned unchanged
+
+    ## Example Usage
+    to_seconds = tooltime.compile_timelength_converter('TimelengthSeconds')
+    seconds = [to_seconds(timelength) for timelength in timelengths]
+
+    ## Inputs
+    - to_representation: str of target Timelength representation
+    - from_representation: str of Timelength representation of inputs
+
+    ## Returns
+    - function converting Timelength to to_representation
+    """
+    from_seconds = _from_seconds_functions.get(to_representation)
+    if from_seconds is None:
+        raise Exception(
+            'unknown timelength_representation: ' + str(to_representation)
         )
 
-    # return if already in target type
-    if from_representation == to_representation:
-        return timelength
+    if from_representation is None:
 
-    # convert to seconds
-    if timelength_identify.is_timelength_seconds(timelength):
-        timelength_seconds: spec.TimelengthSecondsRaw = timelength
-    elif timelength_identify.is_timelength_seconds_precise(timelength):
-        timelength_seconds = timelength
-    elif timelength_identify.is_timelength_label(timelength):
-        timelength_seconds = timelength_label_to_seconds(timelength)
-    elif timelength_identify.is_timelength_clock(timelength):
-        timelength_seconds = timelength_clock_to_seconds(timelength)
-    elif timelength_identify.is_timelength_phrase(timelength):
-        timelength_seconds = timelength_phrase_to_seconds(timelength)
-    elif timelength_identify.is_timelength_clock_phrase(timelength):
-        timelength_seconds = timelength_clock_phrase_to_seconds(timelength)
-    elif timelength_identify.is_timelength_timedelta(timelength):
-        timelength_seconds = timelength_timedelta_to_seconds(timelength)
-    else:
+        def convert_detected(timelength: spec.Timelength) -> spec.Timelength:
+            # inline fast paths of _detect_and_convert_to_seconds()
+            if isinstance(timelength, int):
+                if to_representation == 'TimelengthSeconds':
+                    return timelength
+                seconds: spec.TimelengthSecondsRaw = timelength
+            elif isinstance(timelength, float):
+                if to_representation == 'TimelengthSecondsPrecise':
+                    return timelength
+                seconds = timelength
+            else:
+                representation, seconds = _detect_and_convert_to_seconds(
+                    timelength
+                )
+                if representation == to_representation:
+                    return timelength
+            return from_seconds(seconds)
+
+        return convert_detected
+
+    to_seconds = _to_seconds_functions.get(from_representation)
+    if to_seconds is None:
         raise Exception(
             'unknown timelength_representation: ' + str(from_representation)
         )
+    if from_representation == to_representation:
+        return _identity
+
+    def convert(timelength: spec.Timelength) -> spec.Timelength:
+        return from_seconds(to_seconds(timelength))
+
+    return convert
 
-    # convert to target type
-    if to_representation == 'TimelengthSeconds':
-        return int(timelength_seconds)
-    elif to_representation == 'TimelengthSecondsPrecise':
-        return float(timelength_seconds)
-    elif to_representation == 'TimelengthLabel':
-        return timelength_seconds_to_label(timelength_seconds)
-    elif to_representation == 'TimelengthClock':
-        return timelength_seconds_to_clock(timelength_seconds)
-    elif to_representation == 'TimelengthPhrase':
-        return timelength_seconds_to_phrase(timelength_seconds)
-    elif to_representation == 'TimelengthClockPhrase':
-        return timelength_seconds_to_clock_phrase(timelength_seconds)
-    elif to_representation == 'TimelengthTimedelta':
-        return timelength_seconds_to_timedelta(timelength_seconds)
+
+def _identity(timelength: spec.Timelength) -> spec.Timelength:
+    return timelength
+
+
+def _detect_and_convert_to_seconds(
+    timelength: spec.Timelength,
+) -> tuple[spec.TimelengthRepresentation | None, spec.TimelengthSecondsRaw]:
+    """detect representation of timelength and convert it to seconds
+
+    - representation is None for compound or fractional labels like '1h30m'
+    """
+    if isinstance(timelength, int):
+        return 'TimelengthSeconds', timelength
+    elif isinstance(timelength, float):
+        return 'TimelengthSecondsPrecise', timelength
+    elif isinstance(timelength, str):
+        parsed = timelength_parse.parse_timelength(timelength)
+        return parsed['representation'], parsed['seconds']
     else:
-        raise Exception(
-            'unknown timelength_representation: ' + str(to_representation)
+        representation = timelength_identify.detect_timelength_representation(
+            timelength
         )
+        to_seconds = _to_seconds_functions[representation]
+        return representation, to_seconds(timelength)
 
 
 #
@@ -155,11 +228,9 @@ def timelength_to_seconds(
     ## Returns
     - TimelengthSeconds timelength
     """
-    return convert_timelength(
-        timelength=timelength,
-        to_representation='TimelengthSeconds',
-        from_representation=from_representation,
-    )
+    return compile_timelength_converter(
+        'TimelengthSeconds', from_representation
+    )(timelength)  # type: ignore
 
 
 def timelength_to_seconds_precise(
@@ -175,11 +246,9 @@ def timelength_to_seconds_precise(
     ## Returns
     - TimelengthSecondsPrecise timelength
     """
-    return convert_timelength(
-        timelength=timelength,
-        to_representation='TimelengthSecondsPrecise',
-        from_representation=from_representation,
-    )
+    return compile_timelength_converter(
+        'TimelengthSecondsPrecise', from_representation
+    )(timelength)  # type: ignore
 
 
 def timelength_to_label(
@@ -195,11 +264,9 @@ def timelength_to_label(
     ## Returns
     - TimelengthLabel timelength
     """
-    return convert_timelength(
-        timelength=timelength,
-        to_representation='TimelengthLabel',
-        from_representation=from_representation,
-    )
+    return compile_timelength_converter('TimelengthLabel', from_representation)(
+        timelength
+    )  # type: ignore
 
 
 def timelength_to_phrase(
@@ -215,11 +282,9 @@ def timelength_to_phrase(
     ## Returns
     - TimelengthPhrase timelength
     """
-    return convert_timelength(
-        timelength=timelength,
-        to_representation='TimelengthPhrase',
-        from_representation=from_representation,
-    )
+    return compile_timelength_converter(
+        'TimelengthPhrase', from_representation
+    )(timelength)  # type: ignore
 
 
 def timelength_to_clock(
@@ -235,11 +300,9 @@ def timelength_to_clock(
     ## Returns
     - TimelengthClock timelength
     """
-    return convert_timelength(
-        timelength=timelength,
-        to_representation='TimelengthClock',
-        from_representation=from_representation,
-    )
+    return compile_timelength_converter('TimelengthClock', from_representation)(
+        timelength
+    )  # type: ignore
 
 
 def timelength_to_clock_phrase(
@@ -255,11 +318,9 @@ def timelength_to_clock_phrase(
     ## Returns
     - TimelengthClockPhrase timelength
     """
-    return convert_timelength(
-        timelength=timelength,
-        to_representation='TimelengthClockPhrase',
-        from_representation=from_representation,
-    )
+    return compile_timelength_converter(
+        'TimelengthClockPhrase', from_representation
+    )(timelength)  # type: ignore
 
 
 def timelength_to_timedelta(
@@ -275,11 +336,9 @@ def timelength_to_timedelta(
     ## Returns
     - TimelengthTimedelta timelength
     """
-    return convert_timelength(
-        timelength=timelength,
-        to_representation='TimelengthTimedelta',
-        from_representation=from_representation,
-    )
+    return compile_timelength_converter(
+        'TimelengthTimedelta', from_representation
+    )(timelength)  # type: ignore
 
 
 #
@@ -296,7 +355,8 @@ def timelength_seconds_to_label(
     """convert seconds to TimelengthLabel
 
     - matches integer multiples of base units
-        - see get_base_units() for base units
+        - see get_base_units() for base units, including custom units added
+          by register_time_unit()
 
     ## Inputs
     - seconds: int or float number of seconds
@@ -316,19 +376,18 @@ def timelength_seconds_to_label(
         elif int_seconds > 5.0:
             seconds = int_seconds
 
-    # collect possible base units
-    base_units = timelength_units.get_base_units()
+    # collect possible base units in descending order
+    registry = timelength_units.get_unit_registry()
     if base_unit is not None:
-        if base_unit not in base_units:
+        if base_unit not in registry.base_units:
             raise Exception('invalid base unit: ' + str(base_unit))
-        candidates: typing.Mapping[str, int] = {
-            base_unit: base_units[base_unit]
-        }
+        descending: typing.Sequence[typing.Tuple[str, int]] = [
+            (base_unit, registry.base_units[base_unit])
+        ]
     else:
-        candidates = base_units
+        descending = registry.descending
 
     # attempt matches to candidate base units in descending order
-    descending = sorted(candidates.items(), key=lambda item: -item[-1])
     for base_label, base_seconds in descending:
         # attempt match to base unit
         if base_only:
@@ -342,7 +401,7 @@ def timelength_seconds_to_label(
         quotient_as_int = round(quotient)
         if math.isclose(quotient, quotient_as_int):
             unit_count = quotient_as_int
-            unit_letter = base_label[-1]
+            unit_letter = base_label[1:]
             break
 
         # attempt fuzzy match of base unit multiple
@@ -353,10 +412,12 @@ def timelength_seconds_to_label(
             lower_bound = (1 - spec.to_numeric(fuzzy_tolerance)) * factor
             if lower_bound <= seconds and seconds <= upper_bound:
                 unit_count = round_quotient
-                unit_letter = base_label[-1]
+                unit_letter = base_label[1:]
                 break
     else:
-        raise Exception('could not seconds convert to label')
+        raise exceptions.ConversionException(
+            'could not convert seconds to label: ' + str(timelength_seconds)
+        )
 
     # create label
     label = str(unit_count) + unit_letter
@@ -461,14 +522,16 @@ def timelength_seconds_to_timedelta(
 
 def timelength_label_to_seconds(
     timelength_label: spec.TimelengthLabel,
-) -> spec.TimelengthSeconds:
-    """convert TimelengthLabel to seconds"""
-    number = int(timelength_label[:-1])
-    letter = timelength_label[-1]
-    base_units = timelength_units.get_base_units()
-    base_seconds = base_units['1' + letter]
-    seconds = number * base_seconds
-    return seconds
+) -> spec.TimelengthSecondsRaw:
+    """convert TimelengthLabel to seconds
+
+    - compound labels like '1h30m' are summed, see parse_timelength()
+    - fractional labels like '1.5s' give float seconds
+    """
+    parsed = timelength_parse.parse_timelength(timelength_label)
+    if parsed['representation'] not in ('TimelengthLabel', None):
+        raise Exception('not a TimelengthLabel: ' + str(timelength_label))
+    return parsed['seconds']
 
 
 def timelength_clock_to_seconds(
@@ -552,15 +615,49 @@ def timelength_to_pandas_timelength(
         number = int(timelength[:-1])
         timelength = str(7 * number) + 'd'
     timelength_label = timelength_to_label(timelength)
-    number_str = timelength_label[:-1]
-    unit_name = timelength_units.unit_letters_to_names()[timelength_label[-1]]
+    letter = timelength_label.lstrip('0123456789')
+    number_str = timelength_label[: len(timelength_label) - len(letter)]
+    unit_name = timelength_units.unit_letters_to_names()[letter]
     pandas_unit = timelength_units.get_english_to_pandas_units()[unit_name]
     return number_str + pandas_unit
 
 
 def timelength_to_numerical(timelength: spec.Timelength) -> int | float:
+    if isinstance(timelength, int):
+        return timelength
     seconds_precise = timelength_to_seconds_precise(timelength)
     if math.isclose(seconds_precise, int(seconds_precise)):
         return int(seconds_precise)
     else:
         return seconds_precise
+
+
+#
+# # dispatch tables
+#
+
+_to_seconds_functions: typing.Mapping[
+    spec.TimelengthRepresentation,
+    typing.Callable[[typing.Any], spec.TimelengthSecondsRaw],
+] = {
+    'TimelengthSeconds': _identity,  # type: ignore
+    'TimelengthSecondsPrecise': _identity,  # type: ignore
+    'TimelengthLabel': timelength_label_to_seconds,
+    'TimelengthClock': timelength_clock_to_seconds,
+    'TimelengthPhrase': timelength_phrase_to_seconds,
+    'TimelengthClockPhrase': timelength_clock_phrase_to_seconds,
+    'TimelengthTimedelta': timelength_timedelta_to_seconds,
+}
+
+_from_seconds_functions: typing.Mapping[
+    spec.TimelengthRepresentation,
+    typing.Callable[[spec.TimelengthSecondsRaw], spec.Timelength],
+] = {
+    'TimelengthSeconds': int,
+    'TimelengthSecondsPrecise': float,
+    'TimelengthLabel': timelength_seconds_to_label,
+    'TimelengthClock': timelength_seconds_to_clock,
+    'TimelengthPhrase': timelength_seconds_to_phrase,
+    'TimelengthClockPhrase': timelength_seconds_to_clock_phrase,
+    'TimelengthTimedelta': timelength_seconds_to_timedelta,
+}
@@ -1,64 +1,218 @@
 from __future__ import annotations
 
 import datetime
+import math
+import typing
 from calendar import monthrange
 
+from .. import spec
+from .. import timestamp_utils
+
+if typing.TYPE_CHECKING:
+    import polars as pl
+
 
 class DateDelta:
+    """calendar-aware shift by years, quarters, and months
+
+    - days past the end of the target month are clamped to its last day
+    - time of day and tzinfo are preserved
+    - immutable and hashable, deltas with equal total months are equal
+    - can be applied to datetimes, int or float seconds, numpy arrays of
+      seconds, and polars Series or Expr
+    """
+
+    __slots__ = ('months', 'quarters', 'years')
+
+    years: int
+    quarters: int
+    months: int
+
+    # make numpy defer to __radd__ and __rsub__ for arrays of seconds
+    __array_ufunc__ = None
+
     def __init__(self, years: int = 0, quarters: int = 0, months: int = 0):
         """Initialize with years, quarters, and/or months."""
-        self.years = years
-        self.quarters = quarters
-        self.months = months
+        object.__setattr__(self, 'years', years)
+        object.__setattr__(self, 'quarters', quarters)
+        object.__setattr__(self, 'months', months)
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        raise AttributeError('DateDelta is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError('DateDelta is immutable')
+
+    @property
+    def total_months(self) -> int:
+        """total number of months, with quarters as 3 months"""
+        return self.years * 12 + self.quarters * 3 + self.months
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DateDelta):
+            return NotImplemented
+        return self.total_months == other.total_months
+
+    def __hash__(self) -> int:
+        return hash(('DateDelta', self.total_months))
+
+    def __neg__(self) -> DateDelta:
+        return DateDelta(
+            years=-self.years, quarters=-self.quarters, months=-self.months
+        )
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        return (DateDelta, (self.years, self.quarters, self.months))
+
+    def apply(self, value: typing.Any, direction: int = 1) -> typing.Any:
+        """apply shift to a datetime, seconds, array, or polars column
+
+        ## Inputs
+        - value: datetime, int or float seconds, numpy array of seconds,
+          polars Series of seconds or datetimes, or polars Expr of datetimes
+        - direction: 1 to shift forward, -1 to shift backward
+        """
+        total_months = direction * self.total_months
+        if isinstance(value, datetime.datetime):
+            return _shift_datetime(value, total_months)
+        module = type(value).__module__.split('.')[0]
+        if module == 'polars':
+            return _shift_polars(value, total_months)
+        return shift_months(value, total_months)
 
     def _adjust_date(
         self, dt: datetime.datetime, direction: int = 1
     ) -> datetime.datetime:
         """Adjust date for month-end and invalid days, preserving time."""
-        # Convert quarters to months (1 quarter = 3 months)
-        total_months = direction * (
-            self.years * 12 + self.quarters * 3 + self.months
-        )
-        new_month = dt.month + total_months
-        # Handle year and month overflow
-        year, month = divmod(new_month - 1, 12)
-        new_year = dt.year + year
-        new_month = month + 1
-        # Cap day to the last day of the month (handles Feb 29, etc.)
-        last_day = monthrange(new_year, new_month)[1]
-        new_day = min(dt.day, last_day)
-        # Preserve time components
-        return datetime.datetime(
-            new_year,
-            new_month,
-            new_day,
-            dt.hour,
-            dt.minute,
-            dt.second,
-            dt.microsecond,
-        )
+        return _shift_datetime(dt, direction * self.total_months)
 
-    def __add__(self, other: datetime.datetime) -> datetime.datetime:
-        """Support DateDelta + datetime."""
-        if not isinstance(other, datetime.datetime):
+    def __add__(self, other: typing.Any) -> typing.Any:
+        """Support DateDelta + datetime, seconds, or array of seconds."""
+        if isinstance(other, DateDelta):
+            return DateDelta(
+                years=self.years + other.years,
+                quarters=self.quarters + other.quarters,
+                months=self.months + other.months,
+            )
+        if isinstance(other, (str, datetime.date)) and not isinstance(
+            other, datetime.datetime
+        ):
             raise TypeError('Can only add DateDelta to datetime object')
-        return self._adjust_date(other, direction=1)
+        return self.apply(other, direction=1)
 
-    def __radd__(self, other: datetime.datetime) -> datetime.datetime:
+    def __radd__(self, other: typing.Any) -> typing.Any:
         """Support datetime + DateDelta."""
         return self.__add__(other)
 
-    def __sub__(self, other: datetime.datetime) -> datetime.datetime:
+    def __sub__(self, other: typing.Any) -> typing.Any:
         """Support DateDelta - datetime (not typical, but included for symmetry)."""
-        if not isinstance(other, datetime.datetime):
+        if isinstance(other, DateDelta):
+            return self + (-other)
+        if isinstance(other, (str, datetime.date)) and not isinstance(
+            other, datetime.datetime
+        ):
             raise TypeError('Can only subtract datetime from DateDelta')
-        return self._adjust_date(other, direction=-1)
+        return self.apply(other, direction=-1)
 
-    def __rsub__(self, other: datetime.datetime) -> datetime.datetime:
+    def __rsub__(self, other: typing.Any) -> typing.Any:
         """Support datetime - DateDelta."""
-        if not isinstance(other, datetime.datetime):
+        if isinstance(other, (str, datetime.date)) and not isinstance(
+            other, datetime.datetime
+        ):
             raise TypeError('Can only subtract DateDelta from datetime')
-        return self._adjust_date(other, direction=-1)
+        return self.apply(other, direction=-1)
 
     def __repr__(self) -> str:
         return f'DateDelta(years={self.years}, quarters={self.quarters}, months={self.months})'
+
+
+def shift_months(timestamps: typing.Any, months: typing.Any) -> typing.Any:
+    """shift seconds by calendar months, clamping to end of month
+
+    - e.g. shifting 2024-01-31T12:00:00Z by 1 month gives 2024-02-29T12:00:00Z
+    - time of day and fractional seconds are preserved
+
+    ## Inputs
+    - timestamps: int or float seconds, or numpy array of seconds
+    - months: int number of months, or int array broadcastable to timestamps
+
+    ## Returns
+    - shifted seconds, int for int input, array for array input
+    """
+    if _is_scalar(timestamps) and _is_scalar(months):
+        if spec.is_float_scalar(timestamps):
+            floor = math.floor(timestamps)
+            return _shift_int_seconds(floor, int(months)) + (
+                float(timestamps) - floor
+            )
+        return _shift_int_seconds(int(timestamps), int(months))
+
+    try:
+        import numpy as np
+    except ImportError:
+        raise Exception('numpy required for shifting arrays of timestamps')
+
+    values, months_array = np.broadcast_arrays(
+        np.asarray(timestamps), np.asarray(months, dtype=np.int64)
+    )
+    if values.dtype.kind == 'f':
+        floor = np.floor(values)
+        shifted = _shift_int_seconds(floor.astype(np.int64), months_array)
+        return shifted + (values - floor)
+    return _shift_int_seconds(values.astype(np.int64), months_array)
+
+
+def _is_scalar(value: typing.Any) -> bool:
+    return spec.is_int_scalar(value) or spec.is_float_scalar(value)
+
+
+def _shift_int_seconds(seconds: typing.Any, months: typing.Any) -> typing.Any:
+    """shift int seconds by months, for ints or int64 arrays"""
+    month_index = timestamp_utils.seconds_to_month_index(seconds)
+    month_start = timestamp_utils.month_index_to_seconds(month_index)
+    offset = seconds - month_start
+    day = offset // 86400
+    time_of_day = offset - day * 86400
+
+    target_index = month_index + months
+    target_start = timestamp_utils.month_index_to_seconds(target_index)
+    target_end = timestamp_utils.month_index_to_seconds(target_index + 1)
+    last_day = (target_end - target_start) // 86400 - 1
+    if isinstance(day, int):
+        day = min(day, last_day)
+    else:
+        import numpy as np
+
+        day = np.minimum(day, last_day)
+    return target_start + day * 86400 + time_of_day
+
+
+def _shift_datetime(
+    dt: datetime.datetime, total_months: int
+) -> datetime.datetime:
+    # Handle year and month overflow
+    year, month = divmod(dt.month - 1 + total_months, 12)
+    new_year = dt.year + year
+    new_month = month + 1
+    # Cap day to the last day of the month (handles Feb 29, etc.)
+    last_day = monthrange(new_year, new_month)[1]
+    new_day = min(dt.day, last_day)
+    # Preserve time components and tzinfo
+    return dt.replace(year=new_year, month=new_month, day=new_day)
+
+
+def _shift_polars(
+    value: pl.Series | pl.Expr, total_months: int
+) -> pl.Series | pl.Expr:
+    import polars as pl
+
+    offset = str(total_months) + 'mo'
+    if isinstance(value, pl.Expr):
+        return value.dt.offset_by(offset)
+    elif isinstance(value, pl.Series):
+        if value.dtype.is_temporal():
+            return value.dt.offset_by(offset)
+        shifted = shift_months(value.to_numpy(), total_months)
+        return pl.Series(value.name, shifted).cast(value.dtype)
+    else:
+        raise TypeError('unknown polars type: ' + str(type(value)))
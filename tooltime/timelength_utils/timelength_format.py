@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+import functools
+import typing
+
+from .. import exceptions
+from .. import spec
+from . import timelength_units
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+
+
+# relative tolerance of math.isclose()
+_isclose_rtol = 1e-9
+
+_phrase_unit_names = ('years', 'days', 'hours', 'minutes', 'seconds')
+
+
+#
+# # vectorized formatting of seconds
+#
+# each function computes unit decompositions with array arithmetic, then
+# assembles strings with numpy string operations
+# - arithmetic mirrors the scalar function step by step, so that output is
+#   identical to the scalar function applied to each element
+#
+
+
+def timelength_seconds_to_labels(
+    timelength_seconds: typing.Any,
+    base_only: bool = False,
+    fuzzy_tolerance: typing.SupportsFloat | None = None,
+    base_unit: str | None = None,
+) -> np.ndarray:
+    """convert array of seconds to TimelengthLabel's
+
+    vectorized equivalent of timelength_seconds_to_label()
+
+    ## Inputs
+    - timelength_seconds: array or sequence of int or float seconds
+    - base_only: bool of whether to match only to base units
+    - fuzzy_tolerance: float of how close seconds must be to a matching label
+    - base_unit: str of base unit
+
+    ## Returns
+    - str array of TimelengthLabel, same shape as input
+    """
+    import numpy as np
+
+    values = _to_seconds_array(timelength_seconds)
+    flat = values.reshape(-1)
+
+    # floats that are close to ints, or above 5 seconds, are truncated
+    if flat.dtype.kind == 'f':
+        truncated = np.trunc(flat)
+        seconds = np.where(
+            _isclose(truncated, flat) | (truncated > 5.0), truncated, flat
+        )
+    else:
+        seconds = flat
+
+    # collect possible base units in descending order
+    registry = timelength_units.get_unit_registry()
+    if base_unit is not None:
+        if base_unit not in registry.base_units:
+            raise Exception('invalid base unit: ' + str(base_unit))
+        descending: typing.Sequence[typing.Tuple[str, int]] = [
+            (base_unit, registry.base_units[base_unit])
+        ]
+    else:
+        descending = registry.descending
+    if fuzzy_tolerance is not None:
+        tolerance = spec.to_numeric(fuzzy_tolerance)
+
+    # match unmatched seconds to candidate base units in descending order
+    unit_counts = np.zeros(len(seconds), dtype=np.int64)
+    unit_indices = np.zeros(len(seconds), dtype=np.intp)
+    pending = np.arange(len(seconds))
+    for index, (base_label, base_seconds) in enumerate(descending):
+        if len(pending) == 0:
+            break
+        pending_seconds = seconds[pending]
+        if base_only:
+            matched = _isclose(pending_seconds, base_seconds)
+            counts = np.ones(len(pending), dtype=np.int64)
+        else:
+            quotient = pending_seconds / base_seconds
+            round_quotient = np.round(quotient)
+            matched = _isclose(quotient, round_quotient)
+            if fuzzy_tolerance is not None:
+                factor = round_quotient * base_seconds
+                upper_bound = (1 + tolerance) * factor
+                lower_bound = (1 - tolerance) * factor
+                matched |= (lower_bound <= pending_seconds) & (
+                    pending_seconds <= upper_bound
+                )
+            counts = round_quotient.astype(np.int64)
+        unit_counts[pending[matched]] = counts[matched]
+        unit_indices[pending[matched]] = index
+        pending = pending[~matched]
+    if len(pending) > 0:
+        raise exceptions.ConversionException(
+            'could not convert seconds to label: ' + str(flat[pending[0]])
+        )
+
+    # create labels
+    unit_letters = np.array([base_label[1:] for base_label, _ in descending])
+    labels = np.char.add(unit_counts.astype(str), unit_letters[unit_indices])
+    return labels.reshape(values.shape)
+
+
+def timelength_seconds_to_clocks(timelength_seconds: typing.Any) -> np.ndarray:
+    """convert array of seconds to TimelengthClock's
+
+    vectorized equivalent of timelength_seconds_to_clock()
+
+    ## Inputs
+    - timelength_seconds: array or sequence of int or float seconds
+
+    ## Returns
+    - str array of TimelengthClock, same shape as input
+    """
+    import numpy as np
+
+    values = _to_seconds_array(timelength_seconds)
+    flat = values.reshape(-1)
+    day_seconds = timelength_units.get_base_units()['1d']
+    n_days = np.floor(flat / day_seconds).astype(np.int64)
+    remaining = np.mod(flat, day_seconds)
+
+    # microseconds of timedelta, rounding fractions half to even
+    if remaining.dtype.kind == 'f':
+        fraction, whole = np.modf(remaining)
+        microseconds = whole.astype(np.int64) * 1000000 + np.rint(
+            fraction * 1e6
+        ).astype(np.int64)
+    else:
+        microseconds = remaining * 1000000
+
+    # decompose timedelta into days, seconds, and microseconds
+    delta_days, microseconds = np.divmod(microseconds, 86400 * 1000000)
+    delta_seconds, microseconds = np.divmod(microseconds, 1000000)
+
+    # assemble str of timedelta, looking up 'H:MM:SS' of each second of day
+    clocks = _get_clock_table()[delta_seconds]
+    has_microseconds = microseconds != 0
+    if has_microseconds.any():
+        digits = _get_digits_table()
+        subset = microseconds[has_microseconds]
+        clocks = _assign(
+            clocks,
+            has_microseconds,
+            _join(
+                clocks[has_microseconds],
+                '.',
+                digits[subset // 1000],
+                digits[subset % 1000],
+            ),
+        )
+    has_delta_days = delta_days != 0
+    if has_delta_days.any():
+        subset = delta_days[has_delta_days]
+        day_prefixes = np.where(
+            subset == 1, '1 day, ', _join(subset.astype(str), ' days, ')
+        )
+        clocks = _assign(
+            clocks,
+            has_delta_days,
+            np.char.add(day_prefixes, clocks[has_delta_days]),
+        )
+
+    # prefix days
+    has_days = n_days > 0
+    if has_days.any():
+        clocks = _assign(
+            clocks,
+            has_days,
+            _join(n_days[has_days].astype(str), ':', clocks[has_days]),
+        )
+
+    return clocks.reshape(values.shape)
+
+
+def timelength_seconds_to_phrases(
+    timelength_seconds: typing.Any,
+) -> np.ndarray:
+    """convert array of seconds to TimelengthPhrase's
+
+    vectorized equivalent of timelength_seconds_to_phrase()
+
+    ## Inputs
+    - timelength_seconds: array or sequence of int or float seconds
+
+    ## Returns
+    - str array of TimelengthPhrase, same shape as input
+    """
+    import numpy as np
+
+    values = _to_seconds_array(timelength_seconds)
+    flat = values.reshape(-1)
+
+    # compute count for each unit
+    base_units = timelength_units.get_base_units()
+    unit_names_to_labels = timelength_units.get_unit_labels()
+    remaining = flat
+    unit_counts = []
+    unit_sizes = []
+    for unit_name in _phrase_unit_names:
+        unit_seconds = base_units[unit_names_to_labels[unit_name]]
+        unit_counts.append(np.floor(remaining / unit_seconds).astype(np.int64))
+        unit_sizes.append(unit_seconds)
+        remaining = np.mod(remaining, unit_seconds)
+
+    # assemble pieces from unit counts, each piece preceded by separator
+    # - counts below the largest unit are bounded, so use tables of pieces
+    # - np.mod of tiny negative floats can return the unit size itself,
+    #   so counts past the table are formatted by the scalar function
+    phrases = np.zeros(len(flat), dtype=str)
+    overflow = np.zeros(len(flat), dtype=bool)
+    has_years = unit_counts[0] > 0
+    if has_years.any():
+        phrases = _assign(
+            phrases,
+            has_years,
+            _join(
+                ', ',
+                unit_counts[0][has_years].astype(str),
+                ' ' + _phrase_unit_names[0],
+            ),
+        )
+    for i in range(1, len(_phrase_unit_names)):
+        table = _get_phrase_piece_table(
+            _phrase_unit_names[i], -(-unit_sizes[i - 1] // unit_sizes[i])
+        )
+        overflow |= unit_counts[i] >= len(table)
+        pieces = table[np.minimum(unit_counts[i], len(table) - 1)]
+
+        # fractional seconds are added to count of seconds as float
+        if i == len(_phrase_unit_names) - 1 and remaining.dtype.kind == 'f':
+            has_fraction = remaining != 0
+            if has_fraction.any():
+                float_seconds = (
+                    unit_counts[i][has_fraction] + remaining[has_fraction]
+                )
+                pieces = _assign(
+                    pieces,
+                    has_fraction,
+                    np.where(
+                        float_seconds > 0,
+                        _join(
+                            ', ',
+                            _float_to_str(float_seconds),
+                            ' ' + _phrase_unit_names[i],
+                        ),
+                        '',
+                    ),
+                )
+
+        phrases = np.char.add(phrases, pieces)
+
+    # remove leading separator, every piece begins with a digit
+    phrases = np.char.lstrip(phrases, ', ')
+    phrases = np.where(phrases == '', '0 ' + _phrase_unit_names[-1], phrases)
+    if overflow.any():
+        from . import timelength_convert
+
+        phrases = _assign(
+            phrases,
+            overflow,
+            np.array(
+                [
+                    timelength_convert.timelength_seconds_to_phrase(value)
+                    for value in flat[overflow].tolist()
+                ]
+            ),
+        )
+    return phrases.reshape(values.shape)
+
+
+def _to_seconds_array(timelength_seconds: typing.Any) -> np.ndarray:
+    """convert seconds to int64 or float64 array"""
+    try:
+        import numpy as np
+    except ImportError:
+        raise Exception('numpy required for vectorized timelength formatting')
+
+    if type(timelength_seconds).__module__.split('.')[0] == 'polars':
+        timelength_seconds = timelength_seconds.to_numpy()
+    values = np.asarray(timelength_seconds)
+    if values.dtype.kind in 'biu':
+        return values.astype(np.int64, copy=False)
+    elif values.dtype.kind == 'f':
+        values = values.astype(np.float64, copy=False)
+        if not np.isfinite(values).all():
+            raise Exception('timelength seconds must be finite')
+        return values
+    else:
+        raise Exception(
+            'timelength seconds must be int or float, not ' + str(values.dtype)
+        )
+
+
+def _isclose(a: np.ndarray | float, b: np.ndarray | float) -> np.ndarray | bool:
+    """elementwise math.isclose() with default tolerances"""
+    import numpy as np
+
+    return np.abs(a - b) <= _isclose_rtol * np.maximum(np.abs(a), np.abs(b))
+
+
+def _join(*pieces: typing.Any) -> np.ndarray:
+    """concatenate str arrays and str's elementwise"""
+    import numpy as np
+
+    joined = pieces[0]
+    for piece in pieces[1:]:
+        joined = np.char.add(joined, piece)
+    return joined
+
+
+def _assign(
+    strs: np.ndarray, mask: np.ndarray, values: np.ndarray
+) -> np.ndarray:
+    """set masked elements of str array, widening its dtype if needed"""
+    import numpy as np
+
+    strs = strs.astype(np.result_type(strs, values), copy=False)
+    strs[mask] = values
+    return strs
+
+
+@functools.lru_cache(maxsize=None)
+def _get_clock_table() -> np.ndarray:
+    """get str array of 'H:MM:SS' for each second of a day"""
+    import numpy as np
+
+    return np.array(
+        [
+            '%d:%02d:%02d' % (second // 3600, second // 60 % 60, second % 60)
+            for second in range(86400)
+        ]
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_digits_table() -> np.ndarray:
+    """get str array of zero-padded 3 digit numbers"""
+    import numpy as np
+
+    return np.array(['%03d' % number for number in range(1000)])
+
+
+@functools.lru_cache(maxsize=None)
+def _get_phrase_piece_table(unit_name: str, size: int) -> np.ndarray:
+    """get str array of phrase piece for each count, empty for zero count"""
+    import numpy as np
+
+    return np.array(
+        [''] + [', ' + str(count) + ' ' + unit_name for count in range(1, size)]
+    )
+
+
+def _float_to_str(values: np.ndarray) -> np.ndarray:
+    """convert floats to str array, matching str() of python floats"""
+    import numpy as np
+
+    return np.array([str(value) for value in values.tolist()], dtype=str)
@@ -8,25 +8,29 @@ if typing.TYPE_CHECKING:
 
 from .. import spec
 from .. import exceptions
-from . import timelength_units
+from . import timelength_parse
 
 
 def detect_timelength_representation(
     timelength: spec.Timelength,
 ) -> spec.TimelengthRepresentation:
-    """return str name of Timelength representation"""
+    """return str name of Timelength representation
+
+    - str representations are detected by parse_timelength() in one scan
+    - compound or fractional labels like '1h30m' have no representation
+    """
     if is_timelength_seconds(timelength):
         return 'TimelengthSeconds'
     elif is_timelength_seconds_precise(timelength):
         return 'TimelengthSecondsPrecise'
-    elif is_timelength_label(timelength):
-        return 'TimelengthLabel'
-    elif is_timelength_clock(timelength):
-        return 'TimelengthClock'
-    elif is_timelength_phrase(timelength):
-        return 'TimelengthPhrase'
-    elif is_timelength_clock_phrase(timelength):
-        return 'TimelengthClockPhrase'
+    elif isinstance(timelength, str):
+        parsed = timelength_parse.parse_timelength(timelength)
+        if parsed['representation'] is None:
+            raise exceptions.RepresentationDetectionException(
+                'compound or fractional label has no representation: '
+                + str(timelength)
+            )
+        return parsed['representation']
     elif is_timelength_timedelta(timelength):
         return 'TimelengthTimedelta'
     else:
@@ -62,74 +66,45 @@ def is_timelength_label(
     timelength: typing.Any,
 ) -> TypeGuard[spec.TimelengthLabel]:
     """return bool of whether input is TimelengthLabel"""
-
-    if not isinstance(timelength, str) or len(timelength) < 2:
-        return False
-
-    try:
-        int(timelength[:-1])
-        letter = timelength[-1]
-        return letter.isalnum()
-
-    except ValueError:
-        return False
+    return _get_str_representation(timelength) == 'TimelengthLabel'
 
 
 def is_timelength_clock(
     timelength: typing.Any,
 ) -> TypeGuard[spec.TimelengthClock]:
     """return bool of whether input is TimelengthClock"""
-
-    if not isinstance(timelength, str):
-        return False
-    numbers = timelength.split(':')
-    try:
-        for number in numbers[:-1]:
-            int(number)
-        float(numbers[-1])
-        return True
-    except ValueError:
-        return False
+    return _get_str_representation(timelength) == 'TimelengthClock'
 
 
 def is_timelength_phrase(
     timelength: typing.Any,
 ) -> TypeGuard[spec.TimelengthPhrase]:
     """return bool of whether input is TimelengthPhrase"""
-
-    if not isinstance(timelength, str):
-        return False
-    unit_names_to_labels = timelength_units.get_unit_labels()
-    pieces = timelength.split(', ')
-    try:
-        for piece in pieces:
-            amount, unit_name = piece.split(' ')
-            float(amount)
-            if unit_name not in unit_names_to_labels:
-                return False
-        return True
-    except Exception:
-        return False
+    return _get_str_representation(timelength) == 'TimelengthPhrase'
 
 
 def is_timelength_clock_phrase(
     timelength: typing.Any,
 ) -> TypeGuard[spec.TimelengthClockPhrase]:
-    """return bool of whether input is TimelengthClockPhrase"""
+    """return bool of whether input is TimelengthClockPhrase
 
-    if not isinstance(timelength, str):
-        return False
-    pieces = timelength.split(', ')
+    - a TimelengthPhrase is also a TimelengthClockPhrase without a clock
+    """
+    return _get_str_representation(timelength) in [
+        'TimelengthClockPhrase',
+        'TimelengthPhrase',
+    ]
 
-    if ':' in pieces[-1]:
-        clock = pieces[-1]
-        if not is_timelength_clock(clock):
-            return False
-        phrase = ', '.join(pieces[:-1])
-    else:
-        phrase = ', '.join(pieces)
 
-    return is_timelength_phrase(phrase)
+def _get_str_representation(
+    timelength: typing.Any,
+) -> spec.TimelengthRepresentation | None:
+    if not isinstance(timelength, str):
+        return None
+    try:
+        return timelength_parse.parse_timelength(timelength)['representation']
+    except exceptions.RepresentationDetectionException:
+        return None
 
 
 def is_timelength_timedelta(
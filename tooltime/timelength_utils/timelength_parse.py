@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import functools
+import re
+from typing_extensions import TypedDict
+
+from .. import exceptions
+from .. import spec
+from . import timelength_units
+
+
+class TimelengthParse(TypedDict):
+    representation: spec.TimelengthRepresentation | None
+    seconds: spec.TimelengthSecondsRaw
+    unit: str | None
+
+
+# each token is a number, a word, a colon, a comma, whitespace, or invalid
+_token_pattern = re.compile(
+    r'([+-]?(?:\d+(?:\.\d*)?|\.\d+))|([A-Za-z]+)|(:)|(,)|(\s+)|(.)'
+)
+
+
+def parse_timelength(timelength: str) -> TimelengthParse:
+    """parse Timelength str into its representation and seconds
+
+    - recognizes every str representation in a single scan of the input:
+        - TimelengthLabel, e.g. '5m'
+        - TimelengthClock, e.g. '1:30:00' or '2:01:30:00' with days
+        - TimelengthPhrase, e.g. '1 hour, 30 minutes'
+        - TimelengthClockPhrase, e.g. '2 days, 1:30:00'
+    - compound labels like '1h30m' or '1h 30m' and fractional labels like
+      '1.5h' are parsed into seconds, but have representation None, since
+      only '{int}{unit}' is a TimelengthLabel
+    - unit is the letter of the unit of a timelength with a single amount,
+      e.g. 'M' for '2M' or '2 months', and None otherwise
+    - seconds are int unless a fractional number appears in timelength
+    - a leading sign negates the whole timelength, e.g. '-1h30m'
+    - custom units added by register_time_unit() are understood
+    - results are cached, so repeated parsing of config values is cheap
+
+    ## Inputs
+    - timelength: str Timelength
+
+    ## Returns
+    - dict with str representation name, seconds, and unit of timelength
+    """
+    if not isinstance(timelength, str):
+        raise exceptions.RepresentationDetectionException(
+            'timelength is not str: ' + str(timelength)
+        )
+    representation, seconds, unit = _parse_timelength_str(timelength)
+    return {'representation': representation, 'seconds': seconds, 'unit': unit}
+
+
+def clear_timelength_parse_cache() -> None:
+    """clear cached results of parse_timelength()
+
+    - called when the unit registry changes, since cached parses may differ
+    """
+    _parse_timelength_str.cache_clear()
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_timelength_str(
+    timelength: str,
+) -> tuple[
+    spec.TimelengthRepresentation | None, spec.TimelengthSecondsRaw, str | None
+]:
+    # tokenize in one scan, grouping tokens into comma-separated pieces
+    pieces: list[list[tuple[int, str]]] = [[]]
+    for match in _token_pattern.finditer(timelength):
+        kind = match.lastindex
+        if kind == 4:
+            pieces.append([])
+        elif kind == 6:
+            raise _invalid(timelength)
+        elif kind != 5:
+            pieces[-1].append((kind, match.group()))  # type: ignore
+
+    # a leading sign negates the whole timelength
+    sign = 1
+    first = pieces[0][0] if len(pieces[0]) > 0 else None
+    if first is not None and first[0] == 1 and first[1][0] in '+-':
+        if first[1][0] == '-':
+            sign = -1
+        pieces[0][0] = (1, first[1][1:])
+
+    # parse pieces, a clock can only be the last piece
+    registry = timelength_units.get_unit_registry()
+    seconds: spec.TimelengthSecondsRaw = 0
+    n_letters = 0
+    n_names = 0
+    has_clock = False
+    unit_letter = None
+    for p, piece in enumerate(pieces):
+        if len(piece) == 0 or piece[0][0] != 1:
+            raise _invalid(timelength)
+        if len(piece) > 1 and piece[1][0] == 3:
+            if p != len(pieces) - 1:
+                raise _invalid(timelength)
+            seconds += _parse_clock(piece, timelength)
+            has_clock = True
+            continue
+
+        # amount unit pairs
+        if len(piece) % 2 != 0:
+            raise _invalid(timelength)
+        for i in range(0, len(piece), 2):
+            (amount_kind, amount), (unit_kind, unit) = piece[i : i + 2]
+            if amount_kind != 1 or unit_kind != 2:
+                raise _invalid(timelength)
+            if unit in registry.letter_seconds:
+                unit_seconds = registry.letter_seconds[unit]
+                unit_letter = unit
+                n_letters += 1
+            elif unit in registry.name_seconds:
+                unit_seconds = registry.name_seconds[unit]
+                unit_letter = registry.unit_labels[unit][1:]
+                n_names += 1
+            else:
+                raise _invalid(timelength)
+            number = _to_number(amount, timelength)
+            seconds += number * unit_seconds
+
+    if has_clock or n_letters + n_names != 1:
+        unit_letter = None
+
+    # determine representation from structure of pieces
+    representation: spec.TimelengthRepresentation | None
+    if n_letters > 0:
+        if n_names > 0 or has_clock or len(pieces) > 1:
+            raise _invalid(timelength)
+        if n_letters == 1 and isinstance(number, int):
+            representation = 'TimelengthLabel'
+        else:
+            # compound or fractional labels have no representation
+            representation = None
+    elif has_clock:
+        if n_names > 0:
+            representation = 'TimelengthClockPhrase'
+        else:
+            representation = 'TimelengthClock'
+    else:
+        representation = 'TimelengthPhrase'
+
+    return representation, sign * seconds, unit_letter
+
+
+def _parse_clock(
+    piece: list[tuple[int, str]], timelength: str
+) -> spec.TimelengthSecondsRaw:
+    """parse clock tokens [number, ':', number, ...] with 3 or 4 numbers"""
+    if len(piece) not in (5, 7):
+        raise _invalid(timelength)
+    for i, (kind, _) in enumerate(piece):
+        if kind != (1 if i % 2 == 0 else 3):
+            raise _invalid(timelength)
+    numbers = [_to_number(text, timelength) for _, text in piece[::2]]
+    if len(numbers) == 3:
+        numbers.insert(0, 0)
+    days, hours, minutes, seconds = numbers
+    base_units = timelength_units.get_base_units()
+    return (
+        base_units['1d'] * days
+        + base_units['1h'] * hours
+        + base_units['1m'] * minutes
+        + base_units['1s'] * seconds
+    )
+
+
+def _to_number(text: str, timelength: str) -> int | float:
+    if text == '' or text[0] in '+-':
+        raise _invalid(timelength)
+    if '.' in text:
+        return float(text)
+    else:
+        return int(text)
+
+
+def _invalid(timelength: str) -> exceptions.RepresentationDetectionException:
+    return exceptions.RepresentationDetectionException(
+        'could not parse Timelength: ' + str(timelength)
+    )
@@ -1,93 +1,245 @@
 from __future__ import annotations
 
+import types
 import typing
 
 from .. import spec
 
 
+class TimeUnit(typing.NamedTuple):
+    """unit of time, with its label letter and english names
+
+    - format_labels is whether formatters use the unit without being asked
+    """
+
+    letter: str
+    seconds: int
+    singular: str
+    plural: str
+    pandas: str | None = None
+    polars: str | None = None
+    format_labels: bool = True
+
+
+class TimeUnitRegistry(typing.NamedTuple):
+    """immutable lookup tables of the registered units of time
+
+    - built once per registration, so lookups do not allocate
+    - descending only has units that formatters use without being asked
+    """
+
+    units: typing.Tuple[TimeUnit, ...]
+    base_units: typing.Mapping[str, int]
+    letter_seconds: typing.Mapping[str, int]
+    singular_unit_labels: typing.Mapping[str, str]
+    plural_unit_labels: typing.Mapping[str, str]
+    unit_labels: typing.Mapping[str, str]
+    name_seconds: typing.Mapping[str, int]
+    letters_to_names: typing.Mapping[str, str]
+    descending: typing.Tuple[typing.Tuple[str, int], ...]
+    english_to_pandas: typing.Mapping[str, str]
+    pandas_to_english: typing.Mapping[str, str]
+    label_to_polars: typing.Mapping[str, str]
+
+
+_builtin_units = (
+    TimeUnit('s', 1, 'second', 'seconds', None, 's'),
+    TimeUnit('m', 60, 'minute', 'minutes', 'T', 'm'),
+    TimeUnit('h', 60 * 60, 'hour', 'hours', 'H', 'h'),
+    TimeUnit('d', 60 * 60 * 24, 'day', 'days', 'D', 'd'),
+    TimeUnit('w', 60 * 60 * 24 * 7, 'week', 'weeks', None, 'w'),
+    TimeUnit('M', 60 * 60 * 24 * 30, 'month', 'months', 'MS', 'mo'),
+    TimeUnit('y', 60 * 60 * 24 * 365, 'year', 'years', 'YS', 'y'),
+)
+
+# datetime units are the builtin units that datetime fields can represent
+_datetime_unit_letters = ('s', 'm', 'h', 'd', 'M', 'y')
+
+
+def _build_registry(units: typing.Sequence[TimeUnit]) -> TimeUnitRegistry:
+    proxy = types.MappingProxyType
+    base_units = {'1' + unit.letter: unit.seconds for unit in units}
+    singular = {unit.singular: '1' + unit.letter for unit in units}
+    plural = {unit.plural: '1' + unit.letter for unit in units}
+    english_to_pandas = {}
+    for unit in units:
+        if unit.pandas is not None:
+            english_to_pandas[unit.singular] = unit.pandas
+            english_to_pandas[unit.plural] = unit.pandas
+    return TimeUnitRegistry(
+        units=tuple(units),
+        base_units=proxy(base_units),
+        letter_seconds=proxy({unit.letter: unit.seconds for unit in units}),
+        singular_unit_labels=proxy(singular),
+        plural_unit_labels=proxy(plural),
+        unit_labels=proxy(dict(singular, **plural)),
+        name_seconds=proxy(
+            {
+                name: unit.seconds
+                for unit in units
+                for name in (unit.singular, unit.plural)
+            }
+        ),
+        letters_to_names=proxy({unit.letter: unit.singular for unit in units}),
+        descending=tuple(
+            sorted(
+                (
+                    ('1' + unit.letter, unit.seconds)
+                    for unit in units
+                    if unit.format_labels
+                ),
+                key=lambda item: -item[1],
+            )
+        ),
+        english_to_pandas=proxy(english_to_pandas),
+        pandas_to_english=proxy({v: k for k, v in english_to_pandas.items()}),
+        label_to_polars=proxy(
+            {
+                '1' + unit.letter: unit.polars
+                for unit in units
+                if unit.polars is not None
+            }
+        ),
+    )
+
+
+_registry = _build_registry(_builtin_units)
+
+_datetime_singular_unit_labels: typing.Mapping[spec.DatetimeUnit, str] = (
+    types.MappingProxyType(
+        {
+            _registry.letters_to_names[letter]: '1' + letter  # type: ignore
+            for letter in _datetime_unit_letters
+        }
+    )
+)
+_datetime_unit_letters_to_names: typing.Mapping[str, spec.DatetimeUnit] = (
+    types.MappingProxyType(
+        {v[-1]: k for k, v in _datetime_singular_unit_labels.items()}
+    )
+)
+
+
+def get_unit_registry() -> TimeUnitRegistry:
+    """return current immutable registry of units of time"""
+    return _registry
+
+
+def register_time_unit(
+    letter: str,
+    seconds: int,
+    singular: str,
+    plural: str,
+    *,
+    pandas: str | None = None,
+    polars: str | None = None,
+    format_labels: bool = False,
+) -> TimeUnit:
+    """register custom unit of time, understood by parsers
+
+    - e.g. register_time_unit('q', 90 * 86400, 'quarter', 'quarters') lets
+      '2q' and '2 quarters' be parsed
+    - formatters only use the unit on request, so formatting of builtin
+      durations does not change, e.g. 180 days is formatted as '2q' only
+      with base_unit='1q', or for every call if format_labels is True
+    - letter can be several letters, e.g. 'td' for trading days
+    - lookup tables are rebuilt once here, not on each use
+
+    ## Inputs
+    - letter: str letter(s) of unit in TimelengthLabel
+    - seconds: int number of seconds in unit
+    - singular: str english name of one unit
+    - plural: str english name of several units
+    - pandas: str pandas offset alias of unit
+    - polars: str polars duration unit, e.g. 'q'
+    - format_labels: bool of whether formatters use unit without base_unit
+
+    ## Returns
+    - registered TimeUnit
+    """
+    if not letter.isalpha() or not letter.isascii():
+        raise Exception('unit letter must be ascii letters: ' + str(letter))
+    if not singular.isalpha() or not plural.isalpha():
+        raise Exception('unit names must be letters')
+    if seconds <= 0:
+        raise Exception('unit seconds must be positive')
+    names = {letter, singular, plural}
+    for unit in _registry.units:
+        if names & {unit.letter, unit.singular, unit.plural}:
+            raise Exception('unit already registered: ' + str(unit))
+
+    unit = TimeUnit(
+        letter, int(seconds), singular, plural, pandas, polars, format_labels
+    )
+    _set_registry(_registry.units + (unit,))
+    return unit
+
+
+def unregister_time_unit(letter: str) -> None:
+    """unregister custom unit of time, builtin units cannot be unregistered"""
+    if letter in [unit.letter for unit in _builtin_units]:
+        raise Exception('cannot unregister builtin unit: ' + str(letter))
+    if letter not in _registry.letter_seconds:
+        raise Exception('unit not registered: ' + str(letter))
+    _set_registry(
+        tuple(unit for unit in _registry.units if unit.letter != letter)
+    )
+
+
+def _set_registry(units: typing.Sequence[TimeUnit]) -> None:
+    global _registry
+
+    from . import timelength_parse
+
+    _registry = _build_registry(units)
+
+    # parses cached under previous registry may now differ
+    timelength_parse.clear_timelength_parse_cache()
+
+
 def get_base_units() -> typing.Mapping[str, int]:
     """return mapping {label: seconds} for standard base units of time"""
-    return {
-        '1s': 1,
-        '1m': 60,
-        '1h': 60 * 60,
-        '1d': 60 * 60 * 24,
-        '1w': 60 * 60 * 24 * 7,
-        '1M': 60 * 60 * 24 * 30,
-        '1y': 60 * 60 * 24 * 365,
-    }
+    return _registry.base_units
 
 
 def get_singular_unit_labels() -> typing.Mapping[spec.SingularTimeUnit, str]:
     """return mapping {english_name: TimelengthLabel} for singular base units"""
-    return {
-        'second': '1s',
-        'minute': '1m',
-        'hour': '1h',
-        'day': '1d',
-        'week': '1w',
-        'month': '1M',
-        'year': '1y',
-    }
+    return _registry.singular_unit_labels  # type: ignore
 
 
 def get_plural_unit_labels() -> typing.Mapping[spec.PluralTimeUnit, str]:
     """return mapping {english_name: TimelengthLabel} for plural base units"""
-    return {
-        'seconds': '1s',
-        'minutes': '1m',
-        'hours': '1h',
-        'days': '1d',
-        'weeks': '1w',
-        'months': '1M',
-        'years': '1y',
-    }
+    return _registry.plural_unit_labels  # type: ignore
 
 
 def get_unit_labels() -> typing.Mapping[str, str]:
     """return mapping of singular and plural unit labels"""
-    return dict(
-        typing.cast(typing.Mapping[str, str], get_singular_unit_labels()),
-        **typing.cast(typing.Mapping[str, str], get_plural_unit_labels()),
-    )
+    return _registry.unit_labels
 
 
 def unit_letters_to_names() -> typing.Mapping[str, spec.SingularTimeUnit]:
     """return mapping {TimelengthLabel: english_name} for singular base units"""
-    return {v[-1]: k for k, v in get_singular_unit_labels().items()}
+    return _registry.letters_to_names  # type: ignore
 
 
 def datetime_singular_unit_labels() -> typing.Mapping[spec.DatetimeUnit, str]:
     """return mapping {english_name: TimelengthLabel} for singular base units"""
-    return {
-        'second': '1s',
-        'minute': '1m',
-        'hour': '1h',
-        'day': '1d',
-        'month': '1M',
-        'year': '1y',
-    }
+    return _datetime_singular_unit_labels
 
 
 def datetime_unit_letters_to_names() -> typing.Mapping[str, spec.DatetimeUnit]:
-    return {v[-1]: k for k, v in datetime_singular_unit_labels().items()}
+    return _datetime_unit_letters_to_names
 
 
 def get_english_to_pandas_units() -> typing.Mapping[str, str]:
     # https://pandas.pydata.org/pandas-docs/stable/user_guide/timeseries.html#timeseries-offset-aliases
-    return {
-        'year': 'YS',
-        'years': 'YS',
-        'month': 'MS',
-        'months': 'MS',
-        'day': 'D',
-        'days': 'D',
-        'hour': 'H',
-        'hours': 'H',
-        'minute': 'T',
-        'minutes': 'T',
-    }
+    return _registry.english_to_pandas
 
 
 def get_pandas_unit_to_english() -> typing.Mapping[str, str]:
-    return {v: k for k, v in get_english_to_pandas_units().items()}
+    return _registry.pandas_to_english
+
+
+def get_label_to_polars_units() -> typing.Mapping[str, str]:
+    """return mapping {base unit TimelengthLabel: polars duration unit}"""
+    return _registry.label_to_polars
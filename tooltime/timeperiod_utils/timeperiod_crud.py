@@ -9,6 +9,11 @@ from .. import timelength_utils
 from . import timeperiod_identify
 
 
+_timelength_to_seconds_precise = timelength_utils.compile_timelength_converter(
+    'TimelengthSecondsPrecise'
+)
+
+
 def create_timeperiod(
     start: spec.Timestamp | None = None,
     end: spec.Timestamp | None = None,
@@ -104,7 +109,7 @@ def compute_start_end(
     elif isinstance(length, int):
         length_seconds = length
     elif isinstance(length, datetime.timedelta) or isinstance(length, str):
-        length_seconds = timelength_utils.timelength_to_seconds_precise(length)
+        length_seconds = _timelength_to_seconds_precise(length)
 
     # compute unknown bounds
     if end is not None and length_seconds is not None:
@@ -116,11 +121,11 @@ def compute_start_end(
     else:
         raise Exception('must specify exactly 2 inputs')
 
-    if type(start).__name__.startswith('int'):
+    if spec.is_int_scalar(start):
         start = int(start)
     else:
         start = float(start)
-    if type(end).__name__.startswith('int'):
+    if spec.is_int_scalar(end):
         end = int(end)
     else:
         end = float(end)
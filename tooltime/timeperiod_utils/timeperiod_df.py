@@ -5,7 +5,6 @@ import typing
 from tooltime import spec
 
 if typing.TYPE_CHECKING:
-    import datetime
     import polars as pl
 
 
@@ -19,6 +18,7 @@ def get_intervals(
     clip_inward: bool = False,
     include_end: bool = False,
     resolution: typing.Literal['ms', 'us', 'ns'] = 'ms',
+    timezone: str | None = None,
 ) -> pl.DataFrame:
     """return standardized, integer-aligned time intervals over range
 
@@ -34,8 +34,14 @@ def get_intervals(
         - week are the exception, weeks begin on sunday
             - December 28, 1969 is sunday 0
             - January 4, 170 is sunday 1
+    - timezone: IANA timezone name for local calendar intervals, default UTC
+        - boundaries are aligned in local wall clock time, so local days can
+          be 23 or 25 hours long across daylight saving transitions
+        - second, minute, and hour intervals begin at the local boundary at
+          or before start and are aligned to local wall clock multiples, so
+          multi-hour intervals like '2h' can be an hour shorter or longer
+          across daylight saving transitions
     """
-    import datetime
     import math
     import tooltime
     import polars as pl
@@ -75,19 +81,26 @@ def get_intervals(
             break
 
     # parse interval
-    count = int(interval[:-1])
-    unit = interval[-1]
-    if unit == 'q':
-        count = 3 * count
-        unit = 'M'
+    count, unit = tooltime.parse_interval_label(interval)
 
-    # create float and datetime representations of bounds
+    # create float representations of bounds
     start = tooltime.timestamp_to_seconds_precise(start)
     end = tooltime.timestamp_to_seconds_precise(end)
-    start_dt = tooltime.timestamp_to_datetime(start)
-    end_dt = tooltime.timestamp_to_datetime(end)
 
-    if unit in ['s', 'm', 'h', 'd']:
+    multiplier = {'ms': 1000, 'us': 1000000, 'ns': 1000000000}[resolution]
+    if timezone is not None:
+        bounds = _get_local_bounds(
+            start, end, count, unit, include_end, timezone, resolution
+        )
+        if unit in ['d', 'w']:
+            label_col = _create_label(count, '%Y-%m-%d', '-1d', label)
+        elif unit == 'M':
+            label_col = _create_label(count, '%Y-%m', '-1mo', label)
+        elif unit == 'y':
+            label_col = _create_label(count, '%Y', '-1y', label)
+        else:
+            label_col = _create_label(count, '%Y-%m-%d %T', '-1' + unit, label)
+    elif unit in ['s', 'm', 'h', 'd']:
         # simple units are just an integer number of seconds
         if unit == 's':
             duration = count
@@ -101,11 +114,9 @@ def get_intervals(
             raise Exception('invalid interval unit')
         start = math.floor(start / duration) * duration
         end = math.ceil(end / duration) * duration
-        timestamps = []
-        for seconds in range(start, end + duration, duration):
-            timestamps.append(_seconds_to_dt(seconds))
+        timestamps = list(range(start, end + duration, duration))
         if include_end:
-            timestamps.append(_seconds_to_dt(end + duration))
+            timestamps.append(end + duration)
 
         if unit == 'd':
             label_col = _create_label(count, '%Y-%m-%d', '-1d', label)
@@ -118,67 +129,66 @@ def get_intervals(
         duration = 86400 * 7 * count
         start_week = math.floor((start - first_sunday) / duration)
         end_week = math.ceil((end - first_sunday) / duration)
-        raw_timestamps = range(
-            start_week * duration + first_sunday,
-            end_week * duration + first_sunday + duration,
-            duration,
+        timestamps = list(
+            range(
+                start_week * duration + first_sunday,
+                end_week * duration + first_sunday + duration,
+                duration,
+            )
         )
-        timestamps = [_seconds_to_dt(timestamp) for timestamp in raw_timestamps]
         if include_end:
-            timestamps.append(
-                _seconds_to_dt(end_week * duration + first_sunday + duration)
-            )
+            timestamps.append(end_week * duration + first_sunday + duration)
         label_col = _create_label(count, '%Y-%m-%d', '-1d', label)
     elif unit == 'M':
-        # compute months from unix genesis and then divide into years
-        start_month = (start_dt.year - 1970) * 12 + start_dt.month - 1
+        # compute months from unix genesis using month start table
+        start_month = tooltime.seconds_to_month_index(math.floor(start))
         start_month = math.floor(start_month / count) * count
 
-        if end_dt == datetime.datetime(
-            year=end_dt.year,
-            month=end_dt.month,
-            day=1,
-            tzinfo=datetime.timezone.utc,
-        ):
-            end_month = (end_dt.year - 1970) * 12 + end_dt.month - 1
-        else:
-            end_month = (end_dt.year - 1970) * 12 + end_dt.month - 1 + 1
+        end_month = tooltime.seconds_to_month_index(math.floor(end))
+        if tooltime.month_index_to_seconds(end_month) != end:
+            end_month = end_month + 1
         end_month = math.ceil(end_month / count) * count
 
-        timestamps = []
         if include_end:
             end_range_month = end_month + count + count
         else:
             end_range_month = end_month + count
-        for month in range(start_month, end_range_month, count):
-            dt = _to_dt(1970 + math.floor(month / 12), month % 12 + 1, 1)
-            timestamps.append(dt)
+        timestamps = [
+            tooltime.month_index_to_seconds(month)
+            for month in range(start_month, end_range_month, count)
+        ]
         label_col = _create_label(count, '%Y-%m', '-1mo', label)
     elif unit == 'y':
-        # compute years from unix genesis
-        start_year = math.floor(start_dt.year / count) * count
-        if end_dt == _to_dt(year=end_dt.year, month=1, day=1):
-            end_year = math.ceil(end_dt.year / count) * count
+        # compute years from unix genesis using month start table
+        start_year = tooltime.seconds_to_month_index(math.floor(start))
+        start_year = 1970 + math.floor(start_year / 12)
+        start_year = math.floor(start_year / count) * count
+
+        end_month = tooltime.seconds_to_month_index(math.floor(end))
+        end_year = 1970 + math.floor(end_month / 12)
+        year_start_month = (end_year - 1970) * 12
+        if tooltime.month_index_to_seconds(year_start_month) == end:
+            end_year = math.ceil(end_year / count) * count
         else:
-            end_year = math.ceil((end_dt.year + 1) / count) * count
-        timestamps = []
-        for year in range(start_year, end_year + count, count):
-            timestamps.append(_to_dt(year=year, month=1, day=1))
+            end_year = math.ceil((end_year + 1) / count) * count
         if include_end:
-            timestamps.append(_to_dt(year=end_year + count, month=1, day=1))
+            end_range_year = end_year + count + count
+        else:
+            end_range_year = end_year + count
+        timestamps = [
+            tooltime.month_index_to_seconds((year - 1970) * 12)
+            for year in range(start_year, end_range_year, count)
+        ]
         label_col = _create_label(count, '%Y', '-1y', label)
     else:
         raise Exception('invalid unit')
 
     # generate dataframe
-    timezone = 'utc'
-    df = pl.DataFrame(
-        {'start': timestamps[:-1], 'end': timestamps[1:]},
-        schema={
-            'start': pl.Datetime(resolution, timezone),
-            'end': pl.Datetime(resolution, timezone),
-        },
-    )
+    if timezone is None:
+        bounds = (pl.Series(timestamps, dtype=pl.Int64) * multiplier).cast(
+            pl.Datetime(resolution, 'utc')
+        )
+    df = pl.DataFrame({'start': bounds[:-1], 'end': bounds[1:]})
 
     # trim extraneous
     if include_end:
@@ -213,18 +223,72 @@ def get_intervals(
     return df
 
 
-def _to_dt(year: int, month: int, day: int) -> datetime.datetime:
-    import datetime
+def _get_local_bounds(
+    start: int | float,
+    end: int | float,
+    count: int,
+    unit: str,
+    include_end: bool,
+    timezone: str,
+    resolution: typing.Literal['ms', 'us', 'ns'],
+) -> pl.Series:
+    """generate interval boundaries aligned to local wall clock time
+
+    - boundaries are generated as a naive polars datetime range in local wall
+      clock time, then resolved to utc using the timezone transition table
+    - skipped local boundaries resolve to the end of the skipped period
+    - repeated local boundaries of sub-day intervals occur once per repeat
+    """
+    import math
+    import polars as pl
+    from tooltime import timelength_utils
+    from tooltime import timestamp_utils
+
+    try:
+        import numpy as np
+    except ImportError:
+        raise Exception('numpy required for timezone intervals')
 
-    return datetime.datetime(
-        year=year, month=month, day=day, tzinfo=datetime.timezone.utc
+    interval = str(count) + unit
+    local_start = timestamp_utils.timestamps_to_local(
+        math.floor(start), timezone
+    )
+    local_end = timestamp_utils.timestamps_to_local(math.floor(end), timezone)
+    local_end += end - math.floor(end)
+    first = timestamp_utils.truncate_timestamp_seconds(local_start, interval)
+    last = timestamp_utils.truncate_timestamp_seconds(
+        local_end, interval, 'ceiling'
     )
+    if include_end:
+        last = timestamp_utils.truncate_timestamp_seconds(
+            last + 1, interval, 'ceiling'
+        )
 
+    polars_units = timelength_utils.get_label_to_polars_units()
+    local_bounds = pl.datetime_range(
+        pl.lit(first * 1000).cast(pl.Datetime('ms')),
+        pl.lit(last * 1000).cast(pl.Datetime('ms')),
+        interval=str(count) + polars_units['1' + unit],
+        time_unit='ms',
+        eager=True,
+    )
+    local_seconds = local_bounds.cast(pl.Int64).to_numpy() // 1000
 
-def _seconds_to_dt(seconds: int | float) -> datetime.datetime:
-    import datetime
+    seconds = timestamp_utils.local_to_timestamps(local_seconds, timezone)
+    if unit in ['s', 'm', 'h']:
+        latest = timestamp_utils.local_to_timestamps(
+            local_seconds, timezone, ambiguous='latest'
+        )
+        seconds = np.union1d(seconds, latest)
+    else:
+        seconds = np.unique(seconds)
 
-    return datetime.datetime.fromtimestamp(seconds, datetime.timezone.utc)
+    multiplier = {'ms': 1000, 'us': 1000000, 'ns': 1000000000}[resolution]
+    return (
+        (pl.Series(seconds, dtype=pl.Int64) * multiplier)
+        .cast(pl.Datetime(resolution, 'UTC'))
+        .dt.convert_time_zone(timezone)
+    )
 
 
 def _create_label(
@@ -7,6 +7,11 @@ from .. import timelength_utils
 from . import timeperiod_crud
 
 
+_timelength_to_seconds = timelength_utils.compile_timelength_converter(
+    'TimelengthSeconds'
+)
+
+
 def timeperiods_overlap(
     timeperiod_lhs: spec.Timeperiod, timeperiod_rhs: spec.Timeperiod
 ) -> bool:
@@ -87,14 +92,10 @@ def create_overlapping_timeperiod(
     if trim_end_relative is not None:
         new_end = new_end - spec.to_numeric(trim_end_relative) * length
     if trim_start_absolute is not None:
-        trim_start_seconds = timelength_utils.timelength_to_seconds(
-            trim_start_absolute
-        )
+        trim_start_seconds = _timelength_to_seconds(trim_start_absolute)
         new_start = new_start + trim_start_seconds
     if trim_end_absolute is not None:
-        trim_end_seconds = timelength_utils.timelength_to_seconds(
-            trim_end_absolute
-        )
+        trim_end_seconds = _timelength_to_seconds(trim_end_absolute)
         new_end = new_end - trim_end_seconds
 
     # extend boundaries
@@ -103,14 +104,10 @@ def create_overlapping_timeperiod(
     if extend_end_relative is not None:
         new_end = new_end + spec.to_numeric(extend_end_relative) * length
     if extend_start_absolute is not None:
-        extend_start_seconds = timelength_utils.timelength_to_seconds(
-            extend_start_absolute
-        )
+        extend_start_seconds = _timelength_to_seconds(extend_start_absolute)
         new_start = new_start - extend_start_seconds
     if extend_end_absolute is not None:
-        extend_end_seconds = timelength_utils.timelength_to_seconds(
-            extend_end_absolute
-        )
+        extend_end_seconds = _timelength_to_seconds(extend_end_absolute)
         new_end = new_end + extend_end_seconds
 
     return (new_start, new_end)
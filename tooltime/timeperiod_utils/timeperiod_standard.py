@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import datetime
+import functools
 import math
+import time
 import typing
 
 from .. import spec
@@ -9,6 +10,7 @@ from .. import timelength_utils
 from .. import timestamp_utils
 
 if typing.TYPE_CHECKING:
+    import numpy as np
     import polars as pl
 
 
@@ -21,6 +23,7 @@ def get_standard_timeperiod(
     include_start: bool = True,
     include_end: bool = False,
     boundary_unit: spec.DatetimeUnit = 'second',
+    timezone: str | None = None,
 ) -> spec.TimeperiodMapSeconds:
     """get standardized Timeperiod that contains a specific Timestamp
 
@@ -28,12 +31,13 @@ def get_standard_timeperiod(
     - standardized boundaries are integer multiples of some block_unit
     - should specify either timelength_label or block_unit to define block unit
     - should specify block_size to define integer multiple, or use default of 1
+    - to bucket many timestamps, construct a Bucketer once and reuse it
 
     ## Example Usage
     timeperiod = tooltime.get_standard_timeperiod(
         timestamp=1600000000,
         block_size=5,
-        block_unit='minutes',
+        block_unit='minute',
     )
     tooltime.print_timeperiod(timeperiod)
     > [20200913_122500Z, 20200913_122959Z]
@@ -46,83 +50,392 @@ def get_standard_timeperiod(
     - include_start: bool of whether to include start boundary of timeperiod
     - include_end: bool of whether to include end boundary of timeperiod
     - boundary_unit: str name of boundary unit to be shaved off open intervals
+    - timezone: str name of IANA timezone, default is UTC
     """
+    bucketer = _get_bucketer(
+        timelength_label=timelength_label,
+        block_unit=block_unit,
+        block_size=block_size,
+        include_start=include_start,
+        include_end=include_end,
+        boundary_unit=boundary_unit,
+        timezone=timezone,
+    )
+    return bucketer.timeperiod(timestamp)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_bucketer(
+    timelength_label: spec.TimelengthLabel | None,
+    block_unit: spec.DatetimeUnit | None,
+    block_size: int | None,
+    include_start: bool,
+    include_end: bool,
+    boundary_unit: spec.DatetimeUnit,
+    timezone: str | None,
+) -> Bucketer:
+    return Bucketer(
+        timelength_label,
+        block_unit=block_unit,
+        block_size=block_size,
+        include_start=include_start,
+        include_end=include_end,
+        boundary_unit=boundary_unit,
+        timezone=timezone,
+    )
+
 
-    weekwise = None
-    if (timelength_label is not None) and (block_unit is not None):
-        raise Exception('must specify either timelength_label or block_unit')
-    elif (timelength_label is None) and (block_unit is not None):
-        if block_size is None:
-            block_size = 1
-    elif (timelength_label is not None) and (block_unit is None):
-        if timelength_label.endswith('w'):
-            weekwise = timelength_label
-            number = int(timelength_label[:-1])
-            timelength_label = str(7 * number) + 'd'
-
-        block_size = int(timelength_label[:-1])
-        unit_letters_to_names = (
-            timelength_utils.datetime_unit_letters_to_names()
+_block_unit_seconds = {
+    'second': 1,
+    'minute': 60,
+    'hour': 60 * 60,
+    'day': 60 * 60 * 24,
+}
+
+_parent_unit_seconds = {
+    'second': 60,
+    'minute': 60 * 60,
+    'hour': 60 * 60 * 24,
+}
+
+_boundary_unit_seconds: dict[str, int | float] = {
+    'microsecond': 0.000001,
+    'second': 1,
+    'minute': 60,
+    'hour': 60 * 60,
+    'day': 60 * 60 * 24,
+}
+
+# weeks begin on sunday, unix genesis was a thursday
+_week_offset = -4 * 86400
+
+
+class Bucketer:
+    """assigns timestamps to standardized timeperiods
+
+    - all parsing happens once at construction, bucketing is integer arithmetic
+    - blocks are integer multiples of block_unit within the next larger unit,
+      in the same way as get_standard_timeperiod()
+        - e.g. '15m' blocks start at minutes 0, 15, 30, 45 of each hour
+        - e.g. '3d' blocks start at days 1, 4, 7, ... of each month
+        - weeks are blocks of 7 * block_size days beginning on sunday
+    - if timezone is given, blocks follow local wall clock time, so e.g.
+      '1d' buckets span local midnight to local midnight across daylight
+      saving transitions
+    - scalar methods take a Timestamp, vectorized methods take an array of
+      int or float seconds and require numpy
+
+    ## Example Usage
+    bucketer = tooltime.Bucketer('15m')
+    bucketer.start(1600000000)
+    > 1599999300
+    bucketer.starts(timestamps)
+    > array([...])
+    """
+
+    __slots__ = (
+        '_blocks_per_parent',
+        '_end_trim',
+        '_start_trim',
+        'block_size',
+        'block_unit',
+        'boundary_unit',
+        'include_end',
+        'include_start',
+        'timezone',
+    )
+
+    block_unit: typing.Literal[
+        'second', 'minute', 'hour', 'day', 'week', 'month', 'year'
+    ]
+    block_size: int
+    include_start: bool
+    include_end: bool
+    boundary_unit: spec.DatetimeUnit
+    timezone: str | None
+
+    def __init__(
+        self,
+        timelength_label: spec.TimelengthLabel | None = None,
+        *,
+        block_unit: typing.Optional[spec.DatetimeUnit] = None,
+        block_size: typing.Optional[int] = None,
+        include_start: bool = True,
+        include_end: bool = False,
+        boundary_unit: spec.DatetimeUnit = 'second',
+        timezone: str | None = None,
+    ) -> None:
+        """create Bucketer
+
+        ## Inputs
+        - timelength_label: TimelengthLabel
+        - block_unit: str name of time unit
+        - block_size: int size of block unit
+        - include_start: bool of whether to include start boundary of bucket
+        - include_end: bool of whether to include end boundary of bucket
+        - boundary_unit: str name of boundary unit to be shaved off open
+          intervals
+        - timezone: str name of IANA timezone, default is UTC
+        """
+        if (timelength_label is not None) and (block_unit is not None):
+            raise Exception(
+                'must specify either timelength_label or block_unit'
+            )
+        elif (timelength_label is None) and (block_unit is not None):
+            if block_size is None:
+                block_size = 1
+            unit: str = block_unit
+        elif (timelength_label is not None) and (block_unit is None):
+            block_size, letter = timestamp_utils.parse_interval_label(
+                timelength_label
+            )
+            if letter == 'w':
+                unit = 'week'
+            else:
+                unit_letters_to_names = (
+                    timelength_utils.datetime_unit_letters_to_names()
+                )
+                unit = unit_letters_to_names[letter]
+        else:
+            raise Exception(
+                'must specify either timelength_label or block_unit'
+            )
+        if unit not in (
+            'second',
+            'minute',
+            'hour',
+            'day',
+            'week',
+            'month',
+            'year',
+        ):
+            raise Exception('invalid block_unit: ' + str(unit))
+        if block_size is None or block_size <= 0:
+            raise Exception('block_size must be a positive integer')
+        if boundary_unit not in _boundary_unit_seconds:
+            raise Exception('invalid boundary_unit: ' + str(boundary_unit))
+
+        self.block_unit = unit  # type: ignore
+        self.block_size = block_size
+        self.include_start = include_start
+        self.include_end = include_end
+        self.boundary_unit = boundary_unit
+        self.timezone = timezone
+        if timezone is not None:
+            # compile transition table once, up front
+            timestamp_utils.get_timezone_table(timezone)
+
+        boundary = _boundary_unit_seconds[boundary_unit]
+        self._start_trim = 0 if include_start else boundary
+        self._end_trim = 0 if include_end else -boundary
+
+        # number of index values reserved per parent unit
+        if unit in _parent_unit_seconds:
+            n_per_parent = (
+                _parent_unit_seconds[unit] // _block_unit_seconds[unit]
+            )
+        elif unit == 'day':
+            n_per_parent = 31
+        elif unit == 'month':
+            n_per_parent = 12
+        else:
+            n_per_parent = 1
+        self._blocks_per_parent = -(-n_per_parent // block_size)
+
+    def __repr__(self) -> str:
+        return (
+            'Bucketer(block_unit='
+            + repr(self.block_unit)
+            + ', block_size='
+            + str(self.block_size)
+            + (
+                ''
+                if self.timezone is None
+                else ', timezone=' + repr(self.timezone)
+            )
+            + ')'
         )
-        block_unit = unit_letters_to_names[timelength_label[-1]]
-    elif (timelength_label is None) and (block_unit is None):
-        raise Exception()
-    else:
-        raise Exception()
 
-    if block_unit is None:
-        raise Exception('block_unit must be set')
+    #
+    # # block arithmetic, shared by scalar and vectorized methods
+    #
+
+    def _bounds(self, seconds: typing.Any) -> tuple[typing.Any, typing.Any]:
+        """compute untrimmed [start, end) of blocks, in utc seconds"""
+        if self.timezone is None:
+            return self._block_bounds(seconds)
+        offsets = timestamp_utils.get_utc_offsets(seconds, self.timezone)
+        start, end = self._block_bounds(seconds + offsets)
+        return (
+            timestamp_utils.resolve_local_timestamps(
+                start, offsets, self.timezone
+            ),
+            timestamp_utils.resolve_local_timestamps(
+                end, offsets, self.timezone
+            ),
+        )
+
+    def _index(self, seconds: typing.Any) -> typing.Any:
+        """compute index of blocks, using local time if timezone is set"""
+        if self.timezone is not None:
+            seconds = timestamp_utils.timestamps_to_local(
+                seconds, self.timezone
+            )
+        return self._block_index(seconds)
+
+    def _block_bounds(
+        self, seconds: typing.Any
+    ) -> tuple[typing.Any, typing.Any]:
+        """compute untrimmed [start, end) of blocks containing int seconds"""
+        unit = self.block_unit
+        size = self.block_size
+        if unit in _parent_unit_seconds:
+            width = size * _block_unit_seconds[unit]
+            parent = _parent_unit_seconds[unit]
+            parent_start = seconds - seconds % parent
+            start = parent_start + (seconds % parent) // width * width
+            return start, start + width
+        elif unit == 'day':
+            month_index = timestamp_utils.seconds_to_month_index(seconds)
+            month_start = timestamp_utils.month_index_to_seconds(month_index)
+            day_of_month = (seconds - month_start) // 86400
+            start = month_start + (day_of_month - day_of_month % size) * 86400
+            return start, start + size * 86400
+        elif unit == 'week':
+            width = size * 7 * 86400
+            start = (seconds - _week_offset) // width * width + _week_offset
+            return start, start + width
+        elif unit == 'month':
+            month_index = timestamp_utils.seconds_to_month_index(seconds)
+            start_index = month_index - (month_index % 12) % size
+            start = timestamp_utils.month_index_to_seconds(start_index)
+            end = timestamp_utils.month_index_to_seconds(start_index + size)
+            return start, end
+        elif unit == 'year':
+            month_index = timestamp_utils.seconds_to_month_index(seconds)
+            year = month_index // 12 + 1970
+            start_index = (year - year % size - 1970) * 12
+            start = timestamp_utils.month_index_to_seconds(start_index)
+            end = timestamp_utils.month_index_to_seconds(
+                start_index + 12 * size
+            )
+            return start, end
+        else:
+            raise Exception('invalid block_unit: ' + str(unit))
+
+    def _block_index(self, seconds: typing.Any) -> typing.Any:
+        """compute index of blocks containing int seconds"""
+        unit = self.block_unit
+        size = self.block_size
+        if unit in _parent_unit_seconds:
+            width = size * _block_unit_seconds[unit]
+            parent = _parent_unit_seconds[unit]
+            return (seconds // parent) * self._blocks_per_parent + (
+                seconds % parent
+            ) // width
+        elif unit == 'day':
+            month_index = timestamp_utils.seconds_to_month_index(seconds)
+            month_start = timestamp_utils.month_index_to_seconds(month_index)
+            day_of_month = (seconds - month_start) // 86400
+            return month_index * self._blocks_per_parent + day_of_month // size
+        elif unit == 'week':
+            return (seconds - _week_offset) // (size * 7 * 86400)
+        elif unit == 'month':
+            month_index = timestamp_utils.seconds_to_month_index(seconds)
+            year = month_index // 12 + 1970
+            return year * self._blocks_per_parent + (month_index % 12) // size
+        elif unit == 'year':
+            month_index = timestamp_utils.seconds_to_month_index(seconds)
+            return (month_index // 12 + 1970) // size
+        else:
+            raise Exception('invalid block_unit: ' + str(unit))
+
+    #
+    # # scalar methods
+    #
+
+    def start(
+        self, timestamp: spec.Timestamp | None = None
+    ) -> spec.TimestampSeconds:
+        """get start of bucket containing timestamp, default is now"""
+        start, _ = self._bounds(_floor_seconds(timestamp))
+        return int(start + self._start_trim)
+
+    def end(
+        self, timestamp: spec.Timestamp | None = None
+    ) -> spec.TimestampSeconds:
+        """get end of bucket containing timestamp, default is now"""
+        _, end = self._bounds(_floor_seconds(timestamp))
+        return int(end + self._end_trim)
+
+    def index(self, timestamp: spec.Timestamp | None = None) -> int:
+        """get index of bucket containing timestamp, default is now
+
+        - indices increase with time and uniquely identify each bucket
+        - indices are consecutive when block_size evenly divides the next
+          larger unit, e.g. '15m' or '6h'
+        """
+        return int(self._index(_floor_seconds(timestamp)))
+
+    def timeperiod(
+        self, timestamp: spec.Timestamp | None = None
+    ) -> spec.TimeperiodMapSeconds:
+        """get bucket containing timestamp as TimeperiodMap, default is now"""
+        start, end = self._bounds(_floor_seconds(timestamp))
+        return {
+            'start': int(start + self._start_trim),
+            'end': int(end + self._end_trim),
+        }
+
+    #
+    # # vectorized methods
+    #
+
+    def starts(self, timestamps: typing.Any) -> np.ndarray:
+        """get starts of buckets containing array of seconds"""
+        start, _ = self._bounds(_floor_seconds_array(timestamps))
+        return _trim_array(start, self._start_trim)
+
+    def ends(self, timestamps: typing.Any) -> np.ndarray:
+        """get ends of buckets containing array of seconds"""
+        _, end = self._bounds(_floor_seconds_array(timestamps))
+        return _trim_array(end, self._end_trim)
+
+    def indices(self, timestamps: typing.Any) -> np.ndarray:
+        """get indices of buckets containing array of seconds"""
+        return self._index(_floor_seconds_array(timestamps))  # type: ignore
 
-    # create timestamp datetime
-    if timestamp is not None:
-        dt = timestamp_utils.timestamp_to_datetime(timestamp)
-    else:
-        dt = datetime.datetime.now(datetime.timezone.utc)
-
-    # compute from_datetime
-    current_unit = getattr(dt, block_unit)
-    lowest_unit_value = timestamp_utils.get_unit_lowest_value(block_unit)
-    current_block = math.floor((current_unit - lowest_unit_value) / block_size)
-    from_unit = current_block * block_size + lowest_unit_value
-    from_datetime = timestamp_utils.floor_datetime(dt, block_unit)
-    kwargs: dict[str, int] = {str(block_unit): from_unit}
-    from_datetime = from_datetime.replace(tzinfo=from_datetime.tzinfo, **kwargs)
-
-    # compute to_datetime
-    if block_unit == 'month':
-        # datetime.timedelta does not support months
-        to_month_raw = from_datetime.month + block_size
-
-        to_month = to_month_raw
-        to_year = from_datetime.year
-        while to_month > 12:
-            to_month -= 12
-            to_year += 1
-        to_datetime = from_datetime.replace(month=to_month, year=to_year)
-    elif block_unit == 'year':
-        to_year = from_datetime.year + block_size
-        to_datetime = from_datetime.replace(year=to_year)
-    else:
-        block_timedelta = datetime.timedelta(**{(block_unit + 's'): block_size})
-        to_datetime = from_datetime + block_timedelta
 
-    # trim boundaries
-    if not include_start:
-        timedelta = datetime.timedelta(**{(boundary_unit + 's'): 1})
-        from_datetime = from_datetime + timedelta
-    if not include_end:
-        timedelta = datetime.timedelta(**{(boundary_unit + 's'): 1})
-        to_datetime = to_datetime - timedelta
+def _floor_seconds(timestamp: spec.Timestamp | None) -> int:
+    if timestamp is None:
+        return math.floor(time.time())
+    if spec.is_int_scalar(timestamp):
+        return int(timestamp)  # type: ignore
+    return math.floor(timestamp_utils.timestamp_to_seconds_precise(timestamp))
 
-    # get timestamps
-    start = int(from_datetime.timestamp())
-    end = int(to_datetime.timestamp())
 
-    if weekwise is not None:
-        start = timestamp_utils.floor_timestamp(start, interval='week')
-        end = timestamp_utils.floor_timestamp(end, interval='week')
+def _floor_seconds_array(timestamps: typing.Any) -> np.ndarray:
+    try:
+        import numpy as np
+    except ImportError:
+        raise Exception('numpy required for vectorized bucketing')
 
-    return {'start': start, 'end': end}
+    values = np.asarray(timestamps)
+    if values.dtype.kind == 'f':
+        return np.floor(values).astype(np.int64)
+    else:
+        return values.astype(np.int64, copy=False)
+
+
+def _trim_array(seconds: np.ndarray, trim: int | float) -> np.ndarray:
+    import numpy as np
+
+    if trim == 0:
+        return seconds
+    elif isinstance(trim, int):
+        return seconds + trim
+    else:
+        return np.trunc(seconds + trim).astype(np.int64)
 
 
 def get_standard_intervals(
@@ -131,7 +444,9 @@ def get_standard_intervals(
     end_time: typing.Optional[spec.Timestamp] = None,
     n_intervals: typing.Optional[int] = None,
     window_size: typing.Optional[spec.Timelength] = None,
-) -> list[spec.TimestampSeconds]:
+    *,
+    output: typing.Literal['list', 'range'] = 'list',
+) -> typing.Any:
     """
     ## Valid Inputs
     - {start_time, end_time, interval_size}
@@ -140,6 +455,12 @@ def get_standard_intervals(
     - {interval_size, {n_intervals or window_size}}
     - note that interval_size is always necessary
     - cannot specify {start_time, end_time, {n_intervals or window_size}} because that won't be standardized
+
+    ## Outputs
+    - 'list': list of int timestamps
+    - 'range': TimestampRange, computed without pandas, only for interval
+      sizes that form evenly spaced grids, i.e. weeks, single days, and
+      seconds, minutes, or hours that evenly divide the next larger unit
     """
 
     # validate inputs
@@ -194,6 +515,16 @@ def get_standard_intervals(
         )
         date_range_kwargs['end'] = timeperiod['end'] * 1000000000
 
+    if output == 'range':
+        return _get_standard_interval_range(
+            interval_size=interval_size,
+            start=date_range_kwargs.get('start'),
+            end=date_range_kwargs.get('end'),
+            n_intervals=n_intervals,
+        )
+    elif output != 'list':
+        raise Exception('unknown output format: ' + str(output))
+
     # create intervals
     import pandas as pd  # type: ignore
 
@@ -205,6 +536,58 @@ def get_standard_intervals(
     return timestamps
 
 
+def _get_standard_interval_range(
+    interval_size: spec.Timelength,
+    start: int | None,
+    end: int | None,
+    n_intervals: int | None,
+) -> timestamp_utils.TimestampRange:
+    """build evenly spaced standard intervals, as in pd.date_range()"""
+    bucketer = _get_bucketer(
+        timelength_label=timelength_utils.timelength_to_label(interval_size),
+        block_unit=None,
+        block_size=None,
+        include_start=True,
+        include_end=True,
+        boundary_unit='second',
+        timezone=None,
+    )
+    unit = bucketer.block_unit
+    size = bucketer.block_size
+    if unit == 'week':
+        step = size * 7 * 86400
+    elif unit == 'day' and size == 1:
+        step = 86400
+    elif (
+        unit in _parent_unit_seconds
+        and _parent_unit_seconds[unit] % (size * _block_unit_seconds[unit]) == 0
+    ):
+        step = size * _block_unit_seconds[unit]
+    else:
+        raise Exception(
+            'interval_size does not form evenly spaced grid: '
+            + str(interval_size)
+        )
+
+    # bounds are given in nanoseconds
+    if start is not None:
+        start = start // 1000000000
+    if end is not None:
+        end = end // 1000000000
+    if start is not None and end is not None:
+        return timestamp_utils.TimestampRange(start, end + step, step)
+    elif start is not None and n_intervals is not None:
+        return timestamp_utils.TimestampRange.from_count(
+            start, step, n_intervals
+        )
+    elif end is not None and n_intervals is not None:
+        return timestamp_utils.TimestampRange.from_count(
+            end - (n_intervals - 1) * step, step, n_intervals
+        )
+    else:
+        raise Exception('underdetermined system, specify more parameters')
+
+
 def get_interval_df(
     interval_size: spec.Timelength,
     start_time: typing.Optional[spec.Timestamp] = None,
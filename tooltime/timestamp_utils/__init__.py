@@ -1,6 +1,13 @@
 from .datetime_utils import *
+from .timestamp_calendar import *
 from .timestamp_convert import *
 from .timestamp_crud import *
+from .timestamp_df import *
 from .timestamp_identify import *
 from .timestamp_introspect import *
+from .timestamp_range import *
 from .timestamp_samples import *
+from .timestamp_summarize import *
+from .timestamp_timezone import *
+from .timestamp_truncate import *
+from .timestamp_validate import *
@@ -0,0 +1,375 @@
+from __future__ import annotations
+
+import array
+import bisect
+import math
+import typing
+
+from .. import spec
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+
+    IntOrArray = typing.TypeVar('IntOrArray', int, np.ndarray)
+
+
+#
+# # civil date arithmetic
+#
+# integer-only proleptic gregorian conversions between days since epoch and
+# (year, month, day), see http://howardhinnant.github.io/date_algorithms.html
+# - every operation is a floor division, modulo, or comparison, so the same
+#   code operates on python ints and on numpy int64 arrays
+#
+
+
+def days_from_civil(
+    year: IntOrArray, month: IntOrArray, day: IntOrArray
+) -> IntOrArray:
+    """convert (year, month, day) to number of days since 1970-01-01
+
+    ## Inputs
+    - year: int or int array of year
+    - month: int or int array of month, in range [1, 12]
+    - day: int or int array of day of month, in range [1, 31]
+    """
+    y = year - (month <= 2)
+    era = y // 400
+    yoe = y - era * 400
+    mp = (month + 9) % 12
+    doy = (153 * mp + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468  # type: ignore
+
+
+def civil_from_days(
+    days: IntOrArray,
+) -> tuple[IntOrArray, IntOrArray, IntOrArray]:
+    """convert number of days since 1970-01-01 to (year, month, day)
+
+    ## Inputs
+    - days: int or int array of days since 1970-01-01
+    """
+    z = days + 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = (mp + 2) % 12 + 1
+    year = yoe + era * 400 + (month <= 2)
+    return year, month, day  # type: ignore
+
+
+def month_index_from_days(days: IntOrArray) -> IntOrArray:
+    """convert days since 1970-01-01 to months since 1970-01"""
+    year, month, _ = civil_from_days(days)
+    return (year - 1970) * 12 + month - 1  # type: ignore
+
+
+def days_from_month_index(month_index: IntOrArray) -> IntOrArray:
+    """convert months since 1970-01 to days since 1970-01-01 of month start"""
+    return days_from_civil(
+        1970 + month_index // 12,
+        month_index % 12 + 1,
+        1,  # type: ignore
+    )
+
+
+#
+# # month start table
+#
+# compact int64 table of month start seconds, built once and shared by all
+# calendar bucketing and month arithmetic
+# - scalar lookups use bisect, array lookups use a corrected position guess
+# - values outside of table range fall back to civil date arithmetic
+#
+
+_month_table_range = (1900, 2200)
+_mean_month_seconds = 2629746  # 365.2425 days / 12
+_month_table: array.array[int] | None = None
+
+
+def set_month_table_range(start_year: int, end_year: int) -> None:
+    """set range of years covered by month start table
+
+    ## Inputs
+    - start_year: int of first year in table
+    - end_year: int of last year in table, inclusive
+    """
+    global _month_table_range, _month_table
+
+    if end_year < start_year:
+        raise Exception('end_year must be greater than or equal to start_year')
+    _month_table_range = (start_year, end_year)
+    _month_table = None
+
+
+def get_month_table_range() -> tuple[int, int]:
+    """get (start_year, end_year) range of years covered by month table"""
+    return _month_table_range
+
+
+def get_month_start_table() -> array.array[int]:
+    """get int64 table of month start seconds
+
+    - table contains one entry per month of get_month_table_range(), plus a
+      final entry for the start of the month after the range
+    - entry i is the start of month i months after January of start_year
+    """
+    global _month_table
+
+    if _month_table is None:
+        start_year, end_year = _month_table_range
+        first = (start_year - 1970) * 12
+        last = (end_year - 1970) * 12 + 12
+        _month_table = array.array(
+            'q',
+            [
+                days_from_month_index(month_index) * 86400
+                for month_index in range(first, last + 1)
+            ],
+        )
+    return _month_table
+
+
+def _get_month_table_array() -> np.ndarray:
+    import numpy as np
+
+    return np.frombuffer(get_month_start_table(), dtype=np.int64)
+
+
+def seconds_to_month_index(seconds: IntOrArray) -> IntOrArray:
+    """convert int seconds to months since 1970-01
+
+    ## Inputs
+    - seconds: int or int array of seconds
+    """
+    table = get_month_start_table()
+    table_offset = (_month_table_range[0] - 1970) * 12
+
+    if spec.is_int_scalar(seconds):
+        seconds = int(seconds)  # type: ignore
+        if table[0] <= seconds < table[-1]:
+            position = bisect.bisect_right(table, seconds) - 1
+            return position + table_offset  # type: ignore
+        else:
+            return month_index_from_days(seconds // 86400)  # type: ignore
+
+    import numpy as np
+
+    seconds_array = np.asarray(seconds)
+    table_array = _get_month_table_array()
+    if seconds_array.size > 0 and (
+        seconds_array.min() < table_array[0]
+        or seconds_array.max() >= table_array[-1]
+    ):
+        return month_index_from_days(seconds_array // 86400)  # type: ignore
+
+    # equivalent to np.searchsorted(table, seconds, side='right') - 1
+    # - guess position from mean month length, which is never off by more
+    #   than one month, then correct the guess against the table
+    # - avoids binary search, which is slow for large unsorted arrays
+    positions = (seconds_array - table_array[0]) // _mean_month_seconds
+    np.clip(positions, 0, len(table_array) - 2, out=positions)
+    positions -= table_array[positions] > seconds_array
+    positions += table_array[positions + 1] <= seconds_array
+    return positions + table_offset  # type: ignore
+
+
+def month_index_to_seconds(month_index: IntOrArray) -> IntOrArray:
+    """convert months since 1970-01 to int seconds of month start
+
+    ## Inputs
+    - month_index: int or int array of months since 1970-01
+    """
+    table = get_month_start_table()
+    table_offset = (_month_table_range[0] - 1970) * 12
+
+    if spec.is_int_scalar(month_index):
+        month_index = int(month_index)  # type: ignore
+        position = month_index - table_offset
+        if 0 <= position < len(table):
+            return table[position]  # type: ignore
+        else:
+            return days_from_month_index(month_index) * 86400  # type: ignore
+
+    import numpy as np
+
+    month_index_array = np.asarray(month_index)
+    positions = month_index_array - table_offset
+    if positions.size > 0 and (
+        positions.min() < 0 or positions.max() >= len(table)
+    ):
+        return days_from_month_index(month_index_array) * 86400  # type: ignore
+    return _get_month_table_array()[positions]  # type: ignore
+
+
+#
+# # calendar components
+#
+
+calendar_components: tuple[spec.CalendarComponent, ...] = (
+    'year',
+    'month',
+    'day',
+    'hour',
+    'minute',
+    'second',
+    'weekday',
+    'iso_week',
+    'iso_year',
+    'day_of_year',
+)
+
+
+def get_calendar_components(
+    timestamps: typing.Any,
+    components: typing.Sequence[spec.CalendarComponent] | None = None,
+    *,
+    output: typing.Literal['dict', 'polars'] = 'dict',
+    timezone: str | None = None,
+) -> typing.Any:
+    """compute calendar components of seconds using integer arithmetic
+
+    - weekday is 0 for monday through 6 for sunday, as in datetime.weekday()
+    - iso_week and iso_year follow ISO 8601, as in datetime.isocalendar()
+    - day_of_year starts at 1
+
+    ## Inputs
+    - timestamps: int or float seconds, or numpy array or polars Series of
+      seconds or datetimes
+    - components: names of components to compute, default is all
+    - output: 'dict' for dict of int arrays, 'polars' for polars struct Series
+    - timezone: str name of IANA timezone, default is UTC
+
+    ## Returns
+    - dict {component: int or int64 array}, or polars struct Series
+    """
+    if components is None:
+        components = calendar_components
+    for component in components:
+        if component not in calendar_components:
+            raise Exception('unknown calendar component: ' + str(component))
+
+    seconds = _to_int_seconds(timestamps)
+    if timezone is not None:
+        from . import timestamp_timezone
+
+        seconds = timestamp_timezone.timestamps_to_local(seconds, timezone)
+    days = seconds // 86400
+    time_of_day = seconds - days * 86400
+
+    result: dict[str, typing.Any] = {}
+    if {'year', 'month', 'day', 'day_of_year'} & set(components):
+        year, month, day = civil_from_days(days)
+        if 'year' in components:
+            result['year'] = year
+        if 'month' in components:
+            result['month'] = month
+        if 'day' in components:
+            result['day'] = day
+        if 'day_of_year' in components:
+            result['day_of_year'] = days - days_from_civil(year, 1, 1) + 1  # type: ignore
+    if 'hour' in components:
+        result['hour'] = time_of_day // 3600
+    if 'minute' in components:
+        result['minute'] = time_of_day // 60 % 60
+    if 'second' in components:
+        result['second'] = time_of_day % 60
+    if (
+        'weekday' in components
+        or 'iso_week' in components
+        or ('iso_year' in components)
+    ):
+        weekday = (days + 3) % 7
+        if 'weekday' in components:
+            result['weekday'] = weekday
+        if 'iso_week' in components or 'iso_year' in components:
+            # iso weeks belong to the year containing their thursday
+            thursday = days - weekday + 3
+            iso_year, _, _ = civil_from_days(thursday)
+            if 'iso_week' in components:
+                iso_year_start = days_from_civil(iso_year, 1, 1)  # type: ignore
+                result['iso_week'] = (thursday - iso_year_start) // 7 + 1
+            if 'iso_year' in components:
+                result['iso_year'] = iso_year
+
+    result = {component: result[component] for component in components}
+    if output == 'dict':
+        return result
+    elif output == 'polars':
+        import polars as pl
+
+        return pl.DataFrame(result).to_struct('calendar_components')
+    else:
+        raise Exception('unknown output format: ' + str(output))
+
+
+def calendar_components_to_timestamps(
+    year: typing.Any,
+    month: typing.Any = 1,
+    day: typing.Any = 1,
+    hour: typing.Any = 0,
+    minute: typing.Any = 0,
+    second: typing.Any = 0,
+) -> typing.Any:
+    """build seconds from calendar components using integer arithmetic
+
+    - inverse of get_calendar_components()
+    - out-of-range months roll over into adjacent years, and out-of-range
+      days, hours, minutes, and seconds roll over into adjacent dates
+
+    ## Inputs
+    - year, month, day, hour, minute, second: ints or int arrays
+
+    ## Returns
+    - int seconds, or int64 array of seconds if any input is an array
+    """
+    inputs = [year, month, day, hour, minute, second]
+    if not all(spec.is_int_scalar(value) for value in inputs):
+        try:
+            import numpy as np
+        except ImportError:
+            raise Exception('numpy required for arrays of calendar components')
+        inputs = [np.asarray(value, dtype=np.int64) for value in inputs]
+    else:
+        inputs = [int(value) for value in inputs]
+    year, month, day, hour, minute, second = inputs
+
+    year = year + (month - 1) // 12
+    month = (month - 1) % 12 + 1
+    days = days_from_civil(year, month, 1) + day - 1
+    return days * 86400 + hour * 3600 + minute * 60 + second
+
+
+def _to_int_seconds(timestamps: typing.Any) -> typing.Any:
+    """convert seconds or datetimes to int or int64 array of seconds, floored"""
+    if spec.is_int_scalar(timestamps):
+        return int(timestamps)
+    elif spec.is_float_scalar(timestamps):
+        return math.floor(timestamps)
+
+    try:
+        import numpy as np
+    except ImportError:
+        raise Exception('numpy required for arrays of timestamps')
+
+    if type(timestamps).__module__.split('.')[0] == 'polars':
+        import polars as pl
+
+        if timestamps.dtype in (pl.Datetime, pl.Date):
+            timestamps = timestamps.dt.epoch('s')
+        timestamps = timestamps.to_numpy()
+    values = np.asarray(timestamps)
+    if values.dtype.kind == 'M':
+        return values.astype('datetime64[s]').astype(np.int64)
+    elif values.dtype.kind == 'm':
+        raise Exception(
+            'timestamps must be datetimes or seconds, not durations'
+        )
+    elif values.dtype.kind == 'f':
+        return np.floor(values).astype(np.int64)
+    else:
+        return values.astype(np.int64, copy=False)
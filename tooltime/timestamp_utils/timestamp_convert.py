@@ -6,6 +6,9 @@ import typing
 from .. import spec
 from . import timestamp_identify
 
+if typing.TYPE_CHECKING:
+    import numpy as np
+
 
 time_format = '%Y%m%d_%H%M%SZ'
 precise_time_format = time_format[:-1] + '%f' + time_format[-1]
@@ -590,7 +593,7 @@ def timestamp_datetime_to_seconds(
 def timestamp_to_numerical(
     timestamp: spec.Timestamp,
 ) -> typing.Union[spec.TimestampSeconds, spec.TimestampSecondsPrecise]:
-    if type(timestamp).__name__.startswith('int'):
+    if spec.is_int_scalar(timestamp):
         return int(timestamp)  # type: ignore
     else:
         return timestamp_to_seconds_precise(timestamp)
@@ -648,3 +651,46 @@ def timestamp_seconds_string_to_seconds(
     timestamp_seconds_string: spec.TimestampSecondsString,
 ) -> spec.TimestampSecondsRaw:
     return int(timestamp_seconds_string)
+
+
+#
+# # array conversion
+#
+
+
+def timestamps_to_seconds_array(
+    timestamps: typing.Sequence[spec.Timestamp] | np.ndarray,
+) -> np.ndarray:
+    """convert timestamps to float64 array of seconds
+
+    numeric and datetime64 arrays are converted without python loops
+
+    ## Inputs
+    - timestamps: iterable or numpy array of Timestamp
+
+    ## Returns
+    - float64 numpy array of seconds
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise Exception('numpy required for timestamp arrays')
+
+    if not isinstance(timestamps, np.ndarray):
+        try:
+            timestamps = np.asarray(timestamps)
+        except ValueError:
+            timestamps = np.asarray(timestamps, dtype=object)
+    if timestamps.dtype.kind in 'iuf':
+        return timestamps.astype(np.float64, copy=False)
+    elif timestamps.dtype.kind == 'M':
+        nanoseconds = timestamps.astype('datetime64[ns]').astype(np.int64)
+        return nanoseconds / 1e9
+    else:
+        return np.array(
+            [
+                timestamp_to_seconds_precise(timestamp)
+                for timestamp in timestamps.tolist()
+            ],
+            dtype=np.float64,
+        )
@@ -6,6 +6,7 @@ import typing
 from .. import spec
 from . import timestamp_convert
 from . import timestamp_identify
+from . import timestamp_truncate
 
 
 def now(
@@ -136,93 +137,84 @@ def create_timestamp_datetime(
 
 def floor_timestamp(
     timestamp: spec.Timestamp,
-    interval: typing.Literal['day', 'week', 'month', 'year'],
+    interval: str,
     output_format: spec.TimestampRepresentation | None = None,
+    *,
+    timezone: str | None = None,
 ) -> spec.Timestamp:
     return truncate_timestamp(
         timestamp=timestamp,
         interval=interval,
         direction='floor',
         output_format=output_format,
+        timezone=timezone,
     )
 
 
 def ceiling_timestamp(
     timestamp: spec.Timestamp,
-    interval: typing.Literal['day', 'week', 'month', 'year'],
+    interval: str,
     output_format: spec.TimestampRepresentation | None = None,
+    *,
+    timezone: str | None = None,
 ) -> spec.Timestamp:
     return truncate_timestamp(
         timestamp=timestamp,
         interval=interval,
         direction='ceiling',
         output_format=output_format,
+        timezone=timezone,
+    )
+
+
+def round_timestamp(
+    timestamp: spec.Timestamp,
+    interval: str,
+    output_format: spec.TimestampRepresentation | None = None,
+    *,
+    timezone: str | None = None,
+) -> spec.Timestamp:
+    return truncate_timestamp(
+        timestamp=timestamp,
+        interval=interval,
+        direction='round',
+        output_format=output_format,
+        timezone=timezone,
     )
 
 
 def truncate_timestamp(
     timestamp: spec.Timestamp,
-    interval: typing.Literal['day', 'week', 'month', 'year'],
-    direction: typing.Literal['floor', 'ceiling'],
+    interval: str,
+    direction: spec.TruncationDirection,
     output_format: spec.TimestampRepresentation | None = None,
+    *,
+    timezone: str | None = None,
 ) -> spec.Timestamp:
-    """truncate time floorward or ceilingward, getting the floor or ceiling"""
-    import datetime
-    import math
-
-    if direction not in ['floor', 'ceiling']:
-        raise Exception('direction must be floor or ceiling')
-
-    dt = timestamp_convert.timestamp_to_datetime(timestamp)
-    if interval == 'day':
-        dt_trunc: datetime.datetime = datetime.datetime(
-            year=dt.year,
-            month=dt.month,
-            day=dt.day,
-            tzinfo=datetime.timezone.utc,
-        )
-        if direction == 'ceiling' and dt > dt_trunc:
-            dt_trunc = dt_trunc + datetime.timedelta(days=1)
-    elif interval == 'week':
-        seconds = timestamp_convert.timestamp_to_seconds(dt)
-        sunday = (
-            math.floor((seconds + 4 * 86400) / 7 / 86400) * 86400 * 7
-            - 4 * 86400
-        )
-        if direction == 'ceiling' and seconds > sunday:
-            sunday = sunday + 7 * 86400
-        dt_trunc = timestamp_convert.timestamp_to_datetime(sunday)
-    elif interval == 'month':
-        dt_trunc = datetime.datetime(
-            year=dt.year, month=dt.month, day=1, tzinfo=datetime.timezone.utc
-        )
-        if direction == 'ceiling' and dt > dt_trunc:
-            if dt.month == 12:
-                new_year = dt.year + 1
-                new_month = 1
-            else:
-                new_year = dt.year
-                new_month = dt.month + 1
-            dt_trunc = datetime.datetime(
-                year=new_year,
-                month=new_month,
-                day=1,
-                tzinfo=datetime.timezone.utc,
-            )
-    elif interval == 'year':
-        dt_trunc = datetime.datetime(
-            year=dt.year, month=1, day=1, tzinfo=datetime.timezone.utc
-        )
-        if direction == 'ceiling' and dt > dt_trunc:
-            return datetime.datetime(
-                year=dt.year + 1, month=1, day=1, tzinfo=datetime.timezone.utc
-            )
-    else:
-        raise Exception('invalid interval: ' + str(interval))
+    """truncate time floorward or ceilingward, getting the floor or ceiling
+
+    - interval can be a unit name {second, minute, hour, day, week, month,
+      quarter, year} or a label such as '5m', '4h', '2w', '3M', '1q', '10y'
+    - boundaries are aligned in the same way as get_intervals()
+        - weeks begin on sunday
+        - months and quarters are integer offsets from January 1970
+    - if timezone is given, boundaries are taken in local wall clock time
+
+    ## Inputs
+    - timestamp: Timestamp
+    - interval: str name or TimelengthLabel of interval
+    - direction: 'floor', 'ceiling', or 'round'
+    - output_format: str name of Timestamp representation, default is input's
+    - timezone: str name of IANA timezone, default is UTC
+    """
+    seconds = timestamp_convert.timestamp_to_numerical(timestamp)
+    truncated = timestamp_truncate.truncate_timestamp_seconds(
+        seconds, interval=interval, direction=direction, timezone=timezone
+    )
 
     if output_format is None:
         output_format = timestamp_identify.detect_timestamp_representation(
             timestamp
         )
 
-    return timestamp_convert.convert_timestamp(dt_trunc, output_format)
+    return timestamp_convert.convert_timestamp(truncated, output_format)
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import typing
+
+from .. import exceptions
+from .. import timelength_utils
+
+if typing.TYPE_CHECKING:
+    import polars as pl
+
+    FrameType = typing.TypeVar('FrameType', pl.DataFrame, pl.LazyFrame)
+
+
+def summarize_timestamps_by_group(
+    frame: FrameType,
+    time_column: str,
+    group_by: str | typing.Sequence[str],
+    *,
+    outlier_rtol: float = 0.5,
+) -> FrameType:
+    """summarize timestamps of each group of a polars DataFrame or LazyFrame
+
+    - computes the statistics of summarize_timestamps() for every group using
+      native polars aggregations, compatible with the streaming engine
+    - timestamps are sorted within each group before computing dts
+    - time_column can be numeric seconds, Datetime, or Date
+    - resolution is None for groups whose median dt has no timelength label
+
+    ## Inputs
+    - frame: polars DataFrame or LazyFrame
+    - time_column: str name of timestamp column
+    - group_by: str name or list of names of group key columns
+    - outlier_rtol: float of tolerance for detecting outliers
+
+    ## Returns
+    - frame with one row per group, of same type as input frame, with columns
+        - group keys
+        - n_t, n_unique: int number of timestamps and unique timestamps
+        - start, end, duration: float seconds of extent
+        - start_label, end_label: str TimestampLabel of extent
+        - median_dt: float median dt in seconds
+        - resolution: str TimelengthLabel of median_dt
+        - n_small_outliers, n_large_outliers, n_outliers: int outlier counts
+        - n_missing: int missing timestamps if median_dt maintained
+    """
+    import polars as pl
+
+    keys: list[str]
+    if isinstance(group_by, str):
+        keys = [group_by]
+    else:
+        keys = list(group_by)
+    lazy = frame.lazy()
+
+    # convert timestamps to float seconds
+    dtype = lazy.collect_schema()[time_column]
+    if dtype == pl.Datetime or dtype == pl.Date:
+        seconds = pl.col(time_column).dt.epoch('us') / 1_000_000
+    elif dtype.is_numeric():
+        seconds = pl.col(time_column).cast(pl.Float64)
+    else:
+        raise Exception('time_column must be numeric, Datetime, or Date')
+
+    # sort by time then stably by group, which is faster than a multi-column
+    # sort, and compute dts within groups without window functions
+    # - sort_by() expression keeps the optimizer from fusing the two sorts
+    new_group = pl.any_horizontal(
+        [pl.col(key).ne_missing(pl.col(key).shift()) for key in keys]
+    )
+    t = pl.col('__t')
+    dt = pl.col('__dt')
+    median = dt.median()
+    summary = (
+        lazy.select(*keys, seconds.alias('__t'))
+        .select(pl.all().sort_by('__t'))
+        .sort(keys, maintain_order=True)
+        .with_columns(
+            pl.when(new_group).then(None).otherwise(t.diff()).alias('__dt')
+        )
+        .group_by(keys)
+        .agg(
+            pl.len().alias('n_t'),
+            ((dt != 0).sum() + 1).cast(pl.Int64).alias('n_unique'),
+            t.min().alias('start'),
+            t.max().alias('end'),
+            median.alias('median_dt'),
+            (dt < 1 / (1 + outlier_rtol) * median)
+            .sum()
+            .cast(pl.Int64)
+            .alias('n_small_outliers'),
+            (dt > (1 + outlier_rtol) * median)
+            .sum()
+            .cast(pl.Int64)
+            .alias('n_large_outliers'),
+        )
+    )
+
+    # same closed form as summarize_timestamps() for n_missing
+    median_dt = pl.col('median_dt')
+    n_ideal = (
+        ((pl.col('end') + median_dt - pl.col('start')) / median_dt)
+        .ceil()
+        .clip(lower_bound=0)
+        .cast(pl.Int64)
+    )
+    label_format = '%Y%m%d_%H%M%SZ'
+    summary = summary.with_columns(
+        (pl.col('end') - pl.col('start')).alias('duration'),
+        pl.from_epoch(pl.col('start').floor().cast(pl.Int64), time_unit='s')
+        .dt.strftime(label_format)
+        .alias('start_label'),
+        pl.from_epoch(pl.col('end').floor().cast(pl.Int64), time_unit='s')
+        .dt.strftime(label_format)
+        .alias('end_label'),
+        median_dt.map_batches(
+            _get_resolution_labels, return_dtype=pl.String, is_elementwise=True
+        ).alias('resolution'),
+        (pl.col('n_small_outliers') + pl.col('n_large_outliers')).alias(
+            'n_outliers'
+        ),
+        pl.when(median_dt > 0.0001)
+        .then(n_ideal - pl.col('n_t'))
+        .otherwise(None)
+        .alias('n_missing'),
+    ).select(
+        *keys,
+        'n_t',
+        'n_unique',
+        'start',
+        'end',
+        'duration',
+        'start_label',
+        'end_label',
+        'median_dt',
+        'resolution',
+        'n_small_outliers',
+        'n_large_outliers',
+        'n_outliers',
+        'n_missing',
+    )
+
+    if isinstance(frame, pl.LazyFrame):
+        return summary  # type: ignore
+    else:
+        return summary.collect()  # type: ignore
+
+
+def _get_resolution_labels(median_dts: pl.Series) -> pl.Series:
+    """format median dts as TimelengthLabel's, or None if they have none
+
+    - only whole seconds, or seconds above 5 that are truncated, have labels
+    """
+    import numpy as np
+    import polars as pl
+
+    seconds = median_dts.cast(pl.Float64).fill_null(np.nan).to_numpy()
+    truncated = np.trunc(seconds)
+    has_label = np.isfinite(seconds) & (
+        (truncated > 5.0)
+        | (np.abs(seconds - truncated) <= 1e-9 * np.abs(seconds))
+    )
+    labels = np.full(len(seconds), None, dtype=object)
+    try:
+        labels[has_label] = timelength_utils.timelength_seconds_to_labels(
+            seconds[has_label]
+        )
+    except exceptions.ConversionException:
+        labels[has_label] = [
+            _get_resolution_label(value) for value in seconds[has_label]
+        ]
+    return pl.Series(median_dts.name, labels.tolist(), dtype=pl.String)
+
+
+def _get_resolution_label(median_dt: float) -> str | None:
+    try:
+        return timelength_utils.timelength_seconds_to_label(median_dt)
+    except exceptions.ConversionException:
+        return None
@@ -1,20 +1,36 @@
 from __future__ import annotations
 
+import math
 import typing
 
 from .. import spec
 from .. import timefrequency_utils
 from .. import timelength_utils
 from . import timestamp_convert
+from . import timestamp_validate
 
 
 def summarize_timestamps(
     timestamps: typing.Sequence[spec.Timestamp],
+    stats_only: bool = False,
+    outlier_rtol: float = 0.5,
+    outlier_method: timefrequency_utils.OutlierMethod = 'rtol',
+    outlier_threshold: float | None = None,
 ) -> spec.TimestampSummary:
     """create summary of timestamps
 
+    - timestamps can be in any order, they are sorted if they are neither
+      ascending nor descending
+    - resolution has robust dispersion of dts and outlier indices, see
+      detect_resolution(), indices refer to timestamps in ascending order
+
     ## Inputs
     - timestamps: iterable of Timestamp
+    - stats_only: bool of whether to omit dts and outlier arrays from
+      resolution, so that summary size does not depend on number of timestamps
+    - outlier_rtol: float of tolerance for detecting outliers
+    - outlier_method: str of how to score outliers, 'rtol', 'mad', or 'iqr'
+    - outlier_threshold: float threshold of outlier_method
     """
 
     timestamps_precise: typing.List[spec.TimestampSecondsPrecise] = []
@@ -30,11 +46,24 @@ def summarize_timestamps(
         summary['end'] = timestamps_precise[0]
 
     elif n_t > 1:
-        if timestamps_precise[-1] < timestamps_precise[0]:
-            timestamps_precise = timestamps_precise[::-1]
+        # sort only if timestamps are neither ascending nor descending
+        order = timestamp_validate.validate_timestamp_order(
+            timestamps_precise, return_indices=False
+        )
+        if not order['is_sorted']:
+            if order['is_reverse_sorted']:
+                timestamps_precise = timestamps_precise[::-1]
+            else:
+                timestamps_precise = sorted(timestamps_precise)
 
         n_unique = len(set(timestamps_precise))
-        resolution = timefrequency_utils.detect_resolution(timestamps_precise)
+        resolution = timefrequency_utils.detect_resolution(
+            timestamps_precise,
+            stats_only=stats_only,
+            outlier_rtol=outlier_rtol,
+            outlier_method=outlier_method,
+            outlier_threshold=outlier_threshold,
+        )
         if resolution is None:
             raise Exception('could not detect resolution')
         start = timestamp_convert.timestamp_to_label(timestamps_precise[0])
@@ -43,22 +72,15 @@ def summarize_timestamps(
         duration_label = timelength_utils.timelength_seconds_to_clock_phrase(
             duration
         )
-        n_large_outliers = resolution['outliers']['large'].shape[0]
-        n_small_outliers = resolution['outliers']['small'].shape[0]
+        n_large_outliers = resolution['outliers']['n_large']
+        n_small_outliers = resolution['outliers']['n_small']
         n_outliers = n_large_outliers + n_small_outliers
-
-        if resolution['median_dt'] > 0.0001:
-            import numpy as np
-
-            n_ideal_iter = np.arange(
-                timestamps_precise[0],
-                timestamps_precise[-1] + resolution['median_dt'],
-                resolution['median_dt'],
-            )
-            n_ideal = list(n_ideal_iter)
-            summary['n_missing'] = len(n_ideal) - len(timestamps_precise)
-        else:
-            summary['n_missing'] = None
+        summary['n_missing'] = get_n_missing_timestamps(
+            timestamps_precise[0],
+            timestamps_precise[-1],
+            resolution['median_dt'],
+            n_t,
+        )
 
         summary['n_unique'] = n_unique
         summary['resolution'] = resolution
@@ -73,24 +95,52 @@ def summarize_timestamps(
     return summary
 
 
+def get_n_missing_timestamps(
+    start: int | float,
+    end: int | float,
+    median_dt: float,
+    n_t: int,
+) -> int | None:
+    """get number of timestamps missing from grid spaced by median_dt
+
+    - closed form of len(np.arange(start, end + median_dt, median_dt)) - n_t
+
+    ## Inputs
+    - start: first timestamp in seconds
+    - end: last timestamp in seconds
+    - median_dt: float median of dts
+    - n_t: int number of timestamps
+
+    ## Returns
+    - int number of missing timestamps, or None if median_dt is too small
+    """
+    if median_dt > 0.0001:
+        n_ideal = math.ceil((end + median_dt - start) / median_dt)
+        return max(0, n_ideal) - n_t
+    else:
+        return None
+
+
 def print_timestamp_summary(
     *,
     timestamps: typing.List[spec.Timestamp] | None = None,
     summary: spec.TimestampSummary | None = None,
     indent: str | None = None,
     print_kwargs: typing.Mapping[str, typing.Any] | None = None,
+    n_outlier_rows: int = 5,
 ) -> None:
     """print summary of timestamps
 
     - specify either timestamps or summary
-    - timestamps should be ordered
-        - todo: do not require ordering
+    - timestamps can be in any order, see summarize_timestamps()
 
     ## Inputs
     - timestamps: iterable of Timestamp
     - summary: dict summary created by summarize_timestamps()
     - indent: str indent of each line in summary
     - print_kwargs: kwargs passed to print()
+    - n_outlier_rows: int number of largest outlier dts to list with their
+      row index and timestamp, if summary has outlier indices
     """
 
     # validate inputs
@@ -122,21 +172,24 @@ def print_timestamp_summary(
         n_small_outliers = summary['n_small_outliers']
         n_outliers = summary['n_outliers']
         n_missing = summary['n_missing']
-        outlier_rtol = resolution['outliers']['outlier_rtol']
+        outliers = resolution['outliers']
+        dispersion = resolution['dispersion']
         mean_dt = timelength_utils.timelength_to_label(duration / (n_t - 1))
+        start_seconds = timestamp_convert.timestamp_to_seconds(start)
+        end_seconds = timestamp_convert.timestamp_to_seconds(end)
 
         print(indent + 'n_unique:', n_unique, **print_kwargs)
         print(indent + 'extent:')
         print(
             '    ' + indent + 'start:',
             start,
-            '(' + ('%.14g' % summary['start']) + ')',
+            '(' + ('%.14g' % start_seconds) + ')',
             **print_kwargs,
         )
         print(
             '    ' + indent + 'end:  ',
             end,
-            '(' + ('%.14g' % summary['end']) + ')',
+            '(' + ('%.14g' % end_seconds) + ')',
             **print_kwargs,
         )
         print(
@@ -150,6 +203,14 @@ def print_timestamp_summary(
             '    ' + indent + 'median_dt:', resolution['label'], **print_kwargs
         )
         print('    ' + indent + 'mean_dt:', mean_dt, **print_kwargs)
+        for key in ['iqr', 'mad']:
+            if dispersion[key] is not None:
+                print(
+                    '    ' + indent + key + '_dt:',
+                    '%.6g' % dispersion[key],  # type: ignore
+                    's',
+                    **print_kwargs,
+                )
         print(
             '    ' + indent + 'missing timestamps:',
             n_missing,
@@ -160,17 +221,47 @@ def print_timestamp_summary(
         print(
             '        ' + indent + 'small:',
             n_small_outliers,
-            '       dt < median_dt / (1 + outlier_rtol)',
+            '       dt < ' + ('%.6g' % outliers['lower']) + ' s',
             **print_kwargs,
         )
         print(
             '        ' + indent + 'large:',
             n_large_outliers,
-            '       dt > median_dt * (1 + outlier_rtol)',
+            '       dt > ' + ('%.6g' % outliers['upper']) + ' s',
             **print_kwargs,
         )
         print(
-            '        ' + indent + '(outlier_rtol =',
-            str(outlier_rtol) + ')',
+            '        ' + indent + '(' + outliers['method'] + ' threshold =',
+            str(outliers['threshold']) + ')',
             **print_kwargs,
         )
+
+        # list largest outlier dts so that offending rows can be located
+        large_indices = outliers['large_indices']
+        large_timestamps = outliers['large_timestamps']
+        large = outliers['large']
+        if (
+            n_outlier_rows > 0
+            and large_indices is not None
+            and large_timestamps is not None
+            and large is not None
+            and len(large) > 0
+        ):
+            order = (-large).argsort(kind='stable')[:n_outlier_rows]
+            print(
+                '    ' + indent + 'largest outlier dts:',
+                **print_kwargs,
+            )
+            for i in order.tolist():
+                print(
+                    '        ' + indent + 'row',
+                    str(large_indices[i]) + ':',
+                    timestamp_convert.timestamp_to_label(
+                        large_timestamps[i].item()
+                    ),
+                    '+',
+                    timelength_utils.timelength_seconds_to_clock_phrase(
+                        large[i].item()
+                    ),
+                    **print_kwargs,
+                )
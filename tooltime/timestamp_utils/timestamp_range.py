@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import math
+import typing
+
+from .. import spec
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+    import polars as pl
+
+
+class TimestampRange(typing.Sequence[typing.Union[int, float]]):
+    """lazy arithmetic progression of timestamps, like range() for seconds
+
+    - elements are start, start + step, start + 2 * step, ... up to but not
+      including stop
+    - len, indexing, slicing, containment, and index() are O(1)
+    - start, stop, and step can be int or float seconds
+        - for int seconds all operations are exact
+        - for float seconds element k is always computed as start + k * step,
+          and containment only accepts values equal to such an element
+
+    ## Example Usage
+    grid = tooltime.TimestampRange(1600000000, 1700000000, 60)
+    len(grid)
+    > 1666667
+    1600000060 in grid
+    > True
+    grid.index(1600000600)
+    > 10
+    """
+
+    __slots__ = ('_length', 'start', 'step', 'stop')
+
+    start: int | float
+    stop: int | float
+    step: int | float
+    _length: int
+
+    def __init__(
+        self,
+        start: int | float,
+        stop: int | float,
+        step: int | float = 1,
+    ) -> None:
+        """create TimestampRange
+
+        ## Inputs
+        - start: first timestamp of range, in seconds
+        - stop: end of range, in seconds, not included in range
+        - step: nonzero spacing between timestamps, in seconds
+        """
+        if step == 0:
+            raise Exception('step must be nonzero')
+        self.start = start
+        self.stop = stop
+        self.step = step
+        self._length = _get_length(start, stop, step)
+
+    @classmethod
+    def from_count(
+        cls, start: int | float, step: int | float, n: int
+    ) -> TimestampRange:
+        """create TimestampRange of n timestamps beginning at start"""
+        if n < 0:
+            raise Exception('n must be nonnegative')
+        if step == 0:
+            raise Exception('step must be nonzero')
+        timestamp_range = cls.__new__(cls)
+        timestamp_range.start = start
+        timestamp_range.stop = start + n * step
+        timestamp_range.step = step
+        timestamp_range._length = n
+        return timestamp_range
+
+    #
+    # # sequence protocol
+    #
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    @typing.overload
+    def __getitem__(self, index: int) -> int | float: ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> TimestampRange: ...
+
+    def __getitem__(self, index: int | slice) -> int | float | TimestampRange:
+        if isinstance(index, slice):
+            indices = range(self._length)[index]
+            return TimestampRange.from_count(
+                self.start + indices.start * self.step,
+                self.step * indices.step,
+                len(indices),
+            )
+        if not spec.is_int_scalar(index):
+            raise TypeError('index must be int or slice')
+        position = int(index)
+        if position < 0:
+            position += self._length
+        if position < 0 or position >= self._length:
+            raise IndexError('TimestampRange index out of range')
+        return self.start + position * self.step
+
+    def __iter__(self) -> typing.Iterator[int | float]:
+        start = self.start
+        step = self.step
+        for k in range(self._length):
+            yield start + k * step
+
+    def __reversed__(self) -> typing.Iterator[int | float]:
+        start = self.start
+        step = self.step
+        for k in range(self._length - 1, -1, -1):
+            yield start + k * step
+
+    def _get_position(self, value: typing.Any) -> int | None:
+        """get position of value in range, or None if not in range"""
+        if not spec.is_int_scalar(value) and not spec.is_float_scalar(value):
+            return None
+        if self._length == 0:
+            return None
+        offset = value - self.start
+        if isinstance(offset, int) and isinstance(self.step, int):
+            position, remainder = divmod(offset, self.step)
+            if remainder != 0:
+                return None
+        else:
+            ratio = offset / self.step
+            if not math.isfinite(ratio):
+                return None
+            position = round(ratio)
+            if self.start + position * self.step != value:
+                return None
+        if 0 <= position < self._length:
+            return position
+        else:
+            return None
+
+    def __contains__(self, value: object) -> bool:
+        return self._get_position(value) is not None
+
+    def index(
+        self, value: typing.Any, start: int = 0, stop: int | None = None
+    ) -> int:
+        """get position of timestamp in range, raising ValueError if absent"""
+        position = self._get_position(value)
+        if stop is None:
+            stop = self._length
+        start, stop, _ = slice(start, stop).indices(self._length)
+        if position is None or not (start <= position < stop):
+            raise ValueError(str(value) + ' is not in TimestampRange')
+        return position
+
+    def count(self, value: typing.Any) -> int:
+        """get number of occurrences of timestamp in range, either 0 or 1"""
+        return int(self._get_position(value) is not None)
+
+    #
+    # # comparison
+    #
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TimestampRange):
+            return NotImplemented
+        if self._length != other._length:
+            return False
+        if self._length == 0:
+            return True
+        if self.start != other.start:
+            return False
+        return self._length == 1 or self.step == other.step
+
+    def __hash__(self) -> int:
+        if self._length == 0:
+            return hash(('TimestampRange', 0))
+        elif self._length == 1:
+            return hash(('TimestampRange', 1, self.start))
+        else:
+            return hash(('TimestampRange', self._length, self.start, self.step))
+
+    def __repr__(self) -> str:
+        return (
+            'TimestampRange('
+            + str(self.start)
+            + ', '
+            + str(self.stop)
+            + ', '
+            + str(self.step)
+            + ')'
+        )
+
+    #
+    # # set operations
+    #
+
+    def intersection(self, other: TimestampRange) -> TimestampRange:
+        """get timestamps that are in both ranges, as an ascending range
+
+        - requires int start and step in both ranges
+        """
+        a = self._ascending()
+        b = other._ascending()
+        a_start, a_step, b_start, b_step = a.start, a.step, b.start, b.step
+        if not (
+            isinstance(a_start, int)
+            and isinstance(a_step, int)
+            and isinstance(b_start, int)
+            and isinstance(b_step, int)
+        ):
+            raise TypeError('intersection requires int start and step')
+        lower = max(a_start, b_start)
+        if len(a) == 0 or len(b) == 0:
+            return TimestampRange.from_count(lower, 1, 0)
+
+        # solve a_start + i * a_step == b_start + j * b_step
+        gcd, x, _ = _extended_gcd(a_step, b_step)
+        difference = b_start - a_start
+        if difference % gcd != 0:
+            return TimestampRange.from_count(lower, 1, 0)
+        step = a_step // gcd * b_step
+        common = a_start + (difference // gcd * x) % (b_step // gcd) * a_step
+
+        # restrict to overlap of bounds
+        upper = min(
+            a_start + (len(a) - 1) * a_step, b_start + (len(b) - 1) * b_step
+        )
+        first = common + -(-(lower - common) // step) * step
+        if first > upper:
+            return TimestampRange.from_count(first, step, 0)
+        return TimestampRange.from_count(
+            first, step, (upper - first) // step + 1
+        )
+
+    def __and__(self, other: TimestampRange) -> TimestampRange:
+        return self.intersection(other)
+
+    def _ascending(self) -> TimestampRange:
+        if self.step > 0:
+            return self
+        else:
+            return self[::-1]
+
+    #
+    # # conversion
+    #
+
+    def to_list(self) -> list[int | float]:
+        """materialize timestamps as list"""
+        start, step = self.start, self.step
+        if isinstance(start, int) and isinstance(step, int):
+            return list(range(start, start + self._length * step, step))
+        return list(self)
+
+    def to_numpy(self) -> np.ndarray:
+        """materialize timestamps as numpy array"""
+        try:
+            import numpy as np
+        except ImportError:
+            raise Exception('numpy required for numpy output')
+
+        if isinstance(self.start, int) and isinstance(self.step, int):
+            return np.arange(self._length, dtype=np.int64) * self.step + (
+                self.start
+            )
+        return self.start + np.arange(self._length) * self.step
+
+    def to_polars(self, name: str = 'timestamp') -> pl.Series:
+        """materialize timestamps as polars Series"""
+        import polars as pl
+
+        start, step = self.start, self.step
+        if isinstance(start, int) and isinstance(step, int):
+            stop = start + self._length * step
+            return pl.Series(
+                name,
+                pl.int_range(start, stop, step, dtype=pl.Int64, eager=True),
+            )
+        return pl.Series(name, self.to_numpy())
+
+
+def _get_length(
+    start: int | float, stop: int | float, step: int | float
+) -> int:
+    if (
+        isinstance(start, int)
+        and isinstance(stop, int)
+        and isinstance(step, int)
+    ):
+        return len(range(start, stop, step))
+
+    # correct float estimate so that element n - 1 is before stop
+    n = max(0, math.ceil((stop - start) / step))
+    while n > 0 and (start + (n - 1) * step - stop) * step >= 0:
+        n -= 1
+    while (start + n * step - stop) * step < 0:
+        n += 1
+    return n
+
+
+def _extended_gcd(a: int, b: int) -> tuple[int, int, int]:
+    """get (gcd, x, y) such that a * x + b * y == gcd"""
+    x0, x1, y0, y1 = 1, 0, 0, 1
+    while b != 0:
+        quotient, remainder = divmod(a, b)
+        a, b = b, remainder
+        x0, x1 = x1, x0 - quotient * x1
+        y0, y1 = y1, y0 - quotient * y1
+    return a, x0, y0
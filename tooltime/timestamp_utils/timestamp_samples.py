@@ -1,12 +1,25 @@
 from __future__ import annotations
 
+import functools
 import math
 import time
 import typing
 
+from .. import exceptions
 from .. import spec
 from .. import timelength_utils
+from . import timestamp_calendar
 from . import timestamp_convert
+from . import timestamp_range
+from . import timestamp_truncate
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+
+
+_timelength_to_seconds = timelength_utils.compile_timelength_converter(
+    'TimelengthSeconds'
+)
 
 
 def parse_timeslice(
@@ -15,7 +28,8 @@ def parse_timeslice(
     interval: spec.Timelength | None = None,
     include_misaligned_bound: bool = True,
     include_misaligned_overflow: bool = False,
-) -> typing.Sequence[int | float]:
+    output: typing.Literal['list', 'numpy', 'lazy', 'range'] = 'list',
+) -> typing.Any:
     """
 
     If one of the bounds is a timelength, use that timelength as the range size:
@@ -30,6 +44,147 @@ def parse_timeslice(
         2022-01-01:      2022-01-01 to now
 
     If plain number used, interpret as a timestamp not a timelength
+
+    If interval starts with '@', place samples on calendar boundaries
+        2022-01-01:2022-03-01:1w    every 7 days from 2022-01-01
+        2022-01-01:2022-03-01:@1w   every sunday, see truncate_timestamps()
+        2022-01-01:2022-03-01:1M    first day of each month
+    with '@', bounds between calendar boundaries are misaligned samples
+
+    for repeated evaluation of the same timeslice, use compile_timeslice()
+    """
+    compiled = compile_timeslice(
+        raw_timeslice,
+        n=n,
+        interval=interval,
+        include_misaligned_bound=include_misaligned_bound,
+        include_misaligned_overflow=include_misaligned_overflow,
+    )
+    return compiled.evaluate(output=output)
+
+
+class CompiledTimeslice(typing.NamedTuple):
+    """parsed timeslice that can be evaluated against any current time
+
+    - each bound is either an absolute timestamp or an offset before now
+    - evaluation only performs arithmetic, no parsing
+    - calendar intervals are resolved to (count, unit) once, and evaluate to
+      lazy CalendarTimestampSamples by default
+
+    ## Example Usage
+    timeslice = tooltime.compile_timeslice('15m::1m')
+    samples = timeslice.evaluate(now=1600000000)
+    """
+
+    start_time: int | float | None
+    start_ago: int | float | None
+    end_time: int | float | None
+    end_ago: int | float | None
+    n: int | None
+    interval: spec.Timelength | None
+    interval_seconds: int | float | None
+    calendar_interval: tuple[int, str] | None
+    align_to: typing.Literal['start', 'calendar']
+    include_misaligned_bound: bool
+    include_misaligned_overflow: bool
+
+    def get_bounds(
+        self, now: int | float | None = None
+    ) -> tuple[int | float, int | float]:
+        """get (start_time, end_time) of timeslice relative to now
+
+        ## Inputs
+        - now: reference time in seconds, default is current time
+
+        ## Returns
+        - tuple of start_time and end_time in seconds
+        """
+        if now is None:
+            now = int(time.time())
+        if self.start_ago is None:
+            start_time = self.start_time
+        else:
+            start_time = now - self.start_ago
+        if self.end_ago is None:
+            end_time = self.end_time
+        else:
+            end_time = now - self.end_ago
+        if start_time is None or end_time is None:
+            raise Exception('invalid compiled timeslice')
+        if start_time > end_time:
+            raise Exception('start time must be less than or equal to end time')
+        return start_time, end_time
+
+    def evaluate(
+        self,
+        now: int | float | None = None,
+        output: typing.Literal['list', 'numpy', 'lazy', 'range'] = 'lazy',
+    ) -> typing.Any:
+        """sample timestamps of timeslice relative to now
+
+        ## Inputs
+        - now: reference time in seconds, default is current time
+        - output: output format, see sample_timestamps()
+
+        ## Returns
+        - timestamp samples, lazy TimestampSamples by default
+        """
+        start_time, end_time = self.get_bounds(now)
+        if self.interval_seconds is not None:
+            samples = TimestampSamples._from_bounds(
+                start_time=start_time,
+                end_time=end_time,
+                sample_interval=self.interval_seconds,
+                align_to='start',
+                include_misaligned_bound=self.include_misaligned_bound,
+                include_misaligned_overflow=self.include_misaligned_overflow,
+            )
+            return _format_samples(samples, output)
+        elif self.calendar_interval is not None:
+            return _sample_calendar_timestamps(
+                start_time=start_time,
+                end_time=end_time,
+                n_samples=None,
+                interval=self.calendar_interval,
+                align_to=self.align_to,
+                include_misaligned_bound=self.include_misaligned_bound,
+                include_misaligned_overflow=self.include_misaligned_overflow,
+                output=output,
+            )
+        else:
+            return sample_timestamps(
+                start_time=start_time,
+                end_time=end_time,
+                n_samples=self.n,
+                sample_interval=self.interval,
+                align_to=self.align_to,
+                include_misaligned_bound=self.include_misaligned_bound,
+                include_misaligned_overflow=self.include_misaligned_overflow,
+                output=output,
+            )
+
+
+@functools.lru_cache(maxsize=256)
+def compile_timeslice(
+    raw_timeslice: str,
+    n: int | None = None,
+    interval: spec.Timelength | None = None,
+    include_misaligned_bound: bool = True,
+    include_misaligned_overflow: bool = False,
+) -> CompiledTimeslice:
+    """parse timeslice once for evaluation against any current time
+
+    - see parse_timeslice() for timeslice syntax
+    - compiled timeslices are cached, so repeated calls are cheap
+
+    ## Inputs
+    - raw_timeslice: str timeslice such as '15m::1m' or '2022-01-01:1d'
+    - n: number of samples
+    - interval: sample interval, overridden by interval in timeslice,
+      prefix str interval with '@' to sample calendar boundaries
+
+    ## Returns
+    - CompiledTimeslice, use its evaluate() method to get samples
     """
 
     if raw_timeslice.count(':') == 0:
@@ -59,6 +214,14 @@ def parse_timeslice(
     else:
         raise Exception('cannot parse raw timeslice: ' + str(raw_timeslice))
 
+    # intervals prefixed by '@' place samples on calendar boundaries
+    align_to: typing.Literal['start', 'calendar'] = 'start'
+    if isinstance(interval, str) and interval.startswith('@'):
+        align_to = 'calendar'
+        interval = interval[1:]
+        if interval.isdecimal():
+            interval = int(interval)
+
     start_is_timelength = (
         start != ''
         and not start.isdigit()
@@ -67,38 +230,60 @@ def parse_timeslice(
     end_is_timelength = (
         end != '' and not end.isdigit() and timelength_utils.is_timelength(end)
     )
-
-    # replace blank end with now
-    now = int(time.time())
     if start == '':
         raise Exception('must specify start time')
-    if end == '':
-        end = str(now)
 
-    if start_is_timelength and end_is_timelength:
-        start_time = now - timelength_utils.timelength_to_seconds(start)
-        end_time = now - timelength_utils.timelength_to_seconds(end)
+    # represent each bound as absolute time or as offset before now
+    start_time: int | float | None = None
+    start_ago: int | float | None = None
+    end_time: int | float | None = None
+    end_ago: int | float | None = None
+    if end == '':
+        end_ago = 0
+        if start_is_timelength:
+            start_ago = _timelength_to_seconds(start)
+        else:
+            start_time = timestamp_convert.timestamp_to_seconds(start)
+    elif start_is_timelength and end_is_timelength:
+        start_ago = _timelength_to_seconds(start)
+        end_ago = _timelength_to_seconds(end)
     elif start_is_timelength and not end_is_timelength:
         end_time = timestamp_convert.timestamp_to_seconds(end)
-        start_time = end_time - timelength_utils.timelength_to_seconds(start)
+        start_time = end_time - _timelength_to_seconds(start)
     elif not start_is_timelength and end_is_timelength:
         start_time = timestamp_convert.timestamp_to_seconds(start)
-        end_time = start_time + timelength_utils.timelength_to_seconds(end)
+        end_time = start_time + _timelength_to_seconds(end)
     else:
         start_time = timestamp_convert.timestamp_to_seconds(start)
         end_time = timestamp_convert.timestamp_to_seconds(end)
 
     # validate that start time comes after end time
-    if start_time > end_time:
-        raise Exception('start time must be less than or equal to end time')
+    if start_time is not None and end_time is not None:
+        if start_time > end_time:
+            raise Exception('start time must be less than or equal to end time')
+
+    # precompute intervals so that evaluation does not parse them again
+    interval_seconds = None
+    calendar_interval = None
+    if n is None and interval is not None:
+        calendar_interval = _get_calendar_interval(interval, align_to)
+        if calendar_interval is None:
+            interval_seconds = _timelength_to_seconds(interval)
+            if interval_seconds <= 0:
+                raise Exception('interval_seconds must be positive')
 
-    return sample_timestamps(
+    return CompiledTimeslice(
         start_time=start_time,
+        start_ago=start_ago,
         end_time=end_time,
-        n_samples=n,
-        sample_interval=interval,
-        include_misaligned_overflow=include_misaligned_overflow,
+        end_ago=end_ago,
+        n=n,
+        interval=interval,
+        interval_seconds=interval_seconds,
+        calendar_interval=calendar_interval,
+        align_to=align_to,
         include_misaligned_bound=include_misaligned_bound,
+        include_misaligned_overflow=include_misaligned_overflow,
     )
 
 
@@ -108,15 +293,35 @@ def sample_timestamps(
     n_samples: int | None = None,
     sample_interval: spec.Timelength | None = None,
     window_size: spec.Timelength | None = None,
-    align_to: typing.Literal['start', 'end'] = 'start',
+    align_to: typing.Literal['start', 'end', 'calendar'] = 'start',
     include_misaligned_bound: bool = False,
     include_misaligned_overflow: bool = False,
-) -> typing.Sequence[int | float]:
+    output: typing.Literal['list', 'numpy', 'lazy', 'range'] = 'list',
+) -> typing.Any:
     """
 
     must specify at least one of start_time or end_time
     must specify at least one of n_samples or sample_interval
 
+    ## Outputs
+    - 'list': list of samples
+    - 'numpy': numpy array of samples
+    - 'lazy': TimestampSamples sequence that computes samples on access
+    - 'range': TimestampRange, only if there are no misaligned samples
+    all outputs contain the same values, computed in closed form
+
+    ## Calendar Intervals
+    - sample_interval can be a whole number of months, quarters, or years,
+      e.g. '1M', '1q', '1y', or '2 months', samples are then stepped by
+      calendar months
+      from the aligned bound, clamping to the end of short months
+    - align_to='calendar' places samples on the standardized interval
+      boundaries of truncate_timestamps(), e.g. month starts for '1M' and
+      sundays for '1w', with start_time and end_time as misaligned bounds
+    - 'lazy' output of calendar months is a CalendarTimestampSamples, and
+      'list' and 'numpy' outputs are generated vectorized
+    - 'range' output raises for calendar months, which are unevenly spaced
+
     ## Relationships
         window_size = (n_samples - 1) * sample_interval
                     = end_time - start_time
@@ -138,8 +343,10 @@ def sample_timestamps(
         end_time = timestamp_convert.timestamp_to_numerical(end_time)
     if window_size is not None:
         window_size = timelength_utils.timelength_to_numerical(window_size)
-    if sample_interval is not None:
-        sample_interval = timelength_utils.timelength_to_numerical(
+    calendar_interval = _get_calendar_interval(sample_interval, align_to)
+    interval_seconds: int | float | None = None
+    if calendar_interval is None and sample_interval is not None:
+        interval_seconds = timelength_utils.timelength_to_numerical(
             sample_interval
         )
 
@@ -161,11 +368,32 @@ def sample_timestamps(
         ):
             raise Exception('overdetermined system, specify fewer parameters')
 
+    # sample calendar intervals
+    if calendar_interval is not None:
+        if window_size is not None and start_time is not None:
+            end_time = start_time + window_size
+        elif window_size is not None and end_time is not None:
+            start_time = end_time - window_size
+        if start_time is None and end_time is None:
+            raise Exception('underdetermined system, specify more parameters')
+        if n_samples is None and (start_time is None or end_time is None):
+            raise Exception('underdetermined system, specify more parameters')
+        return _sample_calendar_timestamps(
+            start_time=start_time,
+            end_time=end_time,
+            n_samples=n_samples,
+            interval=calendar_interval,
+            align_to=align_to,
+            include_misaligned_bound=include_misaligned_bound,
+            include_misaligned_overflow=include_misaligned_overflow,
+            output=output,
+        )
+
     # determine start_time, end_time, and sample_interval
     if (
         start_time is not None
         and end_time is not None
-        and sample_interval is not None
+        and interval_seconds is not None
     ):
         pass
     elif (
@@ -173,17 +401,17 @@ def sample_timestamps(
         and end_time is not None
         and n_samples is not None
     ):
-        sample_interval = (end_time - start_time) / (n_samples - 1)
+        interval_seconds = (end_time - start_time) / (n_samples - 1)
     elif (
         start_time is not None
         and window_size is not None
-        and sample_interval is not None
+        and interval_seconds is not None
     ):
         end_time = start_time + window_size
     elif (
         end_time is not None
         and window_size is not None
-        and sample_interval is not None
+        and interval_seconds is not None
     ):
         start_time = end_time - window_size
     elif (
@@ -192,54 +420,637 @@ def sample_timestamps(
         and n_samples is not None
     ):
         end_time = start_time + window_size
-        sample_interval = (end_time - start_time) / (n_samples - 1)
+        interval_seconds = (end_time - start_time) / (n_samples - 1)
     elif (
         end_time is not None
         and window_size is not None
         and n_samples is not None
     ):
         start_time = end_time - window_size
-        sample_interval = (end_time - start_time) / (n_samples - 1)
+        interval_seconds = (end_time - start_time) / (n_samples - 1)
+    elif (
+        start_time is not None
+        and interval_seconds is not None
+        and n_samples is not None
+    ):
+        end_time = start_time + (n_samples - 1) * interval_seconds
+    elif (
+        end_time is not None
+        and interval_seconds is not None
+        and n_samples is not None
+    ):
+        start_time = end_time - (n_samples - 1) * interval_seconds
     else:
         raise Exception('underdetermined system, specify more parameters')
 
-    # create samples
+    if interval_seconds <= 0:
+        raise Exception('interval_seconds must be positive')
+
+    samples = TimestampSamples._from_bounds(
+        start_time=start_time,
+        end_time=end_time,
+        sample_interval=interval_seconds,
+        align_to=align_to,  # type: ignore
+        include_misaligned_bound=include_misaligned_bound,
+        include_misaligned_overflow=include_misaligned_overflow,
+    )
+    return _format_samples(samples, output)
+
+
+def _get_calendar_interval(
+    sample_interval: spec.Timelength | None,
+    align_to: str,
+) -> tuple[int, str] | None:
+    """get (count, unit) of interval if samples follow calendar boundaries
+
+    - intervals of a whole number of months, quarters, or years are stepped
+      by calendar months, e.g. '1M', '1q', '2 months', or 'year'
+    - with align_to='calendar', every interval is parsed
+    """
+    if sample_interval is None:
+        if align_to == 'calendar':
+            raise Exception('calendar alignment requires sample_interval')
+        return None
+    if not isinstance(sample_interval, str):
+        if align_to == 'calendar':
+            return (_timelength_to_seconds(sample_interval), 's')
+        return None
+
+    # unit names and quarters are not Timelength's, e.g. 'month' or '1q'
+    try:
+        parsed = timelength_utils.parse_timelength(sample_interval)
+    except exceptions.RepresentationDetectionException:
+        parsed = None
+    if (
+        parsed is not None
+        and align_to != 'calendar'
+        and (
+            parsed['unit'] not in ('M', 'y')
+            or not isinstance(parsed['seconds'], int)
+        )
+    ):
+        return None
+
+    count, unit = timestamp_truncate.parse_interval_label(sample_interval)
+    if align_to == 'calendar' or unit in ('M', 'y'):
+        return (count, unit)
+    else:
+        return None
+
+
+def _sample_calendar_timestamps(
+    start_time: int | float | None,
+    end_time: int | float | None,
+    n_samples: int | None,
+    interval: tuple[int, str],
+    align_to: typing.Literal['start', 'end', 'calendar'],
+    include_misaligned_bound: bool,
+    include_misaligned_overflow: bool,
+    output: typing.Literal['list', 'numpy', 'lazy', 'range'],
+) -> typing.Any:
+    """sample timestamps with calendar steps or on calendar boundaries"""
+    count, unit = interval
+    if n_samples is not None and n_samples <= 0:
+        raise Exception('n_samples must be positive')
+
+    def get_boundary(index: typing.Any) -> typing.Any:
+        return timestamp_truncate.get_boundary_seconds(index, count, unit)
+
+    head: list[int | float] = []
+    tail: list[int | float] = []
+    if align_to == 'calendar':
+        # samples are interval boundaries, indexed as in truncate_timestamps()
+        first = last = 0
+        if start_time is not None:
+            first = timestamp_truncate.get_boundary_index(
+                math.floor(start_time), count, unit
+            )
+            if get_boundary(first) < start_time:
+                first += 1
+        if end_time is not None:
+            last = timestamp_truncate.get_boundary_index(
+                math.floor(end_time), count, unit
+            )
+        if start_time is None and n_samples is not None:
+            first = last - n_samples + 1
+        elif n_samples is not None:
+            last = first + n_samples - 1
+
+        if start_time is not None and start_time != get_boundary(first):
+            if include_misaligned_bound:
+                head.append(start_time)
+            if include_misaligned_overflow:
+                head.insert(0, get_boundary(first - 1))
+        if end_time is not None and end_time != get_boundary(last):
+            if include_misaligned_bound:
+                tail.append(end_time)
+            if include_misaligned_overflow:
+                tail.append(get_boundary(last + 1))
+
+        if unit not in ('M', 'y'):
+            step = get_boundary(first + 1) - get_boundary(first)
+            samples = TimestampSamples(
+                get_boundary(first),
+                step,
+                max(0, last - first + 1),
+                head=head,
+                tail=tail,
+            )
+            return _format_samples(samples, output)
+
+        # month and year boundaries are month steps from epoch
+        step_months = count if unit == 'M' else 12 * count
+        calendar_samples = CalendarTimestampSamples(
+            0,
+            step_months,
+            max(0, last - first + 1),
+            offset_months=timestamp_calendar.seconds_to_month_index(
+                get_boundary(first)
+            ),
+            head=head,
+            tail=tail,
+        )
+        return _format_samples(calendar_samples, output)
+
+    # samples are calendar months stepped from the aligned bound
+    if unit == 'y':
+        months = 12 * count
+    elif unit == 'M':
+        months = count
+    else:
+        raise Exception('calendar steps must be months, quarters, or years')
     if align_to == 'start':
-        samples: typing.MutableSequence[int | float] = []
-        while True:
-            s = len(samples)
-            next_sample = start_time + s * sample_interval
-            if next_sample < end_time or math.isclose(next_sample, end_time):
-                samples.append(next_sample)
-            else:
-                break
+        anchor, bound, sign = start_time, end_time, 1
     elif align_to == 'end':
-        samples = []
-        while True:
-            s = len(samples)
-            next_sample = end_time - s * sample_interval
-            if next_sample > start_time or math.isclose(
-                next_sample, start_time
-            ):
-                samples.append(next_sample)
-            else:
-                break
-        samples = list(samples)[::-1]
+        anchor, bound, sign = end_time, start_time, -1
     else:
         raise Exception('unknown alignment target: ' + str(align_to))
+    if anchor is None:
+        raise Exception('must specify ' + align_to + '_time for alignment')
+
+    if n_samples is not None:
+        n_aligned = n_samples
+    elif bound is None:
+        raise Exception('underdetermined system, specify more parameters')
+    else:
+        # upper bound on number of samples, samples past bound are trimmed
+        anchor_month = timestamp_calendar.seconds_to_month_index(
+            math.floor(anchor)
+        )
+        bound_month = timestamp_calendar.seconds_to_month_index(
+            math.floor(bound)
+        )
+        n_aligned = abs(bound_month - anchor_month) // months + 2
+        while n_aligned > 1 and not _is_within(
+            timelength_utils.shift_months(
+                anchor, (n_aligned - 1) * sign * months
+            ),
+            bound,
+            sign,
+        ):
+            n_aligned -= 1
 
     # add misalignment samples
-    fractional_samples = (end_time - start_time) / sample_interval + 1
-    if not math.isclose(fractional_samples, int(fractional_samples)):
+    last_aligned = timelength_utils.shift_months(
+        anchor, (n_aligned - 1) * sign * months
+    )
+    if bound is not None and not math.isclose(last_aligned, bound):
+        if include_misaligned_bound:
+            tail.append(bound)
+        if include_misaligned_overflow:
+            last_sample = tail[-1] if len(tail) > 0 else last_aligned
+            tail.append(
+                timelength_utils.shift_months(last_sample, sign * months)
+            )
+    if sign == 1:
+        calendar_samples = CalendarTimestampSamples(
+            anchor, months, n_aligned, tail=tail
+        )
+    else:
+        calendar_samples = CalendarTimestampSamples(
+            anchor,
+            months,
+            n_aligned,
+            offset_months=-(n_aligned - 1) * months,
+            head=tail[::-1],
+        )
+    return _format_samples(calendar_samples, output)
+
+
+def _format_samples(
+    samples: TimestampSamples | CalendarTimestampSamples, output: str
+) -> typing.Any:
+    if output == 'list':
+        return samples.to_list()
+    elif output == 'numpy':
+        return samples.to_numpy()
+    elif output == 'lazy':
+        return samples
+    elif output == 'range':
+        return samples.to_range()
+    else:
+        raise Exception('unknown output format: ' + str(output))
+
+
+def _is_within(sample: int | float, bound: int | float, sign: int) -> bool:
+    """whether sample has not passed bound, in direction of sign"""
+    return (sample - bound) * sign < 0 or math.isclose(sample, bound)
+
+
+class TimestampSamples(typing.Sequence[typing.Union[int, float]]):
+    """lazy sequence of evenly spaced samples, as from sample_timestamps()
+
+    - samples are computed on access, nothing is materialized
+    - len, indexing, and slicing are O(1), slices are TimestampSamples
+    - values are identical to sample_timestamps(..., output='list')
+
+    samples consist of aligned samples, plus any misaligned samples before or
+    after them
+    - aligned sample k is first + k * interval, where first is anchor if
+      aligned to start, or anchor - (n_aligned - 1) * interval if aligned to
+      end, the same formula as TimestampRange
+    - for float intervals aligned to end, the last aligned sample can differ
+      from anchor by float rounding
+    """
+
+    __slots__ = (
+        '_indices',
+        'align_to',
+        'anchor',
+        'head',
+        'interval',
+        'n_aligned',
+        'tail',
+    )
+
+    anchor: int | float
+    interval: int | float
+    n_aligned: int
+    align_to: typing.Literal['start', 'end']
+    head: tuple[int | float, ...]
+    tail: tuple[int | float, ...]
+    _indices: range
+
+    def __init__(
+        self,
+        anchor: int | float,
+        interval: int | float,
+        n_aligned: int,
+        align_to: typing.Literal['start', 'end'] = 'start',
+        *,
+        head: typing.Sequence[int | float] = (),
+        tail: typing.Sequence[int | float] = (),
+        indices: range | None = None,
+    ) -> None:
+        """create TimestampSamples
+
+        ## Inputs
+        - anchor: first aligned sample if aligned to start, else last
+        - interval: spacing between aligned samples
+        - n_aligned: number of aligned samples
+        - align_to: 'start' or 'end'
+        - head: misaligned samples before aligned samples
+        - tail: misaligned samples after aligned samples
+        - indices: range of positions to view, default is all samples
+        """
+        if align_to not in ('start', 'end'):
+            raise Exception('unknown alignment target: ' + str(align_to))
+        self.anchor = anchor
+        self.interval = interval
+        self.n_aligned = n_aligned
+        self.align_to = align_to
+        self.head = tuple(head)
+        self.tail = tuple(tail)
+        if indices is None:
+            indices = range(len(self.head) + n_aligned + len(self.tail))
+        self._indices = indices
+
+    @classmethod
+    def _from_bounds(
+        cls,
+        start_time: int | float,
+        end_time: int | float,
+        sample_interval: int | float,
+        align_to: typing.Literal['start', 'end'],
+        include_misaligned_bound: bool,
+        include_misaligned_overflow: bool,
+    ) -> TimestampSamples:
         if align_to == 'start':
-            if include_misaligned_bound:
-                samples.append(end_time)
-            if include_misaligned_overflow:
-                samples.append(samples[-1] + sample_interval)
+            anchor, bound, sign = start_time, end_time, 1
         elif align_to == 'end':
+            anchor, bound, sign = end_time, start_time, -1
+        else:
+            raise Exception('unknown alignment target: ' + str(align_to))
+        step = sign * sample_interval
+
+        # count aligned samples, correcting for float error and isclose()
+        n_aligned = math.floor((end_time - start_time) / sample_interval) + 1
+        while n_aligned > 1 and not _is_within(
+            anchor + (n_aligned - 1) * step, bound, sign
+        ):
+            n_aligned -= 1
+        while _is_within(anchor + n_aligned * step, bound, sign):
+            n_aligned += 1
+
+        # add misalignment samples
+        extra: list[int | float] = []
+        fractional_samples = (end_time - start_time) / sample_interval + 1
+        if not math.isclose(fractional_samples, int(fractional_samples)):
             if include_misaligned_bound:
-                samples.insert(0, start_time)
+                extra.append(bound)
             if include_misaligned_overflow:
-                samples.insert(0, samples[0] - sample_interval)
+                if len(extra) > 0:
+                    last = extra[-1]
+                else:
+                    last = anchor + (n_aligned - 1) * step
+                extra.append(last + step)
+
+        if align_to == 'start':
+            return cls(
+                start_time, sample_interval, n_aligned, 'start', tail=extra
+            )
+        else:
+            return cls(
+                end_time, sample_interval, n_aligned, 'end', head=extra[::-1]
+            )
+
+    def _get_sample(self, position: int) -> int | float:
+        """get sample at position of underlying, unsliced samples"""
+        n_head = len(self.head)
+        if position < n_head:
+            return self.head[position]
+        k = position - n_head
+        if k < self.n_aligned:
+            return self._get_first() + k * self.interval
+        return self.tail[k - self.n_aligned]
+
+    def _get_first(self) -> int | float:
+        """get first aligned sample"""
+        if self.align_to == 'start':
+            return self.anchor
+        else:
+            return self.anchor - (self.n_aligned - 1) * self.interval
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @typing.overload
+    def __getitem__(self, index: int) -> int | float: ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> TimestampSamples: ...
+
+    def __getitem__(self, index: int | slice) -> int | float | TimestampSamples:
+        if isinstance(index, slice):
+            return TimestampSamples(
+                self.anchor,
+                self.interval,
+                self.n_aligned,
+                self.align_to,
+                head=self.head,
+                tail=self.tail,
+                indices=self._indices[index],
+            )
+        return self._get_sample(self._indices[index])
 
-    return samples
+    def __iter__(self) -> typing.Iterator[int | float]:
+        for position in self._indices:
+            yield self._get_sample(position)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (TimestampSamples, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self, other)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            'TimestampSamples(n='
+            + str(len(self))
+            + ', interval='
+            + str(self.interval)
+            + ', align_to='
+            + repr(self.align_to)
+            + ')'
+        )
+
+    def to_range(self) -> timestamp_range.TimestampRange:
+        """convert samples to TimestampRange, if they are evenly spaced"""
+        if len(self.head) > 0 or len(self.tail) > 0:
+            raise Exception(
+                'misaligned samples cannot be represented as TimestampRange'
+            )
+        first = self._get_first()
+        indices = self._indices
+        return timestamp_range.TimestampRange.from_count(
+            first + indices.start * self.interval,
+            indices.step * self.interval,
+            len(indices),
+        )
+
+    def to_list(self) -> list[int | float]:
+        """materialize samples as list"""
+        n_total = len(self.head) + self.n_aligned + len(self.tail)
+        if self._indices != range(n_total):
+            return [self._get_sample(position) for position in self._indices]
+
+        first = self._get_first()
+        interval = self.interval
+        n_aligned = self.n_aligned
+        aligned: typing.Sequence[int | float]
+        if isinstance(first, int) and isinstance(interval, int):
+            aligned = range(first, first + n_aligned * interval, interval)
+        else:
+            aligned = [first + k * interval for k in range(n_aligned)]
+        return [*self.head, *aligned, *self.tail]
+
+    def to_numpy(self) -> np.ndarray:
+        """materialize samples as numpy array"""
+        try:
+            import numpy as np
+        except ImportError:
+            raise Exception('numpy required for numpy output')
+
+        aligned = self._get_first() + np.arange(self.n_aligned) * self.interval
+        parts = [aligned]
+        if len(self.head) > 0:
+            parts.insert(0, np.array(self.head))
+        if len(self.tail) > 0:
+            parts.append(np.array(self.tail))
+        values = np.concatenate(parts) if len(parts) > 1 else aligned
+        if self._indices != range(len(values)):
+            start, stop, step = (
+                self._indices.start,
+                self._indices.stop,
+                self._indices.step,
+            )
+            values = values[np.arange(start, stop, step)]
+        return values
+
+
+class CalendarTimestampSamples(typing.Sequence[typing.Union[int, float]]):
+    """lazy sequence of samples stepped by calendar months
+
+    - counterpart of TimestampSamples for month, quarter, and year intervals,
+      whose samples are not evenly spaced in seconds
+    - samples are computed on access, nothing is materialized
+    - len, indexing, and slicing are O(1), slices are CalendarTimestampSamples
+    - values are identical to sample_timestamps(..., output='list')
+
+    samples consist of aligned samples, plus any misaligned samples before or
+    after them
+    - aligned sample k is shift_months(anchor, offset_months + k * step_months)
+    """
+
+    __slots__ = (
+        '_indices',
+        'anchor',
+        'head',
+        'n_aligned',
+        'offset_months',
+        'step_months',
+        'tail',
+    )
+
+    anchor: int | float
+    step_months: int
+    n_aligned: int
+    offset_months: int
+    head: tuple[int | float, ...]
+    tail: tuple[int | float, ...]
+    _indices: range
+
+    def __init__(
+        self,
+        anchor: int | float,
+        step_months: int,
+        n_aligned: int,
+        *,
+        offset_months: int = 0,
+        head: typing.Sequence[int | float] = (),
+        tail: typing.Sequence[int | float] = (),
+        indices: range | None = None,
+    ) -> None:
+        """create CalendarTimestampSamples
+
+        ## Inputs
+        - anchor: timestamp that aligned samples are shifted from
+        - step_months: number of months between aligned samples
+        - n_aligned: number of aligned samples
+        - offset_months: shift of first aligned sample from anchor in months
+        - head: misaligned samples before aligned samples
+        - tail: misaligned samples after aligned samples
+        - indices: range of positions to view, default is all samples
+        """
+        self.anchor = anchor
+        self.step_months = step_months
+        self.n_aligned = n_aligned
+        self.offset_months = offset_months
+        self.head = tuple(head)
+        self.tail = tuple(tail)
+        if indices is None:
+            indices = range(len(self.head) + n_aligned + len(self.tail))
+        self._indices = indices
+
+    def _get_sample(self, position: int) -> int | float:
+        """get sample at position of underlying, unsliced samples"""
+        n_head = len(self.head)
+        if position < n_head:
+            return self.head[position]
+        k = position - n_head
+        if k < self.n_aligned:
+            return timelength_utils.shift_months(  # type: ignore
+                self.anchor, self.offset_months + k * self.step_months
+            )
+        return self.tail[k - self.n_aligned]
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @typing.overload
+    def __getitem__(self, index: int) -> int | float: ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> CalendarTimestampSamples: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> int | float | CalendarTimestampSamples:
+        if isinstance(index, slice):
+            return CalendarTimestampSamples(
+                self.anchor,
+                self.step_months,
+                self.n_aligned,
+                offset_months=self.offset_months,
+                head=self.head,
+                tail=self.tail,
+                indices=self._indices[index],
+            )
+        return self._get_sample(self._indices[index])
+
+    def __iter__(self) -> typing.Iterator[int | float]:
+        for position in self._indices:
+            yield self._get_sample(position)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (CalendarTimestampSamples, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self, other)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            'CalendarTimestampSamples(n='
+            + str(len(self))
+            + ', step_months='
+            + str(self.step_months)
+            + ')'
+        )
+
+    def to_range(self) -> timestamp_range.TimestampRange:
+        """calendar months are unevenly spaced, so this always raises"""
+        raise Exception(
+            'calendar month intervals cannot be represented as TimestampRange'
+        )
+
+    def to_list(self) -> list[int | float]:
+        """materialize samples as list"""
+        n_total = len(self.head) + self.n_aligned + len(self.tail)
+        if self._indices != range(n_total):
+            return [self._get_sample(position) for position in self._indices]
+        return [*self.head, *self._get_aligned().tolist(), *self.tail]
+
+    def to_numpy(self) -> np.ndarray:
+        """materialize samples as numpy array"""
+        import numpy as np
+
+        aligned = self._get_aligned()
+        parts = [aligned]
+        if len(self.head) > 0:
+            parts.insert(0, np.array(self.head))
+        if len(self.tail) > 0:
+            parts.append(np.array(self.tail))
+        values = np.concatenate(parts) if len(parts) > 1 else aligned
+        if self._indices != range(len(values)):
+            start, stop, step = (
+                self._indices.start,
+                self._indices.stop,
+                self._indices.step,
+            )
+            values = values[np.arange(start, stop, step)]
+        return values
+
+    def _get_aligned(self) -> np.ndarray:
+        """compute aligned samples vectorized"""
+        try:
+            import numpy as np
+        except ImportError:
+            raise Exception('numpy required for calendar sampling intervals')
+
+        months = (
+            self.offset_months
+            + np.arange(self.n_aligned, dtype=np.int64) * self.step_months
+        )
+        return timelength_utils.shift_months(self.anchor, months)  # type: ignore
@@ -0,0 +1,555 @@
+from __future__ import annotations
+
+import math
+import os
+import typing
+
+from .. import spec
+from .. import timefrequency_utils
+from .. import timelength_utils
+from . import timestamp_convert
+from . import timestamp_introspect
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+
+
+# number of bits used to index unique count registers
+_unique_precision = 12
+
+
+class TimestampSummarizer:
+    """incremental summary of a stream of timestamps
+
+    - feed ordered chunks of timestamps with update(), then call result()
+    - summaries of consecutive shards can be combined with merge()
+    - state does not grow with the number of timestamps:
+        - count, first, last, min, and max are tracked exactly
+        - dts are counted exactly while there are at most max_distinct_dts
+          distinct dts, and are then kept in a QuantileSketch with
+          relative_accuracy
+        - unique count is exact for monotonic streams, and is otherwise
+          estimated with a HyperLogLog sketch (about 1.6% standard error)
+
+    ## Example Usage
+    summarizer = tooltime.TimestampSummarizer()
+    for chunk in chunks:
+        summarizer.update(chunk)
+    summary = summarizer.result()
+    """
+
+    __slots__ = (
+        '_dt_counts',
+        '_dt_sketch',
+        '_registers',
+        'first',
+        'last',
+        'max',
+        'max_distinct_dts',
+        'min',
+        'n_decreasing',
+        'n_increasing',
+        'n_t',
+        'relative_accuracy',
+    )
+
+    n_t: int
+    first: float | None
+    last: float | None
+    min: float | None
+    max: float | None
+    n_increasing: int
+    n_decreasing: int
+    max_distinct_dts: int
+    relative_accuracy: float
+    _dt_counts: dict[float, int]
+    _dt_sketch: timefrequency_utils.QuantileSketch | None
+    _registers: np.ndarray | None
+
+    def __init__(
+        self,
+        max_distinct_dts: int = 4096,
+        relative_accuracy: float = 0.01,
+    ) -> None:
+        """create TimestampSummarizer
+
+        ## Inputs
+        - max_distinct_dts: number of distinct dts to count exactly
+        - relative_accuracy: relative accuracy of dts once bucketed
+        """
+        if max_distinct_dts < 1:
+            raise Exception('max_distinct_dts must be positive')
+        if not 0 < relative_accuracy < 1:
+            raise Exception('relative_accuracy must be between 0 and 1')
+        self.n_t = 0
+        self.first = None
+        self.last = None
+        self.min = None
+        self.max = None
+        self.n_increasing = 0
+        self.n_decreasing = 0
+        self.max_distinct_dts = max_distinct_dts
+        self.relative_accuracy = relative_accuracy
+        self._dt_counts = {}
+        self._dt_sketch = None
+        self._registers = None
+
+    @property
+    def dts_are_exact(self) -> bool:
+        """whether dts are counted exactly rather than bucketed"""
+        return self._dt_sketch is None
+
+    def update(
+        self, timestamps: typing.Sequence[spec.Timestamp] | np.ndarray
+    ) -> TimestampSummarizer:
+        """add chunk of timestamps that follows all previous chunks
+
+        ## Inputs
+        - timestamps: iterable or numpy array of Timestamp
+
+        ## Returns
+        - this summarizer, for chaining
+        """
+        import numpy as np
+
+        values = timestamp_convert.timestamps_to_seconds_array(timestamps)
+        if len(values) == 0:
+            return self
+
+        if self.last is not None:
+            dts = np.diff(values, prepend=self.last)
+        else:
+            dts = np.diff(values)
+            self.first = float(values[0])
+        self.last = float(values[-1])
+        chunk_min = float(values.min())
+        chunk_max = float(values.max())
+        if self.min is None or chunk_min < self.min:
+            self.min = chunk_min
+        if self.max is None or chunk_max > self.max:
+            self.max = chunk_max
+        self.n_t += len(values)
+        self.n_increasing += int(np.count_nonzero(dts > 0))
+        self.n_decreasing += int(np.count_nonzero(dts < 0))
+        self._add_dts(dts)
+        self._add_unique(values)
+        return self
+
+    def merge(self, other: TimestampSummarizer) -> TimestampSummarizer:
+        """add summary of timestamps that follow all timestamps of this one
+
+        ## Inputs
+        - other: TimestampSummarizer of the next shard of timestamps
+
+        ## Returns
+        - this summarizer, for chaining
+        """
+        import numpy as np
+
+        if other.n_t == 0:
+            return self
+        if self.last is not None and other.first is not None:
+            boundary_dt = other.first - self.last
+            self.n_increasing += int(boundary_dt > 0)
+            self.n_decreasing += int(boundary_dt < 0)
+            self._add_dts(np.array([boundary_dt]))
+        else:
+            self.first = other.first
+        self.last = other.last
+        if self.min is None or (other.min is not None and other.min < self.min):
+            self.min = other.min
+        if self.max is None or (other.max is not None and other.max > self.max):
+            self.max = other.max
+        self.n_t += other.n_t
+        self.n_increasing += other.n_increasing
+        self.n_decreasing += other.n_decreasing
+
+        if other._dt_sketch is not None:
+            self._compact_dts()
+        if self._dt_sketch is not None:
+            if other._dt_sketch is not None:
+                self._dt_sketch.merge(other._dt_sketch)
+            else:
+                self._dt_sketch.update(
+                    list(other._dt_counts.keys()),
+                    list(other._dt_counts.values()),
+                )
+        else:
+            for key, count in other._dt_counts.items():
+                self._dt_counts[key] = self._dt_counts.get(key, 0) + count
+            if len(self._dt_counts) > self.max_distinct_dts:
+                self._compact_dts()
+
+        if other._registers is not None:
+            if self._registers is None:
+                self._registers = other._registers.copy()
+            else:
+                np.maximum(
+                    self._registers, other._registers, out=self._registers
+                )
+        return self
+
+    def result(
+        self,
+        outlier_rtol: float = 0.5,
+        outlier_method: timefrequency_utils.OutlierMethod = 'rtol',
+        outlier_threshold: float | None = None,
+    ) -> spec.TimestampSummary:
+        """create summary with the fields of summarize_timestamps()
+
+        - resolution dts and outlier arrays are None because individual dts
+          are not retained, outlier counts are still reported
+        - dispersion is exact while dts are counted exactly, otherwise it is
+          estimated from the sketch of dts
+
+        ## Inputs
+        - outlier_rtol: float of tolerance for detecting outliers
+        - outlier_method: str of how to score outliers, see detect_resolution()
+        - outlier_threshold: float threshold of outlier_method
+
+        ## Returns
+        - dict summary of timestamps
+        """
+        import numpy as np
+
+        summary: spec.TimestampSummary = {'n_t': self.n_t}
+        if self.n_t == 1:
+            summary['start'] = self.first
+            summary['end'] = self.first
+            return summary
+        elif self.n_t == 0 or self.first is None or self.last is None:
+            return summary
+
+        # orient dts as in summarize_timestamps(), which reverses descending
+        if self.last < self.first:
+            start, end, sign = self.last, self.first, -1
+        else:
+            start, end, sign = self.first, self.last, 1
+        if self._dt_sketch is not None:
+            sketch = self._dt_sketch if sign == 1 else self._dt_sketch.negated()
+            median_dt = sketch.median()
+            q1 = sketch.quantile(0.25)
+            q3 = sketch.quantile(0.75)
+            deviation_sketch = timefrequency_utils.QuantileSketch(
+                sketch.relative_accuracy
+            )
+            values, _, _, value_counts = zip(*sketch.iter_buckets())
+            deviation_sketch.update(
+                np.abs(np.array(values) - median_dt), value_counts
+            )
+            dispersion: timefrequency_utils.TimeFrequencyDispersion = {
+                'q1': q1,
+                'q3': q3,
+                'iqr': q3 - q1,
+                'mad': deviation_sketch.median(),
+            }
+            threshold, lower, upper = timefrequency_utils.get_dt_outlier_bounds(
+                outlier_method,
+                outlier_threshold,
+                outlier_rtol,
+                median_dt,
+                dispersion,
+            )
+            n_small_outliers = sketch.count_below(lower)
+            n_large_outliers = sketch.count_above(upper)
+        else:
+            keys = sign * np.array(list(self._dt_counts.keys()), dtype=float)
+            counts = np.array(list(self._dt_counts.values()), dtype=np.int64)
+            median_dt = _get_counted_quantile(keys, counts, 0.5)
+            q1 = _get_counted_quantile(keys, counts, 0.25)
+            q3 = _get_counted_quantile(keys, counts, 0.75)
+            dispersion = {
+                'q1': q1,
+                'q3': q3,
+                'iqr': q3 - q1,
+                'mad': _get_counted_quantile(
+                    np.abs(keys - median_dt), counts, 0.5
+                ),
+            }
+            threshold, lower, upper = timefrequency_utils.get_dt_outlier_bounds(
+                outlier_method,
+                outlier_threshold,
+                outlier_rtol,
+                median_dt,
+                dispersion,
+            )
+            n_small_outliers = int(counts[keys < lower].sum())
+            n_large_outliers = int(counts[keys > upper].sum())
+
+        summary['n_missing'] = timestamp_introspect.get_n_missing_timestamps(
+            start, end, median_dt, self.n_t
+        )
+
+        resolution: timefrequency_utils.TimeFrequencyResolution = {
+            'label': timelength_utils.timelength_seconds_to_label(median_dt),
+            'dts': None,
+            'use_n': None,
+            'median_dt': median_dt,
+            'dispersion': dispersion,
+            'outliers': {
+                'small': None,
+                'large': None,
+                'small_indices': None,
+                'large_indices': None,
+                'small_timestamps': None,
+                'large_timestamps': None,
+                'n_small': n_small_outliers,
+                'n_large': n_large_outliers,
+                'method': outlier_method,
+                'threshold': threshold,
+                'lower': lower,
+                'upper': upper,
+                'outlier_rtol': outlier_rtol,
+            },
+        }
+        duration = end - start
+        summary['n_unique'] = self._get_n_unique()
+        summary['resolution'] = resolution
+        summary['start'] = timestamp_convert.timestamp_to_label(start)
+        summary['end'] = timestamp_convert.timestamp_to_label(end)
+        summary['duration'] = duration
+        summary['duration_label'] = (
+            timelength_utils.timelength_seconds_to_clock_phrase(duration)
+        )
+        summary['n_large_outliers'] = n_large_outliers
+        summary['n_small_outliers'] = n_small_outliers
+        summary['n_outliers'] = n_large_outliers + n_small_outliers
+        return summary
+
+    #
+    # # dt counts
+    #
+
+    def _add_dts(self, dts: np.ndarray) -> None:
+        import numpy as np
+
+        if len(dts) == 0:
+            return
+        if self._dt_sketch is not None:
+            self._dt_sketch.update(dts)
+            return
+        if (dts == dts[0]).all():
+            # regular spacing, avoid sorting in np.unique()
+            keys = dts[:1]
+            counts = np.array([len(dts)])
+        else:
+            keys, counts = np.unique(dts, return_counts=True)
+        self._count_dts(keys, counts)
+
+    def _count_dts(self, keys: np.ndarray, counts: np.ndarray) -> None:
+        dt_counts = self._dt_counts
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            dt_counts[key] = dt_counts.get(key, 0) + count
+        if len(dt_counts) > self.max_distinct_dts:
+            self._compact_dts()
+
+    def _compact_dts(self) -> None:
+        """switch from exact dt counts to a quantile sketch of dts"""
+        if self._dt_sketch is not None:
+            return
+        self._dt_sketch = timefrequency_utils.QuantileSketch(
+            self.relative_accuracy
+        )
+        self._dt_sketch.update(
+            list(self._dt_counts.keys()), list(self._dt_counts.values())
+        )
+        self._dt_counts = {}
+
+    #
+    # # unique count
+    #
+
+    def _add_unique(self, values: np.ndarray) -> None:
+        import numpy as np
+
+        if self._registers is None:
+            self._registers = np.zeros(2**_unique_precision, dtype=np.uint8)
+        registers = self._registers
+        index_shift = np.uint64(64 - _unique_precision)
+        remainder_mask = np.uint64(2 ** (64 - _unique_precision) - 1)
+        max_rank = 64 - _unique_precision + 1
+
+        # hash in cache-sized blocks, and skip ranks that cannot raise their
+        # register before the slow unbuffered np.maximum.at
+        block_size = 2**16
+        for block_start in range(0, len(values), block_size):
+            hashes = _hash_floats(
+                values[block_start : block_start + block_size]
+            )
+            indices = (hashes >> index_shift).astype(np.intp)
+            hashes &= remainder_mask
+            _, bit_lengths = np.frexp(hashes.astype(np.float64))
+            ranks = (max_rank - bit_lengths).astype(np.uint8)
+            mask = ranks > registers[indices]
+            np.maximum.at(registers, indices[mask], ranks[mask])
+
+    def _get_n_unique(self) -> int:
+        if self.n_increasing == 0 or self.n_decreasing == 0:
+            return 1 + self.n_increasing + self.n_decreasing
+        if self._registers is None:
+            return 0
+        import numpy as np
+
+        m = len(self._registers)
+        estimate = (
+            0.7213
+            / (1 + 1.079 / m)
+            * m**2
+            / float(np.sum(np.ldexp(1.0, -self._registers.astype(np.int64))))
+        )
+        n_empty = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * m and n_empty > 0:
+            estimate = m * math.log(m / n_empty)
+        return min(self.n_t, round(estimate))
+
+
+def _get_counted_quantile(
+    keys: np.ndarray, counts: np.ndarray, q: float
+) -> float:
+    """compute np.quantile() of values given as distinct keys and counts"""
+    import numpy as np
+
+    order = np.argsort(keys)
+    keys = keys[order]
+    cumulative = np.cumsum(counts[order])
+    position = q * (cumulative[-1] - 1)
+    lower, upper = np.searchsorted(
+        cumulative, [math.floor(position), math.ceil(position)], side='right'
+    )
+    fraction = position - math.floor(position)
+    return float(keys[lower] + fraction * (keys[upper] - keys[lower]))
+
+
+def summarize_timestamp_file(
+    path: str | os.PathLike[str],
+    column: str | None = None,
+    *,
+    chunk_size: int = 2**24,
+    n_workers: int | None = None,
+    outlier_rtol: float = 0.5,
+    outlier_method: timefrequency_utils.OutlierMethod = 'rtol',
+    outlier_threshold: float | None = None,
+    max_distinct_dts: int = 4096,
+    relative_accuracy: float = 0.01,
+) -> spec.TimestampSummary:
+    """summarize timestamps of a file that can be larger than memory
+
+    - .npy files are memory-mapped and .parquet files are scanned with polars,
+      reading at most chunk_size timestamps per chunk
+    - each chunk is summarized by a TimestampSummarizer and the chunks are
+      merged in file order, so dts across chunk boundaries are included
+    - output matches summarize_timestamps() under the exactness conditions of
+      TimestampSummarizer
+    - with n_workers, chunks are summarized in a thread pool, using at most
+      n_workers chunks of memory at a time
+
+    ## Inputs
+    - path: path of .npy file with 1d array or .parquet file
+    - column: str name of timestamp column of parquet file, can be omitted
+      if file has one column
+    - chunk_size: int number of timestamps per chunk
+    - n_workers: int number of worker threads, default is no threads
+    - outlier_rtol: float of tolerance for detecting outliers
+    - outlier_method: str of how to score outliers, see detect_resolution()
+    - outlier_threshold: float threshold of outlier_method
+    - max_distinct_dts: see TimestampSummarizer
+    - relative_accuracy: see TimestampSummarizer
+
+    ## Returns
+    - dict summary of timestamps
+    """
+    import concurrent.futures
+
+    if chunk_size <= 0:
+        raise Exception('chunk_size must be positive')
+    read_chunk, n_timestamps = _get_chunk_reader(path, column, chunk_size)
+
+    def summarize_chunk(start: int) -> TimestampSummarizer:
+        summarizer = TimestampSummarizer(
+            max_distinct_dts=max_distinct_dts,
+            relative_accuracy=relative_accuracy,
+        )
+        return summarizer.update(read_chunk(start))
+
+    starts = range(0, n_timestamps, chunk_size)
+    total = TimestampSummarizer(
+        max_distinct_dts=max_distinct_dts,
+        relative_accuracy=relative_accuracy,
+    )
+    if n_workers is not None and n_workers > 1:
+        with concurrent.futures.ThreadPoolExecutor(n_workers) as executor:
+            for summarizer in executor.map(summarize_chunk, starts):
+                total.merge(summarizer)
+    else:
+        for start in starts:
+            total.update(read_chunk(start))
+    return total.result(
+        outlier_rtol=outlier_rtol,
+        outlier_method=outlier_method,
+        outlier_threshold=outlier_threshold,
+    )
+
+
+def _get_chunk_reader(
+    path: str | os.PathLike[str],
+    column: str | None,
+    chunk_size: int,
+) -> tuple[typing.Callable[[int], np.ndarray], int]:
+    """get function that reads chunk starting at index, and file length"""
+    try:
+        import numpy as np
+    except ImportError:
+        raise Exception('numpy required for summarizing files')
+
+    extension = os.path.splitext(path)[1]
+    if extension == '.npy':
+        array = np.load(path, mmap_mode='r')
+        if array.ndim != 1:
+            raise Exception('npy file must contain 1d array')
+
+        def read_npy_chunk(start: int) -> np.ndarray:
+            return np.asarray(array[start : start + chunk_size])
+
+        return read_npy_chunk, len(array)
+
+    elif extension in ('.parquet', '.pq'):
+        import polars as pl
+
+        lazy = pl.scan_parquet(os.fspath(path))
+        schema = lazy.collect_schema()
+        if column is None:
+            if len(schema) != 1:
+                raise Exception('must specify column of parquet file')
+            column = schema.names()[0]
+        dtype = schema[column]
+        if dtype == pl.Datetime or dtype == pl.Date:
+            seconds = pl.col(column).dt.epoch('us') / 1_000_000
+        elif dtype.is_numeric():
+            seconds = pl.col(column).cast(pl.Float64)
+        else:
+            raise Exception('column must be numeric, Datetime, or Date')
+        n_timestamps = lazy.select(pl.len()).collect().item()
+
+        def read_parquet_chunk(start: int) -> np.ndarray:
+            chunk = lazy.slice(start, chunk_size).select(seconds).collect()
+            return chunk.to_series().to_numpy()
+
+        return read_parquet_chunk, n_timestamps
+
+    else:
+        raise Exception('unsupported file type: ' + str(extension))
+
+
+def _hash_floats(values: np.ndarray) -> np.ndarray:
+    """hash float64 values to uint64 using splitmix64 finalizer"""
+    import numpy as np
+
+    # adding zero normalizes -0.0 to 0.0
+    z = (values + 0.0).view(np.uint64)
+    z += np.uint64(0x9E3779B97F4A7C15)
+    z ^= z >> np.uint64(30)
+    z *= np.uint64(0xBF58476D1CE4E5B9)
+    z ^= z >> np.uint64(27)
+    z *= np.uint64(0x94D049BB133111EB)
+    z ^= z >> np.uint64(31)
+    return z
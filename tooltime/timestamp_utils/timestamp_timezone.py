@@ -0,0 +1,432 @@
+from __future__ import annotations
+
+import array
+import bisect
+import datetime
+import functools
+import itertools
+import typing
+
+from .. import spec
+from . import timestamp_calendar
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+
+
+#
+# # transition tables
+#
+# each timezone is compiled once into a pair of int64 tables
+# - built from transition times in the tzif file of the timezone, with
+#   offsets from zoneinfo, or by probing zoneinfo if no file is found
+# - transitions: sorted utc seconds at which the utc offset changes
+# - offsets: utc offset in seconds before the first transition and after
+#   each transition, so len(offsets) == len(transitions) + 1
+# tables cover the years of get_month_table_range(), instants outside of this
+# range use the offset of the nearest covered instant
+#
+
+
+def get_timezone_table(
+    timezone: str,
+) -> tuple[array.array[int], array.array[int]]:
+    """get (transitions, offsets) tables of timezone
+
+    ## Inputs
+    - timezone: str name of IANA timezone, e.g. 'America/New_York'
+
+    ## Returns
+    - tuple of int64 arrays (transitions, offsets)
+    """
+    table = _get_compiled_table(timezone)
+    return table.transitions, table.offsets
+
+
+class _TimezoneTable(typing.NamedTuple):
+    transitions: array.array[int]
+    offsets: array.array[int]
+    local_ends: array.array[int]
+    first_day: int
+    transition_days: array.array[int] | None
+    local_end_days: array.array[int] | None
+
+
+def _get_compiled_table(timezone: str) -> _TimezoneTable:
+    start_year, end_year = timestamp_calendar.get_month_table_range()
+    return _compile_timezone_table(timezone, start_year, end_year)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_timezone_table(
+    timezone: str, start_year: int, end_year: int
+) -> _TimezoneTable:
+    try:
+        import zoneinfo
+    except ImportError:
+        raise Exception('zoneinfo (python >= 3.9) required for timezones')
+
+    tzinfo = zoneinfo.ZoneInfo(timezone)
+
+    def get_offset(seconds: int) -> int:
+        dt = datetime.datetime.fromtimestamp(seconds, tzinfo)
+        utcoffset = dt.utcoffset()
+        if utcoffset is None:
+            raise Exception('could not compute utc offset')
+        return int(utcoffset.total_seconds())
+
+    first_day = timestamp_calendar.days_from_civil(start_year, 1, 1)
+    last_day = timestamp_calendar.days_from_civil(end_year + 1, 1, 1)
+    start = first_day * 86400
+    end = last_day * 86400
+    transitions = array.array('q')
+    offsets = array.array('q', [get_offset(start)])
+
+    # transition times listed in tzif file are exact, and offset after each
+    # is looked up in zoneinfo, so that tables always agree with zoneinfo
+    tzif = _read_tzif(timezone)
+    if tzif is not None:
+        tzif_transitions, footer = tzif
+        for transition in tzif_transitions:
+            if start < transition <= end:
+                offset = get_offset(transition)
+                if offset != offsets[-1]:
+                    transitions.append(transition)
+                    offsets.append(offset)
+
+        # after its last transition, tzif file follows footer tz rule, which
+        # only has transitions if it has a dst rule, e.g. 'EST5EDT,M3.2.0,...'
+        # - dst rules change offset at most twice per year and each offset
+        #   lasts months, so weekly probes find every transition
+        if ',' in footer:
+            if len(tzif_transitions) > 0:
+                probe_start = max(start, tzif_transitions[-1])
+            else:
+                probe_start = start
+            _probe_transitions(
+                get_offset, transitions, offsets, probe_start, end, 7 * 86400
+            )
+    else:
+        # without tzif file, probe offset once per day
+        _probe_transitions(get_offset, transitions, offsets, start, end, 86400)
+
+    # local time at which each pre-transition offset stops being valid
+    local_ends = array.array('q', [t + o for t, o in zip(transitions, offsets)])
+
+    return _TimezoneTable(
+        transitions=transitions,
+        offsets=offsets,
+        local_ends=local_ends,
+        first_day=first_day,
+        transition_days=_index_by_day(transitions, first_day, last_day),
+        local_end_days=_index_by_day(local_ends, first_day, last_day),
+    )
+
+
+def _probe_transitions(
+    get_offset: typing.Callable[[int], int],
+    transitions: array.array[int],
+    offsets: array.array[int],
+    start: int,
+    end: int,
+    step: int,
+) -> None:
+    """append transitions found by probing offset every step seconds
+
+    - each change between probes is bisected down to the second
+    - offsets that change and change back between two probes are missed
+    """
+    previous = start
+    for probe in range(start + step, end + step, step):
+        probe = min(probe, end)
+        while get_offset(probe) != offsets[-1]:
+            lo, hi = previous, probe
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if get_offset(mid) == offsets[-1]:
+                    lo = mid
+                else:
+                    hi = mid
+            transitions.append(hi)
+            offsets.append(get_offset(hi))
+            previous = hi
+        previous = probe
+
+
+def _read_tzif(timezone: str) -> tuple[list[int], str] | None:
+    """read (transition times, footer tz rule) from tzif file of timezone
+
+    - files are found like zoneinfo, in zoneinfo.TZPATH then tzdata package
+    - returns None if file is not found, or has leap seconds or no footer
+    """
+    import os
+    import struct
+    import zoneinfo
+
+    data = None
+    for root in zoneinfo.TZPATH:
+        path = os.path.join(root, timezone)
+        if os.path.isfile(path):
+            with open(path, 'rb') as f:
+                data = f.read()
+            break
+    else:
+        try:
+            import importlib.resources
+
+            resource = importlib.resources.files('tzdata.zoneinfo')
+            for piece in timezone.split('/'):
+                resource = resource.joinpath(piece)
+            data = resource.read_bytes()
+        except (ImportError, OSError):
+            return None
+    if data is None or data[:4] != b'TZif' or data[4:5] < b'2':
+        return None
+
+    # skip version 1 block of 32-bit times, then read version 2 block
+    header_size = 44
+    isut, isstd, leap, n_times, n_types, n_chars = struct.unpack(
+        '>6l', data[20:header_size]
+    )
+    v1_size = n_times * 5 + n_types * 6 + n_chars + leap * 8 + isstd + isut
+    v2_start = header_size + v1_size
+    isut, isstd, leap, n_times, n_types, n_chars = struct.unpack(
+        '>6l', data[v2_start + 20 : v2_start + header_size]
+    )
+    if leap > 0:
+        return None
+    times_start = v2_start + header_size
+    times = list(
+        struct.unpack(
+            '>' + str(n_times) + 'q',
+            data[times_start : times_start + 8 * n_times],
+        )
+    )
+    v2_size = n_times * 9 + n_types * 6 + n_chars + leap * 12 + isstd + isut
+    footer = data[times_start + v2_size :].decode().strip()
+    return times, footer
+
+
+def _index_by_day(
+    points: array.array[int], first_day: int, last_day: int
+) -> array.array[int] | None:
+    """index sorted points by day, for search without binary search
+
+    - entry d is the number of points before the start of day first_day + d
+    - returns None if any day contains more than one point
+    """
+    # each point is counted from the day after the day that contains it
+    n_days = last_day - first_day + 1
+    counts = array.array('q')
+    for position, point in enumerate(points):
+        day = point // 86400 - first_day
+        if position > 0 and 0 <= day < n_days - 1:
+            if points[position - 1] // 86400 - first_day == day:
+                return None
+        counts.extend(
+            itertools.repeat(position, min(day + 1, n_days) - len(counts))
+        )
+    counts.extend(itertools.repeat(len(points), n_days - len(counts)))
+    return counts
+
+
+def _search_points(
+    points: np.ndarray,
+    day_positions: array.array[int] | None,
+    first_day: int,
+    values: np.ndarray,
+) -> np.ndarray:
+    """vectorized equivalent of np.searchsorted(points, values, 'right')
+
+    - looks up number of points before each value's day, then corrects for
+      the at most one point within that day
+    - avoids binary search, which is slow for large unsorted arrays
+    """
+    import numpy as np
+
+    values = np.asarray(values)
+    if day_positions is not None and values.size > 0:
+        days = values // 86400 - first_day
+        if days.min() >= 0 and days.max() < len(day_positions) - 1:
+            positions = np.frombuffer(day_positions, dtype=np.int64)[days]
+            if len(points) > 0:
+                clipped = np.minimum(positions, len(points) - 1)
+                positions = positions + (
+                    (positions < len(points)) & (points[clipped] <= values)
+                )
+            return positions
+    return np.searchsorted(points, values, side='right')
+
+
+def _get_timezone_arrays(
+    timezone: str,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    import numpy as np
+
+    table = _get_compiled_table(timezone)
+    return (
+        np.frombuffer(table.transitions, dtype=np.int64),
+        np.frombuffer(table.offsets, dtype=np.int64),
+        np.frombuffer(table.local_ends, dtype=np.int64),
+    )
+
+
+#
+# # conversions
+#
+
+
+def get_utc_offsets(timestamps: typing.Any, timezone: str) -> typing.Any:
+    """get utc offset in seconds of timezone at each timestamp
+
+    ## Inputs
+    - timestamps: int seconds or int array of seconds
+    - timezone: str name of IANA timezone
+
+    ## Returns
+    - int offset, or int64 array of offsets
+    """
+    if spec.is_int_scalar(timestamps):
+        transitions, offsets = get_timezone_table(timezone)
+        return offsets[bisect.bisect_right(transitions, int(timestamps))]
+
+    import numpy as np
+
+    table = _get_compiled_table(timezone)
+    transitions_array, offsets_array, _ = _get_timezone_arrays(timezone)
+    positions = _search_points(
+        transitions_array,
+        table.transition_days,
+        table.first_day,
+        np.asarray(timestamps, dtype=np.int64),
+    )
+    return offsets_array[positions]
+
+
+def timestamps_to_local(timestamps: typing.Any, timezone: str) -> typing.Any:
+    """convert utc seconds to local wall clock seconds of timezone
+
+    - local wall clock seconds count seconds since 1970-01-01T00:00:00 in
+      local time, so calendar arithmetic can be applied to them directly
+
+    ## Inputs
+    - timestamps: int seconds or int array of seconds
+    - timezone: str name of IANA timezone
+
+    ## Returns
+    - int or int64 array of local wall clock seconds
+    """
+    return timestamps + get_utc_offsets(timestamps, timezone)
+
+
+def local_to_timestamps(
+    local_seconds: typing.Any,
+    timezone: str,
+    *,
+    ambiguous: typing.Literal['earliest', 'latest'] = 'earliest',
+    nonexistent: typing.Literal['shift_forward', 'raise'] = 'shift_forward',
+) -> typing.Any:
+    """convert local wall clock seconds of timezone to utc seconds
+
+    ## Inputs
+    - local_seconds: int or int array of local wall clock seconds
+    - timezone: str name of IANA timezone
+    - ambiguous: which instant to use for local times that occur twice
+    - nonexistent: how to handle local times skipped by a transition
+        - 'shift_forward': use the first instant after the skipped times
+        - 'raise': raise an exception
+
+    ## Returns
+    - int or int64 array of utc seconds
+    """
+    if ambiguous not in ('earliest', 'latest'):
+        raise Exception('ambiguous must be earliest or latest')
+    if nonexistent not in ('shift_forward', 'raise'):
+        raise Exception('nonexistent must be shift_forward or raise')
+
+    if spec.is_int_scalar(local_seconds):
+        local_seconds = int(local_seconds)
+        table = _get_compiled_table(timezone)
+        transitions, offsets = table.transitions, table.offsets
+        position = bisect.bisect_right(table.local_ends, local_seconds)
+        result = local_seconds - offsets[position]
+        if position > 0 and result < transitions[position - 1]:
+            if nonexistent == 'raise':
+                raise Exception('nonexistent local time: ' + str(local_seconds))
+            result = transitions[position - 1]
+        elif (
+            ambiguous == 'latest'
+            and position < len(transitions)
+            and local_seconds - offsets[position + 1] >= transitions[position]
+        ):
+            result = local_seconds - offsets[position + 1]
+        return result
+
+    import numpy as np
+
+    table = _get_compiled_table(timezone)
+    transitions_array, offsets_array, local_ends_array = _get_timezone_arrays(
+        timezone
+    )
+    local_array = np.asarray(local_seconds, dtype=np.int64)
+    positions = _search_points(
+        local_ends_array, table.local_end_days, table.first_day, local_array
+    )
+    result = local_array - offsets_array[positions]
+
+    # local times skipped by a transition
+    if len(transitions_array) > 0:
+        previous = transitions_array[np.maximum(positions - 1, 0)]
+        skipped = (positions > 0) & (result < previous)
+        if skipped.any():
+            if nonexistent == 'raise':
+                raise Exception('nonexistent local times encountered')
+            result = np.where(skipped, previous, result)
+
+        # local times that occur twice
+        if ambiguous == 'latest':
+            has_next = positions < len(transitions_array)
+            next_positions = np.minimum(positions, len(transitions_array) - 1)
+            later = local_array - offsets_array[next_positions + 1]
+            repeated = has_next & (later >= transitions_array[next_positions])
+            result = np.where(repeated, later, result)
+
+    return result
+
+
+def resolve_local_timestamps(
+    local_seconds: typing.Any,
+    reference_offsets: typing.Any,
+    timezone: str,
+) -> typing.Any:
+    """convert local wall clock seconds to utc, preferring reference offsets
+
+    - used to map truncated local times back to utc
+    - a local time is converted using the utc offset of a nearby reference
+      instant whenever that offset is still in effect, so that truncation
+      within a repeated hour stays within that hour
+    - otherwise falls back to local_to_timestamps()
+
+    ## Inputs
+    - local_seconds: int or int array of local wall clock seconds
+    - reference_offsets: int or int array of utc offsets of reference instants
+    - timezone: str name of IANA timezone
+    """
+    candidates = local_seconds - reference_offsets
+    consistent = get_utc_offsets(candidates, timezone) == reference_offsets
+    if isinstance(consistent, bool):
+        if consistent:
+            return candidates
+        return local_to_timestamps(local_seconds, timezone)
+    elif consistent.all():
+        return candidates
+    else:
+        import numpy as np
+
+        inconsistent = ~consistent
+        local_array = np.broadcast_to(local_seconds, candidates.shape)
+        result = candidates.copy()
+        result[inconsistent] = local_to_timestamps(
+            local_array[inconsistent], timezone
+        )
+        return result
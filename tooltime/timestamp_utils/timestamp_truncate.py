@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import math
+import typing
+
+from .. import exceptions
+from .. import spec
+from .. import timelength_utils
+from . import timestamp_calendar
+from . import timestamp_timezone
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+
+
+_interval_names = {
+    'second': '1s',
+    'minute': '1m',
+    'hour': '1h',
+    'day': '1d',
+    'week': '1w',
+    'month': '1M',
+    'quarter': '1q',
+    'year': '1y',
+}
+
+_fixed_unit_seconds = {
+    's': 1,
+    'm': 60,
+    'h': 60 * 60,
+    'd': 60 * 60 * 24,
+    'w': 60 * 60 * 24 * 7,
+}
+
+# weeks begin on sunday, unix genesis was a thursday
+_week_offset = -4 * 86400
+
+
+def parse_interval_label(interval: str) -> tuple[int, str]:
+    """parse truncation interval into (count, unit)
+
+    - interval is either a unit name or a str in format '{number}{time_unit}'
+        - unit names are {second, minute, hour, day, week, month, quarter, year}
+        - time_unit is one of s, m, h, d, w, M, q, y
+    - interval can also be another str Timelength
+        - a single amount of one unit keeps its unit, e.g. '2 months'
+        - other timelengths use the largest fixed unit that divides them,
+          e.g. '1h30m' is parsed as 90 minutes
+    - quarters are returned as multiples of 3 months
+    - returned unit is one of s, m, h, d, w, M, y
+
+    ## Inputs
+    - interval: str name or TimelengthLabel of interval
+
+    ## Returns
+    - tuple of (int count, str unit)
+    """
+    interval = _interval_names.get(interval, interval)
+    if not isinstance(interval, str) or len(interval) < 2:
+        raise Exception('invalid interval: ' + str(interval))
+    unit = interval[-1]
+    try:
+        count = int(interval[:-1])
+    except ValueError:
+        count, unit = _parse_timelength_interval(interval)
+    if count <= 0:
+        raise Exception('interval count must be positive: ' + str(interval))
+    if unit == 'q':
+        return (3 * count, 'M')
+    elif unit in _fixed_unit_seconds or unit in ('M', 'y'):
+        return (count, unit)
+    else:
+        raise Exception('invalid interval unit: ' + str(interval))
+
+
+def _parse_timelength_interval(interval: str) -> tuple[int, str]:
+    """parse str Timelength that is not a TimelengthLabel into (count, unit)"""
+    try:
+        parsed = timelength_utils.parse_timelength(interval)
+    except exceptions.RepresentationDetectionException:
+        raise Exception('invalid interval: ' + str(interval))
+    seconds = parsed['seconds']
+    if seconds != int(seconds):
+        raise Exception('interval must be whole seconds: ' + str(interval))
+    seconds = int(seconds)
+
+    base_units = timelength_utils.get_base_units()
+    unit = parsed['unit']
+    if unit is not None and seconds % base_units['1' + unit] == 0:
+        return (seconds // base_units['1' + unit], unit)
+    for unit in ('w', 'd', 'h', 'm', 's'):
+        if seconds % _fixed_unit_seconds[unit] == 0:
+            return (seconds // _fixed_unit_seconds[unit], unit)
+    raise Exception('invalid interval: ' + str(interval))
+
+
+#
+# # boundary arithmetic
+#
+# intervals are standardized in the same way as get_intervals():
+# - s, m, h, d are integer offsets from January 1 1970
+# - weeks are integer offsets from sunday December 28 1969
+# - months are integer offsets from January 1970
+# - years are integer multiples of the year number
+# months and years are looked up in the shared month start table
+# all operations are integer, so they apply to ints and int64 arrays alike
+#
+
+
+def get_boundary_index(
+    seconds: typing.Any, count: int, unit: str
+) -> typing.Any:
+    """get index of interval containing each integer timestamp
+
+    ## Inputs
+    - seconds: int or int array of timestamps
+    - count, unit: interval, as returned by parse_interval_label()
+    """
+    if unit == 'w':
+        return (seconds - _week_offset) // (count * _fixed_unit_seconds['w'])
+    elif unit in _fixed_unit_seconds:
+        return seconds // (count * _fixed_unit_seconds[unit])
+    elif unit == 'M':
+        return timestamp_calendar.seconds_to_month_index(seconds) // count
+    elif unit == 'y':
+        month_index = timestamp_calendar.seconds_to_month_index(seconds)
+        return (month_index // 12 + 1970) // count
+    else:
+        raise Exception('invalid interval unit: ' + str(unit))
+
+
+def get_boundary_seconds(
+    index: typing.Any, count: int, unit: str
+) -> typing.Any:
+    """get start timestamp of each interval index
+
+    ## Inputs
+    - index: int or int array of interval indices, see get_boundary_index()
+    - count, unit: interval, as returned by parse_interval_label()
+    """
+    if unit == 'w':
+        return index * count * _fixed_unit_seconds['w'] + _week_offset
+    elif unit in _fixed_unit_seconds:
+        return index * count * _fixed_unit_seconds[unit]
+    elif unit == 'M':
+        return timestamp_calendar.month_index_to_seconds(index * count)
+    elif unit == 'y':
+        month_index = (index * count - 1970) * 12
+        return timestamp_calendar.month_index_to_seconds(month_index)
+    else:
+        raise Exception('invalid interval unit: ' + str(unit))
+
+
+#
+# # scalar truncation
+#
+
+
+def truncate_timestamp_seconds(
+    seconds: spec.TimestampSecondsRaw,
+    interval: str,
+    direction: spec.TruncationDirection = 'floor',
+    *,
+    timezone: str | None = None,
+) -> spec.TimestampSeconds:
+    """truncate seconds to boundary of a standardized interval
+
+    - rounding ties are broken toward the later boundary
+    - if timezone is given, boundaries are taken in local wall clock time,
+      e.g. '1d' truncates to local midnight, see local_to_timestamps() for
+      boundaries that are skipped or repeated by daylight saving transitions
+
+    ## Inputs
+    - seconds: int or float seconds
+    - interval: str name or TimelengthLabel of interval, e.g. '15m' or '1q'
+    - direction: 'floor', 'ceiling', or 'round'
+    - timezone: str name of IANA timezone, default is UTC
+
+    ## Returns
+    - int seconds of interval boundary
+    """
+    if direction not in ('floor', 'ceiling', 'round'):
+        raise Exception('direction must be floor, ceiling, or round')
+    count, unit = parse_interval_label(interval)
+    value = spec.to_numeric(seconds)
+    int_value = math.floor(value)
+    if timezone is not None:
+        offset = timestamp_timezone.get_utc_offsets(int_value, timezone)
+        int_value = int_value + offset
+    index = get_boundary_index(int_value, count, unit)
+    start: int = get_boundary_seconds(index, count, unit)
+    if timezone is not None:
+        start = timestamp_timezone.resolve_local_timestamps(
+            start, offset, timezone
+        )
+    if direction == 'floor' or start == value:
+        return start
+    end: int = get_boundary_seconds(index + 1, count, unit)
+    if timezone is not None:
+        end = timestamp_timezone.resolve_local_timestamps(end, offset, timezone)
+    if direction == 'ceiling' or value - start >= end - value:
+        return end
+    else:
+        return start
+
+
+#
+# # vectorized truncation
+#
+
+
+def floor_timestamps(
+    timestamps: typing.Any, interval: str, *, timezone: str | None = None
+) -> np.ndarray:
+    """take floor of array of seconds to standardized interval boundaries"""
+    return truncate_timestamps(
+        timestamps, interval, direction='floor', timezone=timezone
+    )
+
+
+def ceiling_timestamps(
+    timestamps: typing.Any, interval: str, *, timezone: str | None = None
+) -> np.ndarray:
+    """take ceiling of array of seconds to standardized interval boundaries"""
+    return truncate_timestamps(
+        timestamps, interval, direction='ceiling', timezone=timezone
+    )
+
+
+def round_timestamps(
+    timestamps: typing.Any, interval: str, *, timezone: str | None = None
+) -> np.ndarray:
+    """round array of seconds to nearest standardized interval boundaries"""
+    return truncate_timestamps(
+        timestamps, interval, direction='round', timezone=timezone
+    )
+
+
+def truncate_timestamps(
+    timestamps: typing.Any,
+    interval: str,
+    direction: spec.TruncationDirection = 'floor',
+    *,
+    timezone: str | None = None,
+) -> np.ndarray:
+    """truncate array of seconds to boundaries of a standardized interval
+
+    vectorized equivalent of truncate_timestamp_seconds()
+
+    ## Inputs
+    - timestamps: array or sequence of int or float seconds
+    - interval: str name or TimelengthLabel of interval, e.g. '15m' or '1q'
+    - direction: 'floor', 'ceiling', or 'round'
+    - timezone: str name of IANA timezone, default is UTC
+
+    ## Returns
+    - int64 array of interval boundaries
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise Exception('numpy required for vectorized truncation')
+
+    if direction not in ('floor', 'ceiling', 'round'):
+        raise Exception('direction must be floor, ceiling, or round')
+    count, unit = parse_interval_label(interval)
+
+    values = np.asarray(timestamps)
+    if values.dtype.kind == 'f':
+        int_values = np.floor(values).astype(np.int64)
+    else:
+        int_values = values.astype(np.int64, copy=False)
+
+    if timezone is None:
+        index = get_boundary_index(int_values, count, unit)
+        start = get_boundary_seconds(index, count, unit)
+        if direction == 'floor':
+            return start
+        end = get_boundary_seconds(index + 1, count, unit)
+    else:
+        offsets = timestamp_timezone.get_utc_offsets(int_values, timezone)
+        index = get_boundary_index(int_values + offsets, count, unit)
+        start = timestamp_timezone.resolve_local_timestamps(
+            get_boundary_seconds(index, count, unit), offsets, timezone
+        )
+        if direction == 'floor':
+            return start
+        end = timestamp_timezone.resolve_local_timestamps(
+            get_boundary_seconds(index + 1, count, unit), offsets, timezone
+        )
+    if direction == 'ceiling':
+        return np.where(values > start, end, start)
+    else:
+        return np.where(values - start < end - values, start, end)
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import typing
+from typing_extensions import TypedDict
+
+from .. import spec
+from . import timestamp_convert
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+
+
+class TimestampOrderReport(TypedDict):
+    n_t: int
+    is_sorted: bool
+    is_strictly_increasing: bool
+    is_reverse_sorted: bool
+    n_out_of_order: int
+    out_of_order_indices: np.ndarray | None
+    max_backward_jump: float
+    n_duplicates: int
+    duplicate_indices: np.ndarray | None
+
+
+def validate_timestamp_order(
+    timestamps: typing.Sequence[spec.Timestamp] | np.ndarray,
+    return_indices: bool = True,
+) -> TimestampOrderReport:
+    """validate ordering of timestamps
+
+    - timestamp i is out of order if it is before some earlier timestamp,
+      i.e. it arrived late relative to the latest timestamp so far
+    - backward jump of an out of order timestamp is how far it is before the
+      latest timestamp so far
+    - timestamp i is a duplicate if it equals timestamp i - 1, for sorted
+      timestamps this finds every duplicate
+    - see TimestampOrderValidator to validate a stream of chunks
+
+    ## Inputs
+    - timestamps: iterable or numpy array of Timestamp
+    - return_indices: bool of whether to return indices of out of order and
+      duplicate timestamps, or only their counts
+
+    ## Returns
+    - dict report of whether timestamps are sorted, with counts and indices
+      of out of order and duplicate timestamps and maximum backward jump
+    """
+    return (
+        TimestampOrderValidator(return_indices=return_indices)
+        .update(timestamps)
+        .result()
+    )
+
+
+class TimestampOrderValidator:
+    """incremental validation of ordering of a stream of timestamps
+
+    - feed consecutive chunks of timestamps with update(), then call result()
+    - gives the same report as validate_timestamp_order() of all chunks
+    - state is constant unless return_indices is True, in which case indices
+      of out of order and duplicate timestamps are retained
+
+    ## Example Usage
+    validator = tooltime.TimestampOrderValidator()
+    for chunk in chunks:
+        validator.update(chunk)
+    report = validator.result()
+    """
+
+    __slots__ = (
+        '_duplicate_indices',
+        '_out_of_order_indices',
+        'last',
+        'max_backward_jump',
+        'n_duplicates',
+        'n_increases',
+        'n_out_of_order',
+        'n_t',
+        'return_indices',
+        'running_max',
+    )
+
+    n_t: int
+    last: float | None
+    running_max: float | None
+    n_out_of_order: int
+    n_duplicates: int
+    n_increases: int
+    max_backward_jump: float
+    return_indices: bool
+    _out_of_order_indices: list[np.ndarray]
+    _duplicate_indices: list[np.ndarray]
+
+    def __init__(self, return_indices: bool = True) -> None:
+        """create TimestampOrderValidator
+
+        ## Inputs
+        - return_indices: bool of whether to retain indices of out of order
+          and duplicate timestamps
+        """
+        self.return_indices = return_indices
+        self.n_t = 0
+        self.last = None
+        self.running_max = None
+        self.n_out_of_order = 0
+        self.n_duplicates = 0
+        self.n_increases = 0
+        self.max_backward_jump = 0.0
+        self._out_of_order_indices = []
+        self._duplicate_indices = []
+
+    def update(
+        self, timestamps: typing.Sequence[spec.Timestamp] | np.ndarray
+    ) -> TimestampOrderValidator:
+        """add next chunk of timestamps to validation
+
+        ## Inputs
+        - timestamps: iterable or numpy array of Timestamp
+
+        ## Returns
+        - this validator, for chaining
+        """
+        import numpy as np
+
+        chunk = timestamp_convert.timestamps_to_seconds_array(timestamps)
+        if len(chunk) == 0:
+            return self
+
+        # compare each timestamp to previous timestamp and to running max
+        if self.last is None or self.running_max is None:
+            previous = chunk[:-1]
+            running_max = np.maximum.accumulate(chunk)[:-1]
+            current = chunk[1:]
+            offset = self.n_t + 1
+        else:
+            previous = np.concatenate([[self.last], chunk[:-1]])
+            running_max = np.maximum.accumulate(
+                np.concatenate([[self.running_max], chunk])
+            )[:-1]
+            current = chunk
+            offset = self.n_t
+
+        backward_jumps = running_max - current
+        out_of_order = backward_jumps > 0
+        n_out_of_order = int(np.count_nonzero(out_of_order))
+        if n_out_of_order > 0:
+            max_backward_jump = float(backward_jumps.max())
+            self.max_backward_jump = max(
+                self.max_backward_jump, max_backward_jump
+            )
+        duplicate = current == previous
+        self.n_out_of_order += n_out_of_order
+        self.n_duplicates += int(np.count_nonzero(duplicate))
+        self.n_increases += int(np.count_nonzero(current > previous))
+        if self.return_indices:
+            if n_out_of_order > 0:
+                self._out_of_order_indices.append(
+                    np.flatnonzero(out_of_order) + offset
+                )
+            if duplicate.any():
+                self._duplicate_indices.append(
+                    np.flatnonzero(duplicate) + offset
+                )
+
+        self.n_t += len(chunk)
+        self.last = float(chunk[-1])
+        chunk_max = float(chunk.max())
+        if self.running_max is None or chunk_max > self.running_max:
+            self.running_max = chunk_max
+        return self
+
+    def result(self) -> TimestampOrderReport:
+        """create report of ordering of timestamps added so far"""
+        out_of_order_indices: np.ndarray | None
+        duplicate_indices: np.ndarray | None
+        if self.return_indices:
+            out_of_order_indices = _concatenate_indices(
+                self._out_of_order_indices
+            )
+            duplicate_indices = _concatenate_indices(self._duplicate_indices)
+        else:
+            out_of_order_indices = None
+            duplicate_indices = None
+        is_sorted = self.n_out_of_order == 0
+        return {
+            'n_t': self.n_t,
+            'is_sorted': is_sorted,
+            'is_strictly_increasing': is_sorted and self.n_duplicates == 0,
+            'is_reverse_sorted': self.n_increases == 0,
+            'n_out_of_order': self.n_out_of_order,
+            'out_of_order_indices': out_of_order_indices,
+            'max_backward_jump': self.max_backward_jump,
+            'n_duplicates': self.n_duplicates,
+            'duplicate_indices': duplicate_indices,
+        }
+
+
+def _concatenate_indices(indices: list[np.ndarray]) -> np.ndarray:
+    import numpy as np
+
+    if len(indices) == 0:
+        return np.zeros(0, dtype=np.int64)
+    else:
+        return np.concatenate(indices)